@@ -0,0 +1,90 @@
+"""
+Check how FrameChangeDetector treats duplicate, static and moving frames.
+
+A synthetic 720p clip is built from three segments: a camera that repeats
+every frame twice (as some USB cameras do in low light), a static scene with
+sensor noise, and a hand-sized blob moving across the frame. The detector's
+decisions are reported per segment together with its cost per frame. The
+script exits with status 1 if a moving frame is skipped or if more than
+``max_skip`` frames in a row are skipped.
+
+Usage:
+    python benchmarks/change_detection.py [--threshold 8.0] [--max-skip 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.change import FrameChangeDetector
+
+SIZE = (1280, 720)
+
+
+def make_segments(frames=60, seed=0):
+    rng = np.random.default_rng(seed)
+    background = np.full((SIZE[1], SIZE[0], 3), 90, np.uint8)
+    cv2.rectangle(background, (200, 150), (500, 600), (40, 120, 200), -1)
+
+    duplicated = []
+    for i in range(frames // 2):
+        frame = background.copy()
+        cv2.circle(frame, (300 + i * 20, 360), 80, (180, 200, 220), -1)
+        duplicated.extend([frame, frame])
+
+    static = []
+    for _ in range(frames):
+        noise = rng.integers(-3, 4, background.shape, dtype=np.int16)
+        static.append(np.clip(background + noise, 0, 255).astype(np.uint8))
+
+    moving = []
+    for i in range(frames):
+        frame = background.copy()
+        cv2.circle(frame, (200 + i * 15, 360), 80, (180, 200, 220), -1)
+        moving.append(frame)
+
+    return [('duplicated', duplicated), ('static', static), ('moving', moving)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threshold', type=float, default=8.0)
+    parser.add_argument('--max-skip', type=int, default=5)
+    args = parser.parse_args()
+
+    detector = FrameChangeDetector(args.threshold, args.max_skip)
+    failed = False
+    for name, frames in make_segments():
+        skipped_before = detector.frames_skipped
+        longest_run = run = 0
+        moving_skipped = 0
+        start = time.perf_counter()
+        for frame in frames:
+            if detector.should_infer(frame):
+                run = 0
+            else:
+                run += 1
+                longest_run = max(longest_run, run)
+                if name == 'moving':
+                    moving_skipped += 1
+        elapsed = time.perf_counter() - start
+        skipped = detector.frames_skipped - skipped_before
+        print(f"{name:<11} skipped {skipped:3d}/{len(frames)}  longest run {longest_run}  "
+              f"{elapsed / len(frames) * 1000:.2f} ms/frame")
+        if longest_run > args.max_skip or moving_skipped:
+            failed = True
+
+    print(f"Total: {detector.frames_skipped} skipped, {detector.frames_inferred} inferred "
+          f"({detector.skip_ratio:.0%} of inference avoided)")
+    if failed:
+        print("FAILED: moving frames were skipped or the skip limit was exceeded")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
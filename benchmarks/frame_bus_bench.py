@@ -0,0 +1,157 @@
+"""
+Measure the per-frame cost of handing frames to another process.
+
+A producer process publishes 1280x720 BGR frames and a consumer process
+reads the newest one, once through a ``SharedFrameRing`` and once through a
+``multiprocessing.Queue`` (which pickles and copies every frame). Publish
+and consume times (excluding time spent waiting for the next frame) are
+reported per frame in microseconds, together with the number of frames the
+consumer saw and how many it skipped.
+
+Usage:
+    python benchmarks/frame_bus_bench.py [--frames 600] [--width 1280] [--height 720]
+"""
+import argparse
+import multiprocessing
+import os
+import queue
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.frame_bus import SharedFrameRing
+
+RING_NAME = f'frame_bus_bench_{os.getpid()}'
+
+
+def make_frames(shape, count=8):
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, shape, dtype=np.uint8) for _ in range(count)]
+
+
+def ring_producer(name, shape, frames, ready, done, results):
+    ring = SharedFrameRing(name, shape, create=True)
+    ready.set()
+    sources = make_frames(shape)
+    elapsed = 0.0
+    for i in range(frames):
+        start = time.perf_counter()
+        ring.publish(sources[i % len(sources)])
+        elapsed += time.perf_counter() - start
+        time.sleep(0.001)
+    results.put(('publish', elapsed / frames))
+    done.wait()
+    ring.close()
+
+
+def ring_consumer(name, frames, ready, done, results):
+    ready.wait()
+    ring = SharedFrameRing(name)
+    sequence = -1
+    seen = 0
+    elapsed = 0.0
+    checksum = 0
+    deadline = time.monotonic() + 10.0
+    while sequence < frames - 1 and time.monotonic() < deadline:
+        # Only successful reads are timed; waiting for the producer is not overhead
+        start = time.perf_counter()
+        latest, view = ring.read_latest(sequence)
+        if latest is None:
+            continue
+        # Touch the frame so the view is actually read
+        checksum += int(view[0, 0, 0])
+        elapsed += time.perf_counter() - start
+        sequence = latest
+        seen += 1
+    results.put(('consume', elapsed / max(seen, 1), seen))
+    ring.close()
+    done.set()
+
+
+def queue_producer(frame_queue, shape, frames, results):
+    sources = make_frames(shape)
+    elapsed = 0.0
+    for i in range(frames):
+        start = time.perf_counter()
+        frame_queue.put(sources[i % len(sources)])
+        elapsed += time.perf_counter() - start
+        time.sleep(0.001)
+    frame_queue.put(None)
+    results.put(('publish', elapsed / frames))
+
+
+def queue_consumer(frame_queue, results):
+    seen = 0
+    elapsed = 0.0
+    checksum = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            frame = frame_queue.get_nowait()
+        except queue.Empty:
+            continue
+        if frame is None:
+            break
+        checksum += int(frame[0, 0, 0])
+        elapsed += time.perf_counter() - start
+        seen += 1
+    results.put(('consume', elapsed / max(seen, 1), seen))
+
+
+def collect(results, count):
+    stats = {}
+    for _ in range(count):
+        item = results.get(timeout=60)
+        stats[item[0]] = item[1:]
+    return stats
+
+
+def run_ring(context, shape, frames):
+    ready, done, results = context.Event(), context.Event(), context.Queue()
+    producer = context.Process(target=ring_producer, args=(RING_NAME, shape, frames, ready, done, results))
+    consumer = context.Process(target=ring_consumer, args=(RING_NAME, frames, ready, done, results))
+    producer.start()
+    consumer.start()
+    stats = collect(results, 2)
+    producer.join()
+    consumer.join()
+    return stats
+
+
+def run_queue(context, shape, frames):
+    frame_queue, results = context.Queue(maxsize=4), context.Queue()
+    producer = context.Process(target=queue_producer, args=(frame_queue, shape, frames, results))
+    consumer = context.Process(target=queue_consumer, args=(frame_queue, results))
+    producer.start()
+    consumer.start()
+    stats = collect(results, 2)
+    producer.join()
+    consumer.join()
+    return stats
+
+
+def report(label, stats, frames):
+    publish = stats['publish'][0] * 1e6
+    consume, seen = stats['consume']
+    print(f"{label:<22} publish {publish:8.1f} us/frame  consume {consume * 1e6:8.1f} us/frame  "
+          f"received {seen}/{frames} (skipped {frames - seen})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    args = parser.parse_args()
+
+    shape = (args.height, args.width, 3)
+    context = multiprocessing.get_context('spawn')
+    print(f"{args.frames} frames of {args.width}x{args.height}, {np.prod(shape) / 1e6:.1f} MB each")
+    report("SharedFrameRing", run_ring(context, shape, args.frames), args.frames)
+    report("multiprocessing.Queue", run_queue(context, shape, args.frames), args.frames)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+Check classify_batch() against the per-frame classifiers and measure its throughput.
+
+Random hand poses (or the poses in an ``.npy`` file of ``(N, 21, 3)``
+landmarks) are classified with the zone/angle rules and with the strict
+and relaxed finger rules three ways: by ``classify_batch``, by the
+per-frame ``zone_command``/``finger_command`` on each pose's features,
+and by a transcription of the original per-landmark Python code. Any
+disagreement is printed and makes the script exit with status 1. Then it
+times ``classify_batch`` on all poses (single thread, CPU time) against
+the target of a million poses per second.
+
+Usage:
+    python benchmarks/gesture_classification.py [poses.npy] [--poses 1000000] [--check 100000]
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.features import (DEFAULT_ZONES, RULES_FINGERS, RULES_ZONES, classify_batch, extract_features,
+                           finger_command, zone_command, zone_rects)
+from core.landmarks import Landmark
+
+WIDTH, HEIGHT = 1280, 720
+TARGET_POSES_PER_SECOND = 1e6
+
+
+def random_poses(count, seed=0):
+    """Poses covering every rule: landmark 13 near 9 so zones are hit, and thumb near index for pinches."""
+    rng = np.random.default_rng(seed)
+    poses = rng.uniform(-0.05, 1.05, (count, 21, 3)).astype(np.float32)
+    poses[:, 13, :2] = poses[:, 9, :2] + rng.normal(0, 0.03, (count, 2))
+    pinching = rng.random(count) < 0.3
+    poses[pinching, 4, :2] = poses[pinching, 8, :2] + rng.normal(0, 0.08, (pinching.sum(), 2))
+    return poses
+
+
+def reference_zone_command(landmarks, forward_rect, backward_rect, turn_threshold):
+    """The GUI's original per-landmark zone and angle code."""
+    wrist = landmarks[0]
+    middle_mcp = landmarks[9]
+    angle = math.atan2(wrist.y - middle_mcp.y, wrist.x - middle_mcp.x)
+    angle = math.degrees(angle) - 90
+    if angle <= -180:
+        angle += 360
+    elif angle > 180:
+        angle -= 360
+
+    index_mcp_x = int(landmarks[9].x * WIDTH)
+    index_mcp_y = int(landmarks[9].y * HEIGHT)
+    middle_pip_x = int(landmarks[13].x * WIDTH)
+    middle_pip_y = int(landmarks[13].y * HEIGHT)
+    for command, rect in (("FORWARD", forward_rect), ("BACKWARD", backward_rect)):
+        if (rect[0] < index_mcp_x < rect[0] + rect[2] and rect[1] < index_mcp_y < rect[1] + rect[3] and
+                rect[0] < middle_pip_x < rect[0] + rect[2] and rect[1] < middle_pip_y < rect[1] + rect[3]):
+            return command
+    if angle > turn_threshold:
+        return "RIGHT"
+    if angle < -turn_threshold:
+        return "LEFT"
+    return "STOP"
+
+
+def reference_finger_command(landmarks, relaxed, default):
+    """The original ``recognize_gesture`` of udp.py (strict) and the finger gesture example (relaxed)."""
+    wrist = landmarks[0]
+    index_tip = landmarks[8]
+    middle_tip = landmarks[12]
+    ring_tip = landmarks[16]
+    pinky_tip = landmarks[20]
+    thumb_tip = landmarks[4]
+
+    distance = ((landmarks[8].x - landmarks[4].x) ** 2 + (landmarks[8].y - landmarks[4].y) ** 2) ** 0.5
+    if distance < 0.1:
+        return "BACKWARD"
+    if index_tip.y < middle_tip.y and index_tip.y < ring_tip.y and index_tip.y < pinky_tip.y:
+        if index_tip.x < wrist.x:
+            return "RIGHT"
+        else:
+            return "LEFT"
+    margin = abs(pinky_tip.x - thumb_tip.x) if relaxed else 0
+    if all(finger.y < wrist.y + margin for finger in [index_tip, middle_tip, ring_tip, pinky_tip]):
+        return "FORWARD"
+    return default
+
+
+def check(poses):
+    """Return the number of poses where the batch, per-frame and reference commands disagree."""
+    rects = zone_rects(DEFAULT_ZONES, WIDTH, HEIGHT)
+    threshold = DEFAULT_ZONES['turn_angle_threshold']
+    rule_sets = [
+        ("zones", dict(rules=RULES_ZONES),
+         lambda features, hand: zone_command(features, hand, ("FORWARD", "BACKWARD"), threshold),
+         lambda landmarks: reference_zone_command(landmarks, rects[0], rects[1], threshold)),
+        ("fingers", dict(rules=RULES_FINGERS),
+         lambda features, hand: finger_command(features, hand),
+         lambda landmarks: reference_finger_command(landmarks, False, "STOP")),
+        ("fingers relaxed", dict(rules=RULES_FINGERS, relaxed=True, default="UNKNOWN"),
+         lambda features, hand: finger_command(features, hand, relaxed=True, default="UNKNOWN"),
+         lambda landmarks: reference_finger_command(landmarks, True, "UNKNOWN")),
+    ]
+
+    # Per-frame paths see the landmarks as MediaPipe objects with float attributes
+    hands = [[Landmark(float(x), float(y), float(z)) for x, y, z in pose] for pose in poses]
+    features = extract_features(hands, rects, WIDTH, HEIGHT)
+    mismatches = 0
+    for name, params, per_frame, reference in rule_sets:
+        batch = classify_batch(poses, width=WIDTH, height=HEIGHT, **params)
+        counts = {}
+        for hand, landmarks in enumerate(hands):
+            expected = reference(landmarks)
+            counts[expected] = counts.get(expected, 0) + 1
+            got = (batch[hand], per_frame(features, hand))
+            if got != (expected, expected):
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"  {name} pose {hand}: reference {expected}, batch {got[0]}, per-frame {got[1]}")
+        print(f"{name:>16}: " + ", ".join(f"{command} {count}" for command, count in sorted(counts.items())))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('poses', nargs='?', help="An .npy file of (N, 21, 3) landmarks")
+    parser.add_argument('--poses', dest='count', type=int, default=1000000, help="Random poses when no file is given")
+    parser.add_argument('--check', type=int, default=100000, help="Poses compared with the per-frame code")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    poses = np.load(args.poses).astype(np.float32) if args.poses else random_poses(args.count)
+    print(f"Checking {min(args.check, len(poses))} poses against the per-frame classifiers...")
+    mismatches = check(poses[:args.check])
+    print(f"{mismatches} mismatches")
+
+    print(f"{'rules':>16} {'poses/s':>12} {'ns/pose':>8}")
+    for name, params in (("zones", dict(rules=RULES_ZONES)), ("fingers", dict(rules=RULES_FINGERS))):
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.process_time()
+            classify_batch(poses, width=WIDTH, height=HEIGHT, **params)
+            best = min(best, time.process_time() - start)
+        rate = len(poses) / best if best else float('inf')
+        verdict = "ok" if rate >= TARGET_POSES_PER_SECOND else "below target"
+        print(f"{name:>16} {rate:12,.0f} {1e9 / rate:8.1f}  {verdict}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
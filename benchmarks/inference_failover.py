@@ -0,0 +1,74 @@
+"""
+Measure how fast supervised inference fails over to its hot standby.
+
+A SupervisedBackend processes synthetic frames at the given frame rate.
+Partway through, the active worker is killed (a crash) and later frozen
+with SIGSTOP (a hang inside ``process()``). For each fault the script
+reports the failover time and how many frames got an empty result, which
+the controllers turn into STOP. A failover that takes longer than one
+frame interval plus the deadline is reported as a failure.
+
+Usage:
+    python benchmarks/inference_failover.py [--deadline-ms 150] [--fps 30] [--backend solutions]
+"""
+import argparse
+import os
+import signal
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.landmarks import BACKEND_SOLUTIONS, BACKENDS
+from core.supervisor import SupervisedBackend
+
+
+def run_frames(backend, frame, count, interval):
+    for _ in range(count):
+        start = time.monotonic()
+        backend.process(frame)
+        time.sleep(max(0.0, interval - (time.monotonic() - start)))
+
+
+def wait_for_standby(backend, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while not backend.standby.poll_ready(0.1) and time.monotonic() < deadline:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--deadline-ms', type=float, default=150.0)
+    parser.add_argument('--fps', type=float, default=30.0)
+    parser.add_argument('--backend', choices=list(BACKENDS), default=BACKEND_SOLUTIONS)
+    args = parser.parse_args()
+
+    interval = 1.0 / args.fps
+    frame = np.full((360, 640, 3), 128, np.uint8)
+    backend = SupervisedBackend(args.backend, deadline=args.deadline_ms / 1000.0)
+    wait_for_standby(backend)
+    run_frames(backend, frame, 30, interval)
+    print(f"Steady state: {backend.inference_ms:.1f} ms per frame")
+
+    failed = False
+    for fault, sig in (('crash', signal.SIGKILL), ('hang', signal.SIGSTOP)):
+        wait_for_standby(backend)
+        gaps_before = backend.gap_frames
+        os.kill(backend.active.process.pid, sig)
+        run_frames(backend, frame, 30, interval)
+        gaps = backend.gap_frames - gaps_before
+        print(f"{fault:<6} failover {backend.failover_ms:6.1f} ms  frames without a worker {gaps}")
+        if backend.failover_ms > (interval + backend.deadline) * 1000.0 or gaps:
+            failed = True
+
+    print(f"Supervisor: {backend.summary()}")
+    backend.close()
+    if failed:
+        print("FAILED: failover took longer than one frame interval past the deadline")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Compare the landmark backends on the same clip.
+
+Every backend processes the same frames through the same loop the
+controllers use (open_capture -> FramePreprocessor -> backend.process()).
+For each backend the script reports the loop frame rate, how long
+``process()`` blocks the loop per frame, the submit-to-result inference time,
+and how many frames produced a result and found a hand. The Tasks backend
+runs in LIVE_STREAM mode, so its blocking time is only the submit cost.
+
+Backends that cannot be created here (the legacy API missing from newer
+MediaPipe releases, or no hand_landmarker.task bundle) are listed as
+unavailable instead of failing the run.
+
+Usage:
+    python benchmarks/landmark_backends.py [clip] [--model-path PATH] [--frames 300]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.capture import PACING_FAST, open_capture
+from core.landmarks import BACKENDS, create_landmark_backend
+from core.preprocess import FramePreprocessor
+
+
+def write_clip(path, frames=150, size=(1280, 720)):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 30, size)
+    frame = np.zeros((size[1], size[0], 3), np.uint8)
+    for i in range(frames):
+        frame[:] = 60 + (i % 30)
+        cv2.circle(frame, (200 + i * 6, size[1] // 2), 90, (150, 180, 220), -1)
+        writer.write(frame)
+    writer.release()
+
+
+def run_backend(name, clip, frames, inference_width, params):
+    try:
+        backend = create_landmark_backend(name, **params)
+    except Exception as e:
+        print(f"{name:<10} unavailable: {e}")
+        return
+
+    cap = open_capture(clip, 1280, 720, PACING_FAST)
+    preprocessor = FramePreprocessor(display_buffers=1, inference_width=inference_width)
+    processed = hands_found = 0
+    blocking = 0.0
+    start = time.perf_counter()
+    while processed < frames and cap.isOpened():
+        ret, captured = cap.read()
+        if not ret:
+            break
+        frame, rgb_frame = preprocessor.process(captured)
+        cap.recycle(captured)
+
+        submitted = time.perf_counter()
+        result = backend.process(rgb_frame)
+        blocking += time.perf_counter() - submitted
+
+        if result is not None and result.multi_hand_landmarks:
+            hands_found += 1
+        processed += 1
+    elapsed = time.perf_counter() - start
+    if backend.asynchronous:
+        # Let the last submitted frames finish so the result counts are complete
+        time.sleep(0.2)
+    cap.release()
+    backend.close()
+
+    if not processed:
+        print(f"{name:<10} no frames read from {clip}")
+        return
+    print(f"{name:<10} {processed / elapsed:7.1f} FPS  blocks {blocking / processed * 1000:6.2f} ms/frame  "
+          f"inference {backend.inference_ms:6.1f} ms  results {backend.results_received}/{processed}  "
+          f"hands in {hands_found} frames")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('clip', nargs='?', help="Video file, image directory or recorded session")
+    parser.add_argument('--model-path', help="hand_landmarker.task bundle for the tasks backend")
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--inference-width', type=int, default=640)
+    parser.add_argument('--backend', action='append', choices=list(BACKENDS),
+                        help="Backend to run (repeatable, default: all)")
+    args = parser.parse_args()
+
+    params = {'min_detection_confidence': 0.7, 'min_tracking_confidence': 0.7}
+    if args.model_path:
+        params['model_path'] = args.model_path
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = args.clip
+        if clip is None:
+            clip = os.path.join(tmp, 'synthetic.avi')
+            write_clip(clip)
+            print("No clip given; using a synthetic clip without hands (measures cost only)")
+        for name in args.backend or list(BACKENDS):
+            run_backend(name, clip, args.frames, args.inference_width, params)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare inference on every frame with cadence-based landmark prediction.
+
+The same clip is run through GestureController twice: once with
+``max_cadence=1`` (inference on every frame) and once with the given
+cadence, where the frames between inferences get predicted landmarks. For
+each run the script reports how many frames reached the model, the CPU time
+used, and for the predicted run how often its command differs from the
+reference command on the same frame. Commands are sent to the UDP discard
+port on localhost.
+
+Usage:
+    python benchmarks/landmark_prediction.py CLIP [--max-cadence 3] [--backend solutions]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.capture import PACING_FAST
+from core.landmarks import BACKEND_SOLUTIONS, BACKENDS
+from gesture_control_simple import GestureController
+
+
+def run(clip, max_cadence, backend, frames):
+    controller = GestureController('127.0.0.1', 9, source=clip, pacing=PACING_FAST, show_window=False,
+                                   verbose=False, change_threshold=0, backend=backend,
+                                   max_cadence=max_cadence)
+    commands = []
+    start = time.process_time()
+    while len(commands) < frames and controller.cap.isOpened():
+        ret, frame = controller.cap.read()
+        if not ret:
+            break
+        _, command = controller.process_frame(frame, controller.cap.frame_info.timestamp)
+        controller.cap.recycle(frame)
+        commands.append(command)
+    cpu = time.process_time() - start
+    inferred = controller.backend.frames_submitted
+    predicted = controller.predictor.frames_predicted
+    controller.cap.release()
+    controller.backend.close()
+    controller.backend = None
+    return commands, inferred, predicted, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('clip', help="Video file, image directory or recorded session")
+    parser.add_argument('--max-cadence', type=int, default=3)
+    parser.add_argument('--backend', choices=list(BACKENDS), default=BACKEND_SOLUTIONS)
+    parser.add_argument('--frames', type=int, default=1000)
+    args = parser.parse_args()
+
+    reference, inferred, _, cpu = run(args.clip, 1, args.backend, args.frames)
+    if not reference:
+        print(f"No frames read from {args.clip}")
+        sys.exit(1)
+    print(f"every frame   inferred {inferred:5d}/{len(reference)}  CPU {cpu:6.2f} s")
+
+    commands, inferred, predicted, cpu_predicted = run(args.clip, args.max_cadence, args.backend, args.frames)
+    count = min(len(reference), len(commands))
+    differing = sum(1 for a, b in zip(reference, commands) if a != b)
+    print(f"cadence <= {args.max_cadence}  inferred {inferred:5d}/{len(commands)}  CPU {cpu_predicted:6.2f} s  "
+          f"predicted {predicted}  ({cpu / max(cpu_predicted, 1e-9):.1f}x less CPU)")
+    print(f"Commands differ on {differing}/{count} frames ({differing / count:.1%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Serve a clip as an MJPEG stream on localhost and read it back with MJPEGStreamReader.
+
+The stand-in server behaves like the phone IP-camera app used by udpgit.py:
+it serves ``multipart/x-mixed-replace`` JPEG parts at the clip's frame rate.
+Each part carries an ``X-Timestamp`` header so the reader's glass-to-frame
+latency can be measured. The consumer deliberately runs slower than the
+stream to show that latency stays bounded instead of growing.
+
+Usage:
+    python benchmarks/mjpeg_loopback.py [clip] [--scale 2] [--consumer-fps 15]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.capture import PACING_REALTIME, open_capture
+from core.mjpeg import MJPEGStreamReader
+
+BOUNDARY = 'frameboundary'
+
+
+def write_clip(path, frames=150, size=(1280, 720)):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 30, size)
+    frame = np.zeros((size[1], size[0], 3), np.uint8)
+    for i in range(frames):
+        frame[:] = (i * 2) % 256
+        cv2.circle(frame, (100 + i * 7, size[1] // 2), 60, (0, 255, 0), -1)
+        writer.write(frame)
+    writer.release()
+
+
+def make_handler(clip, finished):
+    class MJPEGHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', f'multipart/x-mixed-replace; boundary={BOUNDARY}')
+            self.end_headers()
+
+            cap = open_capture(clip, 0, 0, PACING_REALTIME)
+            try:
+                while cap.isOpened():
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    ok, jpeg = cv2.imencode('.jpg', frame)
+                    cap.recycle(frame)
+                    if not ok:
+                        continue
+                    self.wfile.write(f'--{BOUNDARY}\r\n'.encode())
+                    self.wfile.write(b'Content-Type: image/jpeg\r\n')
+                    self.wfile.write(f'Content-Length: {len(jpeg)}\r\n'.encode())
+                    self.wfile.write(f'X-Timestamp: {time.monotonic()}\r\n\r\n'.encode())
+                    self.wfile.write(jpeg.tobytes())
+                    self.wfile.write(b'\r\n')
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                cap.release()
+                finished.set()
+
+        def log_message(self, format, *args):
+            pass
+
+    return MJPEGHandler
+
+
+def run(clip, scale, consumer_fps):
+    finished = threading.Event()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(clip, finished))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/video'
+
+    reader = MJPEGStreamReader(url, scale=scale).start()
+    latencies = []
+    shape = None
+    while not finished.is_set():
+        ret, frame = reader.read(timeout=1.0)
+        if not ret:
+            continue
+        shape = frame.shape
+        if reader.timestamp is not None:
+            latencies.append((time.monotonic() - reader.timestamp) * 1000)
+        # Simulate a display loop that is slower than the camera
+        time.sleep(1.0 / consumer_fps)
+
+    reader.release()
+    server.shutdown()
+
+    print(f"Stream URL: {url}")
+    print(f"Decode scale: 1/{scale}, frame shape: {shape}")
+    print(f"Parts received: {reader.frames_captured}, decoded: {reader.frames_decoded}, "
+          f"dropped undecoded: {reader.frames_dropped}")
+    if latencies:
+        latencies.sort()
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"Latency ms: mean {sum(latencies) / len(latencies):.1f}, p95 {p95:.1f}, max {latencies[-1]:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('clip', nargs='?', help="Video file, image directory or recorded session to serve")
+    parser.add_argument('--scale', type=int, default=1, choices=[1, 2, 4, 8], help="Reduced decode scale")
+    parser.add_argument('--consumer-fps', type=float, default=15.0, help="Rate at which frames are consumed")
+    args = parser.parse_args()
+
+    if args.clip:
+        run(args.clip, args.scale, args.consumer_fps)
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = os.path.join(tmp, 'clip.avi')
+        write_clip(clip)
+        run(clip, args.scale, args.consumer_fps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Measure how multi-camera throughput scales with the number of worker processes.
+
+For 1 to N workers, every worker is a spawned process running a
+``GestureController`` on its own replay of the clip, set up the way
+``MultiCameraController`` sets it up (``cv2.setNumThreads(1)``, no window,
+fast pacing). Workers build their model and warm up first, then start
+together and each process the same number of frames. The script prints the
+aggregate FPS per worker count, the speedup over one worker and the scaling
+efficiency (speedup / workers); near-linear scaling keeps the efficiency
+close to 100 % up to the number of physical cores. Commands are sent to the
+UDP discard port on localhost.
+
+Usage:
+    python benchmarks/multi_camera_scaling.py [clip] [--workers 4] [--frames 200] [--backend solutions]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC)
+from core.capture import PACING_FAST
+from core.landmarks import BACKEND_SOLUTIONS, BACKENDS
+
+# Frames each worker processes before the timed run
+WARMUP_FRAMES = 10
+
+
+def write_clip(path, frames=200, size=(1280, 720)):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 30, size)
+    frame = np.zeros((size[1], size[0], 3), np.uint8)
+    for i in range(frames):
+        frame[:] = 60 + (i % 30)
+        cv2.circle(frame, (200 + i * 4, size[1] // 2), 90, (150, 180, 220), -1)
+        writer.write(frame)
+    writer.release()
+
+
+def _worker(clip, frames, backend, barrier, results):
+    """Worker process: warm up, wait for the others, then time ``frames`` frames."""
+    sys.path.insert(0, SRC)
+    from gesture_control_simple import GestureController
+
+    cv2.setNumThreads(1)
+    # No change detection or prediction: every frame goes through inference
+    controller = GestureController('127.0.0.1', 9, source=clip, pacing=PACING_FAST, show_window=False,
+                                   verbose=False, change_threshold=0, max_cadence=1, backend=backend,
+                                   landmark_cache_mb=0)
+
+    def step():
+        ret, frame = controller.cap.read()
+        if not ret:
+            return False
+        controller.process_frame(frame)
+        controller.cap.recycle(frame)
+        return True
+
+    for _ in range(WARMUP_FRAMES):
+        step()
+    barrier.wait()
+    start = time.monotonic()
+    processed = 0
+    while processed < frames and step():
+        processed += 1
+    results.put((processed, time.monotonic() - start))
+    controller.running = False
+    controller.cap.release()
+    controller.backend.close()
+
+
+def run(clip, workers, frames, backend, context):
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [context.Process(target=_worker, args=(clip, frames, backend, barrier, results), daemon=True)
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join(timeout=5.0)
+    total_frames = sum(processed for processed, _ in reports)
+    # Aggregate throughput over the time until the slowest worker finished
+    return total_frames / max(elapsed for _, elapsed in reports)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('clip', nargs='?', help="Video file, image directory or recorded session")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--frames', type=int, default=200, help="Timed frames per worker")
+    parser.add_argument('--backend', choices=list(BACKENDS), default=BACKEND_SOLUTIONS)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = args.clip
+        if clip is None:
+            clip = os.path.join(tmp, 'synthetic.avi')
+            write_clip(clip, args.frames + WARMUP_FRAMES)
+            print("No clip given; using a synthetic clip without hands (measures detection cost only)")
+
+        print(f"{'workers':>7} {'aggregate FPS':>14} {'speedup':>8} {'efficiency':>11}")
+        single = None
+        for workers in range(1, args.workers + 1):
+            fps = run(clip, workers, args.frames, args.backend, context)
+            single = single or fps
+            speedup = fps / single
+            print(f"{workers:>7} {fps:14.1f} {speedup:7.2f}x {speedup / workers:10.0%}")
+
+
+if __name__ == '__main__':
+    main()
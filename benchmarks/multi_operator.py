@@ -0,0 +1,93 @@
+"""
+Compare the per-robot cost of one shared inference pass with one controller per robot.
+
+For 1 to N operators, the clip is processed two ways: once the way
+``MultiOperatorController`` does it (one preprocessing and one landmark
+inference with ``max_num_hands`` = operators per frame), and once the way
+separate ``GestureController`` instances would (every robot preprocesses
+and infers the same frame with its own single-hand model). The script
+prints the CPU milliseconds per frame and per robot for both.
+
+Usage:
+    python benchmarks/multi_operator.py [clip] [--operators 3] [--frames 200] [--backend solutions]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.capture import PACING_FAST, open_capture
+from core.landmarks import BACKEND_SOLUTIONS, BACKENDS, create_landmark_backend
+from core.preprocess import FramePreprocessor
+
+
+def write_clip(path, frames=200, size=(1280, 720)):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 30, size)
+    frame = np.zeros((size[1], size[0], 3), np.uint8)
+    for i in range(frames):
+        frame[:] = 60 + (i % 30)
+        cv2.circle(frame, (200 + i * 4, size[1] // 2), 90, (150, 180, 220), -1)
+        writer.write(frame)
+    writer.release()
+
+
+def load_frames(clip, count):
+    cap = open_capture(clip, 1280, 720, PACING_FAST)
+    frames = []
+    while len(frames) < count and cap.isOpened():
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame.copy())
+        cap.recycle(frame)
+    cap.release()
+    return frames
+
+
+def run(frames, pipelines):
+    """CPU milliseconds per frame for ``pipelines`` (``(preprocessor, backend)`` pairs) on every frame."""
+    start = time.process_time()
+    for frame in frames:
+        for preprocessor, backend in pipelines:
+            _, rgb_frame = preprocessor.process(frame)
+            backend.process(rgb_frame)
+    return (time.process_time() - start) * 1000.0 / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('clip', nargs='?', help="Video file, image directory or recorded session")
+    parser.add_argument('--operators', type=int, default=3)
+    parser.add_argument('--frames', type=int, default=200)
+    parser.add_argument('--backend', choices=list(BACKENDS), default=BACKEND_SOLUTIONS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = args.clip
+        if clip is None:
+            clip = os.path.join(tmp, 'synthetic.avi')
+            write_clip(clip, args.frames)
+            print("No clip given; using a synthetic clip without hands (measures detection cost only)")
+        frames = load_frames(clip, args.frames)
+
+    print(f"{'operators':>9} {'shared ms/frame':>16} {'shared ms/robot':>16} {'separate ms/robot':>18}")
+    for operators in range(1, args.operators + 1):
+        shared = [(FramePreprocessor(display_buffers=1, inference_width=640),
+                   create_landmark_backend(args.backend, max_num_hands=operators))]
+        separate = [(FramePreprocessor(display_buffers=1, inference_width=640),
+                     create_landmark_backend(args.backend, max_num_hands=1)) for _ in range(operators)]
+        shared_ms = run(frames, shared)
+        separate_ms = run(frames, separate)
+        print(f"{operators:>9} {shared_ms:14.1f}ms {shared_ms / operators:14.1f}ms "
+              f"{separate_ms / operators:16.1f}ms")
+        for _, backend in shared + separate:
+            backend.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Run the inference server and several thin clients on one host over loopback.
+
+An InferenceServer is started on an ephemeral localhost port and every
+client streams a clip (or a synthetic clip) through a RemoteBackend at the
+clip's frame rate, each from its own thread, the way ``GestureController
+--offload`` does. Afterwards the script prints, per client, the frames
+sent, answered and dropped as stale, and the round-trip and server-side
+latency. The server logs each client's totals as it disconnects.
+
+Usage:
+    python benchmarks/offload_loopback.py [clip] [--clients 3] [--workers 2] [--seconds 10]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.capture import PACING_REALTIME, open_capture
+from core.offload import RemoteBackend
+from core.preprocess import FramePreprocessor
+from inference_server import InferenceServer
+
+
+def write_clip(path, frames=150, size=(1280, 720)):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 30, size)
+    frame = np.zeros((size[1], size[0], 3), np.uint8)
+    for i in range(frames):
+        frame[:] = 60 + (i % 30)
+        cv2.circle(frame, (200 + i * 6, size[1] // 2), 90, (150, 180, 220), -1)
+        writer.write(frame)
+    writer.release()
+
+
+def run_client(index, clip, address, seconds, results):
+    backend = RemoteBackend(address)
+    preprocessor = FramePreprocessor(display_buffers=1, inference_width=640)
+    answered = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        cap = open_capture(clip, 1280, 720, PACING_REALTIME)
+        while time.monotonic() < deadline and cap.isOpened():
+            ret, captured = cap.read()
+            if not ret:
+                break
+            _, rgb_frame = preprocessor.process(captured)
+            cap.recycle(captured)
+            if backend.process(rgb_frame) is not None:
+                answered += 1
+        cap.release()
+    results[index] = (backend.frames_submitted, answered, backend.frames_dropped,
+                      backend.round_trip_ms, backend.server_ms)
+    backend.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('clip', nargs='?', help="Video file, image directory or recorded session")
+    parser.add_argument('--clients', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    args = parser.parse_args()
+
+    server = InferenceServer('127.0.0.1', 0, args.workers)
+    server.start()
+    address = f"127.0.0.1:{server.address[1]}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = args.clip
+        if clip is None:
+            clip = os.path.join(tmp, 'synthetic.avi')
+            write_clip(clip)
+            print("No clip given; using a synthetic clip without hands (measures cost only)")
+
+        results = {}
+        threads = [threading.Thread(target=run_client, args=(index, clip, address, args.seconds, results))
+                   for index in range(args.clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    for index, (sent, answered, dropped, round_trip, server_ms) in sorted(results.items()):
+        print(f"client {index}: {sent} frames, {answered} answered, {dropped} not sent (stale), "
+              f"round trip {round_trip:.1f} ms, server {server_ms:.1f} ms")
+    server.stop()
+
+
+if __name__ == '__main__':
+    main()
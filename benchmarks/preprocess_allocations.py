@@ -0,0 +1,88 @@
+"""
+Check that steady-state frame preprocessing does not allocate frame-sized arrays.
+
+A synthetic 1280x720 clip is read through the same path CameraThread uses:
+LatestFrameGrabber -> FramePreprocessor (640 px inference width) -> recycle.
+After a warm-up period every iteration is traced with tracemalloc and the
+script exits with a non-zero status if any iteration allocated a buffer of a
+meaningful size.
+
+Usage:
+    python benchmarks/preprocess_allocations.py
+"""
+import os
+import sys
+import tempfile
+import tracemalloc
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from core.capture import LatestFrameGrabber
+from core.preprocess import FramePreprocessor
+
+WIDTH, HEIGHT = 1280, 720
+CLIP_FRAMES = 120
+WARMUP_FRAMES = 10
+MEASURED_FRAMES = 60
+INFERENCE_WIDTH = 640
+
+# Anything above this is a large allocation; a single 1280x720 BGR frame is ~2.7 MB
+ALLOCATION_LIMIT = 64 * 1024
+
+
+def write_clip(path):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 30, (WIDTH, HEIGHT))
+    frame = np.zeros((HEIGHT, WIDTH, 3), np.uint8)
+    for i in range(CLIP_FRAMES):
+        frame[:] = (i * 2) % 256
+        cv2.circle(frame, (100 + i * 8, HEIGHT // 2), 60, (0, 255, 0), -1)
+        writer.write(frame)
+    writer.release()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        clip = os.path.join(tmp, 'clip.avi')
+        write_clip(clip)
+
+        cap = LatestFrameGrabber(cv2.VideoCapture(clip)).start()
+        preprocessor = FramePreprocessor(inference_width=INFERENCE_WIDTH)
+
+        tracemalloc.start()
+        worst = 0
+        measured = 0
+        for i in range(WARMUP_FRAMES + MEASURED_FRAMES):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+            ret, captured = cap.read()
+            if not ret:
+                break
+            frame, rgb_frame = preprocessor.process(captured)
+            cap.recycle(captured)
+
+            if i >= WARMUP_FRAMES:
+                worst = max(worst, tracemalloc.get_traced_memory()[1] - baseline)
+                measured += 1
+        tracemalloc.stop()
+        cap.release()
+
+    print(f"Frames measured: {measured}")
+    print(f"Capture buffers allocated: {cap.pool.allocations}")
+    print(f"Preprocessor buffers allocated: {preprocessor.allocations}")
+    print(f"Largest per-frame allocation: {worst / 1024:.1f} KB")
+
+    if measured == 0:
+        print("FAIL: no frames were read")
+        return 1
+    if worst > ALLOCATION_LIMIT:
+        print("FAIL: steady-state preprocessing allocated a frame-sized buffer")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
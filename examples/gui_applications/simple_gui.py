@@ -1,7 +1,7 @@
+import os
 import sys
 import cv2
 import socket
-import mediapipe as mp
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QVBoxLayout, QHBoxLayout,
     QPushButton, QLineEdit, QSlider, QTextEdit, QMainWindow, QSizePolicy
@@ -9,8 +9,17 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtGui import QImage, QPixmap
 from PyQt5.QtCore import Qt, QTimer
 
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
+# Make the shared modules in src/ importable when running this example directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+from core.capture import open_capture
+from core.landmarks import BACKEND_SOLUTIONS, create_landmark_backend, draw_landmarks
+
+# Capture source: camera index, video file, image directory or recorded session
+CAPTURE_SOURCE = sys.argv[1] if len(sys.argv) > 1 else 0
+
+# Landmark backend: BACKEND_SOLUTIONS (legacy Hands) or BACKEND_TASKS
+# (Tasks HandLandmarker, needs models/hand_landmarker.task)
+LANDMARK_BACKEND = BACKEND_SOLUTIONS
 
 class SimpleGestureWindow(QMainWindow):
     """
@@ -28,7 +37,9 @@ class SimpleGestureWindow(QMainWindow):
         self.capture = None
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_frame)
-        self.hands = mp_hands.Hands(max_num_hands=1)
+        self.hands = create_landmark_backend(LANDMARK_BACKEND, min_detection_confidence=0.5,
+                                             min_tracking_confidence=0.5, max_num_hands=1)
+        self.result = None
         self.last_command = ""
         
         self.init_ui()
@@ -174,11 +185,8 @@ class SimpleGestureWindow(QMainWindow):
         self.start_button.setEnabled(False)
         self.append_log("Initializing camera...")
         
-        self.capture = cv2.VideoCapture(0)
+        self.capture = open_capture(CAPTURE_SOURCE, 640, 480)
         if self.capture.isOpened():
-            self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            
             self.timer.start(50)  # 20 FPS
             self.stop_button.setEnabled(True)
             self.append_log("Camera started successfully")
@@ -261,14 +269,16 @@ class SimpleGestureWindow(QMainWindow):
 
         # Process hand detection
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        result = self.hands.process(rgb_frame)
+        # Asynchronous backends return None until a newer result is ready
+        self.result = self.hands.process(rgb_frame) or self.result
+        result = self.result
         
         command = "STOP"
         
-        if result.multi_hand_landmarks:
+        if result is not None and result.multi_hand_landmarks:
             for hand_landmarks in result.multi_hand_landmarks:
                 # Draw hand landmarks
-                mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+                draw_landmarks(frame, hand_landmarks)
                 
                 # Get hand position
                 landmarks = hand_landmarks.landmark
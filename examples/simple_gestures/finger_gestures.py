@@ -1,59 +1,35 @@
+import os
+import sys
 import cv2
-import mediapipe as mp
-import numpy as np
 
-# Initialize MediaPipe Hands
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
+# Make the shared modules in src/ importable when running this example directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+from core.capture import open_capture
+from core.features import extract_features, finger_command
+from core.landmarks import BACKEND_SOLUTIONS, create_landmark_backend, draw_landmarks
+
+# Landmark backend: BACKEND_SOLUTIONS (legacy Hands) or BACKEND_TASKS
+# (Tasks HandLandmarker, needs models/hand_landmarker.task)
+LANDMARK_BACKEND = BACKEND_SOLUTIONS
 
 # Define the hand tracking module
-hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
+hands = create_landmark_backend(LANDMARK_BACKEND, min_detection_confidence=0.7, min_tracking_confidence=0.7)
 
-def recognize_gesture(landmarks):
+def recognize_gesture(features, hand):
     """
     Recognize hand gestures based on finger positions.
     
     This is a finger-based gesture recognition system that analyzes
-    the relative positions of fingertips to determine commands.
+    the relative positions of fingertips to determine commands:
+    a pinch (index + thumb) is BACKWARD, pointing with the index finger
+    is LEFT/RIGHT (mirrored), all fingers up is FORWARD, anything else STOP.
+    ``features`` comes from ``extract_features`` for all detected hands.
     """
-    # Extract key points
-    wrist = landmarks[0]
-    index_tip = landmarks[8]
-    middle_tip = landmarks[12]
-    ring_tip = landmarks[16]
-    pinky_tip = landmarks[20]
-    thumb_tip = landmarks[4]
-
-    # Function to calculate Euclidean distance
-    def distance(point1, point2):
-        return np.sqrt((point1.x - point2.x) ** 2 + (point1.y - point2.y) ** 2)
-
-    # Calculate distance between index finger and thumb (pinch gesture)
-    pinch_distance = ((landmarks[8].x - landmarks[4].x)**2 + 
-                     (landmarks[8].y - landmarks[4].y)**2)**0.5
-
-    # Gesture recognition logic
-    if pinch_distance < 0.1:
-        return "BACKWARD"  # Pinch gesture = backward
-    
-    # Pointing gesture (only index finger up)
-    if index_tip.y < middle_tip.y and index_tip.y < ring_tip.y and index_tip.y < pinky_tip.y:
-        if index_tip.x < wrist.x:
-            return "RIGHT"  # Point left (mirrored)
-        else:
-            return "LEFT"   # Point right (mirrored)
-
-    # All fingers up = forward
-    if all(finger.y < wrist.y + abs(pinky_tip.x - thumb_tip.x) 
-           for finger in [index_tip, middle_tip, ring_tip, pinky_tip]):
-        return "FORWARD"
+    return finger_command(features, hand, relaxed=True)
 
-    return "STOP"  # Default state
-
-# Start video capture
-cap = cv2.VideoCapture(0)
-cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+# Start video capture (optionally from a video file, image directory or recorded session)
+CAPTURE_SOURCE = sys.argv[1] if len(sys.argv) > 1 else 0
+cap = open_capture(CAPTURE_SOURCE, 640, 480)
 
 print("Finger Gesture Recognition Demo")
 print("Gestures:")
@@ -63,6 +39,8 @@ print("- All fingers up: FORWARD")
 print("- Default: STOP")
 print("Press 'q' to quit")
 
+result = None
+
 while cap.isOpened():
     ret, frame = cap.read()
     if not ret:
@@ -73,16 +51,17 @@ while cap.isOpened():
     
     # Convert frame to RGB
     rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    result = hands.process(rgb_frame)
+    # Asynchronous backends return None until a newer result is ready
+    result = hands.process(rgb_frame) or result
 
     # Process detected hands
-    if result.multi_hand_landmarks:
-        for hand_landmarks in result.multi_hand_landmarks:
-            mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+    if result is not None and result.multi_hand_landmarks:
+        # Convert all hands' landmarks to one array and compute their features
+        features = extract_features(result.multi_hand_landmarks)
+        for index, hand_landmarks in enumerate(result.multi_hand_landmarks):
+            draw_landmarks(frame, hand_landmarks)
 
-            # Convert landmarks to list
-            landmarks = hand_landmarks.landmark
-            command = recognize_gesture(landmarks)
+            command = recognize_gesture(features, index)
 
             # Display command with colored background
             text_size = cv2.getTextSize(f"Command: {command}", cv2.FONT_HERSHEY_SIMPLEX, 1, 2)[0]
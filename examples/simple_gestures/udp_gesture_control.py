@@ -1,7 +1,14 @@
+import os
+import sys
 import cv2
-import mediapipe as mp
 import socket
 
+# Make the shared modules in src/ importable when running this example directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+from core.capture import open_capture
+from core.features import extract_features, finger_command
+from core.landmarks import BACKEND_SOLUTIONS, create_landmark_backend, draw_landmarks
+
 # WiFi Configuration
 ESP32_IP = "192.168.137.154"  # Replace with the actual IP address of your ESP32
 ESP32_PORT = 4210  # Port for UDP communication
@@ -9,42 +16,22 @@ ESP32_PORT = 4210  # Port for UDP communication
 # Initialize UDP socket
 udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
-# Initialize MediaPipe Hands
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
+# Landmark backend: BACKEND_SOLUTIONS (legacy Hands) or BACKEND_TASKS
+# (Tasks HandLandmarker, needs models/hand_landmarker.task)
+LANDMARK_BACKEND = BACKEND_SOLUTIONS
+
+# Initialize the hand landmark backend
+hands = create_landmark_backend(LANDMARK_BACKEND, min_detection_confidence=0.7, min_tracking_confidence=0.7)
 
-def recognize_gesture(landmarks):
+def recognize_gesture(features, hand):
     """
     Enhanced gesture recognition with UDP communication.
     
     This example combines finger gesture recognition with
     network communication to control a remote robot.
+    ``features`` comes from ``extract_features`` for all detected hands.
     """
-    wrist = landmarks[0]
-    index_tip = landmarks[8]
-    middle_tip = landmarks[12]
-    ring_tip = landmarks[16]
-    pinky_tip = landmarks[20]
-    thumb_tip = landmarks[4]
-
-    # Calculate distance between index and thumb
-    distance = ((landmarks[8].x - landmarks[4].x) ** 2 + 
-               (landmarks[8].y - landmarks[4].y) ** 2) ** 0.5
-
-    if distance < 0.1:
-        return "BACKWARD"
-
-    if index_tip.y < middle_tip.y and index_tip.y < ring_tip.y and index_tip.y < pinky_tip.y:
-        if index_tip.x < wrist.x:
-            return "RIGHT"
-        else:
-            return "LEFT"
-
-    if all(finger.y < wrist.y for finger in [index_tip, middle_tip, ring_tip, pinky_tip]):
-        return "FORWARD"
-
-    return "STOP"
+    return finger_command(features, hand)
 
 def send_command_to_esp32(command):
     """Send UDP command to ESP32 with error handling."""
@@ -59,10 +46,9 @@ def send_command_to_esp32(command):
         print(f"Failed to send command: {e}")
         return False
 
-# Initialize camera
-cap = cv2.VideoCapture(0)
-cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+# Initialize camera (optionally from a video file, image directory or recorded session)
+CAPTURE_SOURCE = sys.argv[1] if len(sys.argv) > 1 else 0
+cap = open_capture(CAPTURE_SOURCE, 640, 480)
 
 print("Gesture Control with UDP Communication")
 print(f"Connecting to ESP32 at {ESP32_IP}:{ESP32_PORT}")
@@ -71,6 +57,7 @@ print("Press 'q' to quit")
 
 last_command = ""
 frame_count = 0
+result = None
 
 try:
     while cap.isOpened():
@@ -83,15 +70,18 @@ try:
         # Flip frame for mirror effect
         frame = cv2.flip(frame, 1)
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        result = hands.process(rgb_frame)
+        # Asynchronous backends return None until a newer result is ready
+        result = hands.process(rgb_frame) or result
 
         current_command = "STOP"
         
-        if result.multi_hand_landmarks:
-            for hand_landmarks in result.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+        if result is not None and result.multi_hand_landmarks:
+            # Convert all hands' landmarks to one array and compute their features
+            features = extract_features(result.multi_hand_landmarks)
+            for index, hand_landmarks in enumerate(result.multi_hand_landmarks):
+                draw_landmarks(frame, hand_landmarks)
                 landmarks = hand_landmarks.landmark
-                current_command = recognize_gesture(landmarks)
+                current_command = recognize_gesture(features, index)
                 
                 # Add visual indicators for landmarks
                 h, w, _ = frame.shape
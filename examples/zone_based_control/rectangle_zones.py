@@ -1,21 +1,28 @@
+import os
+import sys
 import cv2
-import mediapipe as mp
 import math
 import socket
 
+# Make the shared modules in src/ importable when running this example directly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+from core.capture import open_capture
+from core.landmarks import BACKEND_SOLUTIONS, create_landmark_backend, draw_landmarks
+
 # WiFi Configuration
 ESP32_IP = "192.168.137.205"  # Replace with your ESP32's IP
 ESP32_PORT = 4210  # Port used by your ESP32
 
-# Initialize MediaPipe Hands
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
+# Landmark backend: BACKEND_SOLUTIONS (legacy Hands) or BACKEND_TASKS
+# (Tasks HandLandmarker, needs models/hand_landmarker.task)
+LANDMARK_BACKEND = BACKEND_SOLUTIONS
+
+# Initialize the hand landmark backend
+hands = create_landmark_backend(LANDMARK_BACKEND, min_detection_confidence=0.7, min_tracking_confidence=0.7)
 
-# Initialize Camera
-cap = cv2.VideoCapture(0)
-cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+# Initialize Camera (optionally from a video file, image directory or recorded session)
+CAPTURE_SOURCE = sys.argv[1] if len(sys.argv) > 1 else 0
+cap = open_capture(CAPTURE_SOURCE, 1280, 720)
 
 # Calculate the screen center and box coordinates
 width = 1280
@@ -53,6 +60,7 @@ print("Press 'q' to quit")
 # Main loop
 last_command = ""
 frame_count = 0
+result = None
 
 try:
     while cap.isOpened():
@@ -66,14 +74,15 @@ try:
         frame = cv2.flip(frame, 1)
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
-        # Process the frame with MediaPipe
-        result = hands.process(rgb_frame)
+        # Process the frame with MediaPipe; asynchronous backends return
+        # None until a newer result is ready
+        result = hands.process(rgb_frame) or result
 
         command = "STOP"  # Default command
 
-        if result.multi_hand_landmarks:
+        if result is not None and result.multi_hand_landmarks:
             for hand_landmarks in result.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+                draw_landmarks(frame, hand_landmarks)
                 landmarks = hand_landmarks.landmark
 
                 # Get the wrist and middle MCP for angle calculation
@@ -42,6 +42,12 @@ setup(
             "black>=21.0.0",
             "isort>=5.0.0",
         ],
+        "headpose": [
+            "dlib>=19.22",
+        ],
+        "tasks": [
+            "mediapipe>=0.10.0",
+        ],
         "docs": [
             "sphinx>=4.0.0",
             "sphinx-rtd-theme>=1.0.0",
@@ -51,6 +57,9 @@ setup(
         "console_scripts": [
             "gesture-control=gesture_control_simple:main",
             "gesture-control-gui=gesture_control_gui:main",
+            "gesture-control-multi=gesture_control_multi:main",
+            "gesture-control-operators=gesture_control_operators:main",
+            "gesture-inference-server=inference_server:main",
         ],
     },
     include_package_data=True,
@@ -0,0 +1,102 @@
+"""Core building blocks shared by the gesture control applications."""
+
+from .arbitration import HandArbiter, HandSlotTracker
+from .buffers import BufferRing, FramePool
+from .capture import (
+    PACING_FAST,
+    PACING_REALTIME,
+    ImageDirectorySource,
+    LatestFrameGrabber,
+    RecordedSessionSource,
+    SessionRecorder,
+    VideoFileSource,
+    open_capture,
+)
+from .change import FrameChangeDetector
+from .channels import ParallelInference
+from .features import (
+    RULES_FINGERS,
+    RULES_ZONES,
+    HandFeatures,
+    classify_batch,
+    extract_features,
+    finger_command,
+    landmark_array,
+    zone_command,
+)
+from .frame_bus import FrameBusPublisher, FrameBusSource, SharedFrameRing
+from .headpose import HeadPose, HeadPoseEstimator
+from .landmark_cache import LandmarkCache, clip_hash
+from .landmarks import (
+    BACKEND_SOLUTIONS,
+    BACKEND_TASKS,
+    Landmark,
+    LandmarkBackend,
+    LandmarkResult,
+    SolutionsBackend,
+    TasksBackend,
+    create_landmark_backend,
+    draw_landmarks,
+)
+from .mjpeg import MJPEGStreamReader
+from .predict import LandmarkPredictor
+from .offload import RemoteBackend
+from .preprocess import FramePreprocessor
+from .quality import AdaptiveQualityController, QualityLevel, quality_ladder
+from .roi import HandROITracker
+from .supervisor import SupervisedBackend
+from .timing import CaptureStats, FrameInfo
+from .warmup import BackendWarmer
+
+__all__ = [
+    'BACKEND_SOLUTIONS',
+    'BACKEND_TASKS',
+    'PACING_FAST',
+    'PACING_REALTIME',
+    'RULES_FINGERS',
+    'RULES_ZONES',
+    'AdaptiveQualityController',
+    'BackendWarmer',
+    'BufferRing',
+    'CaptureStats',
+    'FrameBusPublisher',
+    'FrameBusSource',
+    'FrameChangeDetector',
+    'FramePool',
+    'FrameInfo',
+    'FramePreprocessor',
+    'HandArbiter',
+    'HandFeatures',
+    'HandROITracker',
+    'HandSlotTracker',
+    'HeadPose',
+    'HeadPoseEstimator',
+    'ImageDirectorySource',
+    'Landmark',
+    'LandmarkBackend',
+    'LandmarkCache',
+    'LandmarkPredictor',
+    'LandmarkResult',
+    'LatestFrameGrabber',
+    'MJPEGStreamReader',
+    'ParallelInference',
+    'QualityLevel',
+    'RecordedSessionSource',
+    'RemoteBackend',
+    'SessionRecorder',
+    'SharedFrameRing',
+    'SolutionsBackend',
+    'SupervisedBackend',
+    'TasksBackend',
+    'VideoFileSource',
+    'classify_batch',
+    'clip_hash',
+    'create_landmark_backend',
+    'draw_landmarks',
+    'extract_features',
+    'finger_command',
+    'landmark_array',
+    'open_capture',
+    'quality_ladder',
+    'zone_command',
+]
@@ -0,0 +1,181 @@
+import math
+
+# Landmarks whose midpoint stands for the hand's position (wrist and middle finger MCP)
+ANCHOR_LANDMARKS = (0, 9)
+
+
+def hand_candidates(result):
+    """Yield ``(index, label, score, (x, y))`` for every hand in a non-empty ``result``."""
+    handedness = result.multi_handedness or ()
+    for index, hand_landmarks in enumerate(result.multi_hand_landmarks):
+        landmarks = hand_landmarks.landmark
+        x = sum(landmarks[i].x for i in ANCHOR_LANDMARKS) / len(ANCHOR_LANDMARKS)
+        y = sum(landmarks[i].y for i in ANCHOR_LANDMARKS) / len(ANCHOR_LANDMARKS)
+        if index < len(handedness) and handedness[index].classification:
+            classification = handedness[index].classification[0]
+            label, score = classification.label, classification.score
+        else:
+            # Backends without handedness: every hand counts as confident
+            label, score = None, 1.0
+        yield index, label, score, (x, y)
+
+
+class HandArbiter:
+    """
+    Decide which of the visible hands is the operator's.
+
+    MediaPipe reports hands in no particular order, so taking the last (or
+    first) one lets a bystander's hand take over the robot. ``select()``
+    instead locks onto the first hand whose handedness score reaches
+    ``min_score`` (and whose label is ``hand``, when set; labels are
+    MediaPipe's ``'Left'``/``'Right'`` for the mirrored frame). With several
+    candidates in the same frame the highest score wins, then the leftmost
+    hand, so the choice is deterministic.
+
+    While locked, only the hand with the same label within ``max_jump``
+    (normalized units) of the operator's last position is accepted; other
+    hands are ignored. After ``lost_frames`` consecutive frames without it
+    the lock is released and the next confident hand can take over. Frames
+    in between select nothing, so the robot stops rather than follows a
+    bystander. ``locked`` tells the pipeline it can run the model with
+    ``max_num_hands=1``.
+    """
+
+    def __init__(self, hand='', min_score=0.8, max_jump=0.2, lost_frames=5):
+        self.hand = hand
+        self.min_score = min_score
+        self.max_jump = max_jump
+        self.lost_frames = lost_frames
+
+        self.label = None
+        self.position = None
+        self.missed = 0
+        self.locks = 0
+        self.hands_ignored = 0
+
+    @property
+    def locked(self):
+        return self.position is not None
+
+    def reset(self):
+        self.label = None
+        self.position = None
+        self.missed = 0
+
+    def select(self, result):
+        """Return the index of the operator's hand in ``result.multi_hand_landmarks``, or None."""
+        if result is None or not result.multi_hand_landmarks:
+            return self._miss()
+        candidates = list(hand_candidates(result))
+
+        if self.locked:
+            matches = [(math.dist(position, self.position), index, position)
+                       for index, label, score, position in candidates
+                       if label == self.label and math.dist(position, self.position) <= self.max_jump]
+            if not matches:
+                self.hands_ignored += len(candidates)
+                return self._miss()
+            _, index, self.position = min(matches)
+            self.missed = 0
+            self.hands_ignored += len(candidates) - 1
+            return index
+
+        confident = [(-score, position[0], index, label, position)
+                     for index, label, score, position in candidates
+                     if score >= self.min_score and (not self.hand or label == self.hand)]
+        if not confident:
+            self.hands_ignored += len(candidates)
+            return None
+        _, _, index, self.label, self.position = min(confident)
+        self.missed = 0
+        self.locks += 1
+        self.hands_ignored += len(candidates) - 1
+        return index
+
+    def _miss(self):
+        if self.locked:
+            self.missed += 1
+            if self.missed > self.lost_frames:
+                self.reset()
+        return None
+
+    def describe(self):
+        if not self.locked:
+            return "no operator"
+        hand = f"{self.label.lower()} hand" if self.label else "hand"
+        return f"operator {hand}" + (f" (missing {self.missed})" if self.missed else "")
+
+
+class HandSlotTracker:
+    """
+    Keep the identity of several operators' hands across frames.
+
+    Each slot stands for one operator (and one robot). ``assign()`` returns,
+    per slot, the index of that operator's hand in the result, or None. A
+    slot keeps the hand nearest to its last position within ``max_jump``
+    (normalized units); the nearest pairs are matched first, so two hands
+    passing each other do not swap robots. A hand that matches no slot
+    claims the first free slot whose ``regions`` entry ``(x0, x1)`` (a
+    horizontal span of the frame; None = anywhere) contains it, once its
+    handedness score reaches ``min_score``. A slot whose hand has been
+    missing for more than ``lost_frames`` frames becomes free again.
+
+    Unlike ``HandArbiter``, the handedness label is not part of a hand's
+    identity: side-by-side operators may use either hand.
+    """
+
+    def __init__(self, regions, min_score=0.8, max_jump=0.2, lost_frames=5):
+        self.regions = list(regions)
+        self.min_score = min_score
+        self.max_jump = max_jump
+        self.lost_frames = lost_frames
+
+        self.positions = [None] * len(self.regions)
+        self.missed = [0] * len(self.regions)
+        self.claims = 0
+
+    def __len__(self):
+        return len(self.regions)
+
+    def reset(self):
+        self.positions = [None] * len(self.regions)
+        self.missed = [0] * len(self.regions)
+
+    def assign(self, result):
+        """Return a list with the hand index (or None) of every slot."""
+        assigned = [None] * len(self.regions)
+        candidates = list(hand_candidates(result)) if result is not None and result.multi_hand_landmarks else []
+
+        # Tracked slots keep their nearest hand, closest pairs first
+        pairs = sorted((math.dist(position, self.positions[slot]), slot, index, position)
+                       for slot in range(len(self.regions)) if self.positions[slot] is not None
+                       for index, label, score, position in candidates)
+        taken = set()
+        for distance, slot, index, position in pairs:
+            if distance > self.max_jump or assigned[slot] is not None or index in taken:
+                continue
+            assigned[slot] = index
+            taken.add(index)
+            self.positions[slot] = position
+            self.missed[slot] = 0
+
+        # New confident hands claim a free slot in their part of the frame, left to right
+        for index, label, score, position in sorted(candidates, key=lambda c: c[3][0]):
+            if index in taken or score < self.min_score:
+                continue
+            for slot, region in enumerate(self.regions):
+                if self.positions[slot] is None and (region is None or region[0] <= position[0] < region[1]):
+                    assigned[slot] = index
+                    taken.add(index)
+                    self.positions[slot] = position
+                    self.missed[slot] = 0
+                    self.claims += 1
+                    break
+
+        for slot, index in enumerate(assigned):
+            if index is None and self.positions[slot] is not None:
+                self.missed[slot] += 1
+                if self.missed[slot] > self.lost_frames:
+                    self.positions[slot] = None
+                    self.missed[slot] = 0
+        return assigned
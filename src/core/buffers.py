@@ -0,0 +1,62 @@
+import threading
+
+import numpy as np
+
+
+class FramePool:
+    """
+    Recycle frame-sized arrays instead of allocating a new one per frame.
+
+    ``acquire()`` hands out a free buffer of the requested shape, allocating
+    only when none is available; ``release()`` returns a buffer for reuse.
+    At most ``capacity`` idle buffers are kept. ``allocations`` counts how
+    many buffers were ever created, which stays flat in steady state.
+    """
+
+    def __init__(self, capacity=4):
+        self.capacity = capacity
+        self.allocations = 0
+        self._free = []
+        self._lock = threading.Lock()
+
+    def acquire(self, shape, dtype=np.uint8):
+        shape = tuple(shape)
+        with self._lock:
+            for i, buffer in enumerate(self._free):
+                if buffer.shape == shape and buffer.dtype == dtype:
+                    return self._free.pop(i)
+            self.allocations += 1
+        return np.empty(shape, dtype)
+
+    def release(self, buffer):
+        if buffer is None:
+            return
+        with self._lock:
+            if len(self._free) < self.capacity and not any(b is buffer for b in self._free):
+                self._free.append(buffer)
+
+
+class BufferRing:
+    """
+    A fixed number of buffers handed out round-robin.
+
+    Used where a buffer has to outlive the current iteration for a short while,
+    e.g. a frame referenced by a QImage that is still queued for the GUI thread.
+    The ring is reallocated only when the requested shape changes.
+    """
+
+    def __init__(self, size=1):
+        self.size = size
+        self.allocations = 0
+        self._buffers = []
+        self._index = 0
+
+    def next(self, shape, dtype=np.uint8):
+        shape = tuple(shape)
+        if not self._buffers or self._buffers[0].shape != shape or self._buffers[0].dtype != dtype:
+            self._buffers = [np.empty(shape, dtype) for _ in range(self.size)]
+            self.allocations += self.size
+            self._index = 0
+        buffer = self._buffers[self._index]
+        self._index = (self._index + 1) % self.size
+        return buffer
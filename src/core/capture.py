@@ -0,0 +1,338 @@
+import json
+import os
+import threading
+import time
+
+import cv2
+
+from .buffers import FramePool
+from .frame_bus import FrameBusSource
+from .timing import CaptureStats
+
+# Replay pacing modes
+PACING_REALTIME = 'realtime'  # Play back at the recorded frame rate
+PACING_FAST = 'fast'          # Deliver frames as fast as they are read
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+SESSION_MANIFEST = 'session.json'
+FRAME_BUS_PREFIX = 'shm://'
+
+
+class LatestFrameGrabber:
+    """
+    Read frames from a capture on a background thread, keeping only the newest.
+
+    The grabber exposes the same ``read()``, ``isOpened()`` and ``release()``
+    calls as ``cv2.VideoCapture`` so it can replace the capture object in an
+    existing frame loop. Frames that were captured but never read because a
+    newer frame arrived first are counted in ``frames_dropped``.
+
+    Frames are read into buffers from a ``FramePool``. Consumers that are done
+    with a frame can hand it back with ``recycle()`` so the next capture reuses
+    it instead of allocating a new array.
+
+    Every frame is stamped with a sequence number and ``time.monotonic()`` on
+    the grabber thread as soon as the camera returns it. After ``read()`` the
+    metadata of the returned frame is available as ``frame_info`` and the
+    running counters as ``stats`` (a ``CaptureStats``).
+    """
+
+    is_live = True
+
+    def __init__(self, cap, retry_delay=0.1, pool_size=3):
+        self.cap = cap
+        self.retry_delay = retry_delay
+        self.pool = FramePool(pool_size)
+        self._frame_shape = None
+
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.read_failures = 0
+        self.stats = CaptureStats()
+        self.frame_info = None
+
+        # Single-slot buffer guarded by a condition variable
+        self._condition = threading.Condition()
+        self._frame = None
+        self._frame_stamp = None
+        self._thread = None
+        self.running = False
+
+    def start(self):
+        """Start the grabber thread."""
+        if self._thread is not None:
+            return self
+        self.running = True
+        self._thread = threading.Thread(target=self._grab_loop, name="LatestFrameGrabber", daemon=True)
+        self._thread.start()
+        return self
+
+    def _grab_loop(self):
+        while self.running:
+            buffer = self.pool.acquire(self._frame_shape) if self._frame_shape else None
+            ret, frame = self.cap.read(buffer) if buffer is not None else self.cap.read()
+            captured_at = time.monotonic()
+            if frame is not buffer:
+                self.pool.release(buffer)
+            if not ret:
+                self.read_failures += 1
+                if not self.cap.isOpened():
+                    break
+                # Short delay before retry
+                time.sleep(self.retry_delay)
+                continue
+
+            self._frame_shape = frame.shape
+            with self._condition:
+                if self._frame is not None:
+                    # The previous frame was never consumed
+                    self.frames_dropped += 1
+                    self.pool.release(self._frame)
+                self._frame = frame
+                self._frame_stamp = (self.frames_captured, captured_at)
+                self.frames_captured += 1
+                self._condition.notify_all()
+
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+
+    def read(self, timeout=1.0):
+        """Return ``(ret, frame)`` for the newest frame not yet read."""
+        with self._condition:
+            if self._frame is None and self.running:
+                self._condition.wait_for(lambda: self._frame is not None or not self.running, timeout)
+            frame = self._frame
+            stamp = self._frame_stamp
+            self._frame = None
+        if frame is None:
+            return False, None
+        self.frame_info = self.stats.record(*stamp)
+        return True, frame
+
+    def recycle(self, frame):
+        """Return a frame obtained from ``read()`` once it is no longer used."""
+        self.pool.release(frame)
+
+    def isOpened(self):
+        # Stay open until the last buffered frame has been read
+        if self._frame is not None:
+            return True
+        return self.running and self.cap is not None and self.cap.isOpened()
+
+    def release(self):
+        """Stop the grabber thread and release the underlying capture."""
+        with self._condition:
+            self.running = False
+            self._frame = None
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        if self.cap is not None:
+            self.cap.release()
+
+
+class ReplaySource:
+    """
+    Base class for file-backed capture sources.
+
+    Replay sources deliver every frame in order, so two runs over the same
+    clip always see the same frame sequence. In ``PACING_REALTIME`` mode each
+    frame is held back until its recorded time; a consumer that falls behind
+    is never skipped ahead. In ``PACING_FAST`` mode frames are returned as
+    soon as they are decoded, which is what throughput measurements want.
+
+    Frames are stamped with their index and the ``time.monotonic()`` time they
+    are delivered, available as ``frame_info`` after ``read()``.
+    """
+
+    is_live = False
+
+    def __init__(self, pacing=PACING_REALTIME, size=None):
+        if pacing not in (PACING_REALTIME, PACING_FAST):
+            raise ValueError(f"Unknown pacing mode: {pacing}")
+        self.pacing = pacing
+        self.size = size
+        self.fps = 30.0
+
+        self.frame_index = 0
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.stats = CaptureStats()
+        self.frame_info = None
+        self.pool = FramePool()
+        self._raw_shape = None
+        self._start_time = None
+        self._opened = True
+
+    def _read_next(self, buffer):
+        """Return ``(ret, frame, timestamp)`` for the next frame, decoding into ``buffer`` if possible."""
+        raise NotImplementedError
+
+    def _pace(self, timestamp):
+        if self.pacing == PACING_FAST:
+            return
+        now = time.monotonic()
+        if self._start_time is None:
+            self._start_time = now - timestamp
+        delay = self._start_time + timestamp - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def read(self):
+        if not self._opened:
+            return False, None
+        buffer = self.pool.acquire(self._raw_shape) if self._raw_shape else None
+        ret, frame, timestamp = self._read_next(buffer)
+        if frame is not buffer:
+            self.pool.release(buffer)
+        if not ret:
+            self._opened = False
+            return False, None
+        self._raw_shape = frame.shape
+
+        if self.size is not None and (frame.shape[1], frame.shape[0]) != tuple(self.size):
+            resized = self.pool.acquire((self.size[1], self.size[0]) + frame.shape[2:], frame.dtype)
+            resized = cv2.resize(frame, tuple(self.size), dst=resized, interpolation=cv2.INTER_AREA)
+            self.pool.release(frame)
+            frame = resized
+
+        self._pace(timestamp)
+        self.frame_info = self.stats.record(self.frame_index)
+        self.frame_index += 1
+        self.frames_captured += 1
+        return True, frame
+
+    def recycle(self, frame):
+        """Return a frame obtained from ``read()`` once it is no longer used."""
+        self.pool.release(frame)
+
+    def isOpened(self):
+        return self._opened
+
+    def release(self):
+        self._opened = False
+
+
+class VideoFileSource(ReplaySource):
+    """Replay a video file such as an MP4 recording."""
+
+    def __init__(self, path, pacing=PACING_REALTIME, size=None):
+        super().__init__(pacing, size)
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        self._opened = self.cap.isOpened()
+        fps = self.cap.get(cv2.CAP_PROP_FPS) if self._opened else 0
+        if fps and fps > 0:
+            self.fps = fps
+
+    def _read_next(self, buffer):
+        ret, frame = self.cap.read(buffer) if buffer is not None else self.cap.read()
+        return ret, frame, self.frame_index / self.fps
+
+    def release(self):
+        super().release()
+        self.cap.release()
+
+
+class ImageDirectorySource(ReplaySource):
+    """Replay a directory of still images in filename order."""
+
+    def __init__(self, path, pacing=PACING_REALTIME, size=None, fps=30.0):
+        super().__init__(pacing, size)
+        self.path = path
+        self.fps = fps
+        self.files = sorted(
+            os.path.join(path, name) for name in os.listdir(path)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        self.timestamps = [i / fps for i in range(len(self.files))]
+        self._opened = len(self.files) > 0
+
+    def _read_next(self, buffer):
+        if self.frame_index >= len(self.files):
+            return False, None, None
+        frame = cv2.imread(self.files[self.frame_index])
+        if frame is None:
+            print(f"Failed to read image: {self.files[self.frame_index]}")
+            return False, None, None
+        return True, frame, self.timestamps[self.frame_index]
+
+
+class RecordedSessionSource(ImageDirectorySource):
+    """Replay a session written by ``SessionRecorder`` using its recorded timestamps."""
+
+    def __init__(self, path, pacing=PACING_REALTIME, size=None):
+        with open(os.path.join(path, SESSION_MANIFEST), 'r') as f:
+            manifest = json.load(f)
+
+        ReplaySource.__init__(self, pacing, size)
+        self.path = path
+        self.fps = manifest.get('fps', 30.0)
+        self.files = [os.path.join(path, entry['file']) for entry in manifest['frames']]
+        self.timestamps = [entry['timestamp'] for entry in manifest['frames']]
+        self._opened = len(self.files) > 0
+
+
+class SessionRecorder:
+    """Record frames and their capture times so a session can be replayed later."""
+
+    def __init__(self, path, image_format='.jpg'):
+        self.path = path
+        self.image_format = image_format
+        self.frames = []
+        self._start_time = None
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, frame):
+        now = time.monotonic()
+        if self._start_time is None:
+            self._start_time = now
+        name = f"{len(self.frames):06d}{self.image_format}"
+        cv2.imwrite(os.path.join(self.path, name), frame)
+        self.frames.append({'file': name, 'timestamp': now - self._start_time})
+
+    def close(self):
+        duration = self.frames[-1]['timestamp'] if self.frames else 0
+        fps = (len(self.frames) - 1) / duration if duration > 0 else 30.0
+        with open(os.path.join(self.path, SESSION_MANIFEST), 'w') as f:
+            json.dump({'fps': fps, 'frames': self.frames}, f, indent=4)
+
+
+def open_capture(source=0, width=1280, height=720, pacing=PACING_REALTIME):
+    """
+    Open a capture source by description.
+
+    ``source`` may be a camera index, a stream URL, a video file, a directory
+    of images, a directory written by ``SessionRecorder`` or ``shm://NAME``
+    for frames published to a ``SharedFrameRing`` by another process.
+    Cameras and streams are wrapped in a ``LatestFrameGrabber``; files are
+    replayed frame by frame at the requested ``pacing`` and resized to
+    ``width`` x ``height`` so the rest of the pipeline sees the same geometry.
+    """
+    if isinstance(source, str) and source.isdigit():
+        source = int(source)
+
+    size = (width, height) if width and height else None
+
+    if isinstance(source, str) and source.startswith(FRAME_BUS_PREFIX):
+        return FrameBusSource(source[len(FRAME_BUS_PREFIX):])
+
+    if isinstance(source, str) and os.path.isdir(source):
+        if os.path.exists(os.path.join(source, SESSION_MANIFEST)):
+            return RecordedSessionSource(source, pacing, size)
+        return ImageDirectorySource(source, pacing, size)
+
+    if isinstance(source, str) and os.path.isfile(source):
+        return VideoFileSource(source, pacing, size)
+
+    # Live camera or network stream
+    cap = cv2.VideoCapture(source)
+    grabber = LatestFrameGrabber(cap)
+    if cap.isOpened():
+        if size is not None:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        grabber.start()
+    return grabber
@@ -0,0 +1,81 @@
+import cv2
+import numpy as np
+
+from .buffers import BufferRing
+
+
+class FrameChangeDetector:
+    """
+    Cheaply decide whether a frame changed enough to be worth running inference on.
+
+    Each frame is reduced to a small greyscale thumbnail (area-averaged, so
+    sensor noise mostly cancels out) and compared with the thumbnail of the
+    last frame that was actually inferred. If no thumbnail cell changed by
+    ``threshold`` grey levels or more, ``should_infer()`` returns False and
+    the caller reuses its previous result. The largest cell change is used
+    rather than the mean so that a hand moving over a static background
+    is not averaged away. Comparing against the last *inferred*
+    frame rather than the previous one means slow drift still adds up to a
+    change. Duplicate buffers from cameras that repeat frames in low light
+    compare as exactly 0.
+
+    At most ``max_skip`` frames in a row are skipped, so inference still runs
+    at least every ``max_skip + 1`` frames. A ``threshold`` of 0 disables
+    skipping. ``frames_skipped`` and ``frames_inferred`` count the decisions.
+    """
+
+    def __init__(self, threshold=8.0, max_skip=5, thumbnail_size=(32, 18)):
+        self.threshold = threshold
+        self.max_skip = max_skip
+        self.thumbnail_size = thumbnail_size
+        self.last_difference = None
+
+        self.frames_skipped = 0
+        self.frames_inferred = 0
+        self._skipped_in_row = 0
+
+        self._small = BufferRing(1)
+        self._grey = BufferRing(1)
+        self._diff = BufferRing(1)
+        self._reference_buffer = BufferRing(1)
+        self._reference = None
+
+    def _thumbnail(self, frame):
+        width, height = self.thumbnail_size
+        small = cv2.resize(frame, (width, height), dst=self._small.next((height, width) + frame.shape[2:], frame.dtype),
+                           interpolation=cv2.INTER_AREA)
+        if small.ndim == 2:
+            return small
+        grey = self._grey.next((height, width), frame.dtype)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=grey)
+
+    def should_infer(self, frame):
+        """Return True if ``frame`` needs inference, False if the previous result can be reused."""
+        if self.threshold <= 0:
+            self.frames_inferred += 1
+            return True
+
+        thumbnail = self._thumbnail(frame)
+        if self._reference is not None and self._skipped_in_row < self.max_skip:
+            diff = cv2.absdiff(thumbnail, self._reference, dst=self._diff.next(thumbnail.shape, thumbnail.dtype))
+            self.last_difference = cv2.minMaxLoc(diff)[1]
+            if self.last_difference < self.threshold:
+                self._skipped_in_row += 1
+                self.frames_skipped += 1
+                return False
+
+        self._reference = self._reference_buffer.next(thumbnail.shape, thumbnail.dtype)
+        np.copyto(self._reference, thumbnail)
+        self._skipped_in_row = 0
+        self.frames_inferred += 1
+        return True
+
+    def reset(self):
+        """Force inference on the next frame (e.g. after the model was rebuilt)."""
+        self._reference = None
+        self._skipped_in_row = 0
+
+    @property
+    def skip_ratio(self):
+        total = self.frames_skipped + self.frames_inferred
+        return self.frames_skipped / total if total else 0.0
@@ -0,0 +1,125 @@
+import threading
+import time
+
+
+class _Channel:
+    def __init__(self, name, process):
+        self.name = name
+        self.process = process
+        self.condition = threading.Condition()
+        self.job = None
+        self.result = None
+        self.done = True
+        self.started = 0.0
+
+        self.frames = 0
+        self.latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self.deadline_misses = 0
+        self.frames_skipped = 0
+        self.errors = 0
+
+    def record(self, latency_ms):
+        gain = 1.0 / 16 if self.frames else 1.0
+        self.latency_ms += (latency_ms - self.latency_ms) * gain
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.frames += 1
+
+
+class ParallelInference:
+    """
+    Run several inference channels on the same frame at once.
+
+    ``channels`` maps a name to a callable taking one input (e.g. the hand
+    backend's ``process`` and ``HeadPoseEstimator.process``). Each channel
+    has its own worker thread. ``run(inputs)`` hands every named input to
+    its channel without copying and waits until they all finished or
+    ``deadline`` seconds passed.
+    The per-frame cost is then the slowest channel instead of the sum.
+    MediaPipe and OpenCV release the interpreter lock while they compute, so
+    the threads really overlap.
+
+    The returned dict holds the result (possibly None) of every channel that
+    finished in time. A channel that misses the deadline is dropped for that
+    frame and keeps running in the background; until it finishes it is
+    skipped for new frames and its late result is discarded, so one slow
+    channel never delays the others. A late job keeps reading its input, so
+    the caller must not modify or recycle an input (or close an object it
+    uses) while ``busy(name)`` is true. A channel that raises is reported
+    and returns None.
+    """
+
+    def __init__(self, channels, deadline=0.1):
+        self.deadline = deadline
+        self.channels = {name: _Channel(name, process) for name, process in channels.items()}
+        self._running = True
+        self._threads = []
+        for channel in self.channels.values():
+            thread = threading.Thread(target=self._worker, args=(channel,), name=f"channel-{channel.name}",
+                                      daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _worker(self, channel):
+        while True:
+            with channel.condition:
+                channel.condition.wait_for(lambda: not self._running or channel.job is not None)
+                if not self._running:
+                    return
+                job = channel.job
+            try:
+                result = channel.process(job)
+            except Exception as e:
+                print(f"Inference channel '{channel.name}' failed: {e}")
+                channel.errors += 1
+                result = None
+            with channel.condition:
+                channel.record((time.monotonic() - channel.started) * 1000.0)
+                channel.result = result
+                channel.job = None
+                channel.done = True
+                channel.condition.notify_all()
+
+    def run(self, inputs):
+        """Process each ``inputs[name]`` on its channel in parallel; return the results that made the deadline."""
+        submitted = []
+        for name, value in inputs.items():
+            channel = self.channels[name]
+            with channel.condition:
+                if not channel.done:
+                    # Still busy with a frame that missed its deadline
+                    channel.frames_skipped += 1
+                    continue
+                channel.done = False
+                channel.result = None
+                channel.started = time.monotonic()
+                channel.job = value
+                channel.condition.notify_all()
+            submitted.append(channel)
+
+        deadline = time.monotonic() + self.deadline
+        results = {}
+        for channel in submitted:
+            with channel.condition:
+                if not channel.condition.wait_for(lambda: channel.done, max(0.0, deadline - time.monotonic())):
+                    channel.deadline_misses += 1
+                    continue
+                results[channel.name] = channel.result
+        return results
+
+    def busy(self, name):
+        """True while channel ``name`` is still working on a frame that missed its deadline."""
+        return not self.channels[name].done
+
+    def summary(self):
+        return ", ".join(f"{channel.name} {channel.latency_ms:.1f} ms (max {channel.max_latency_ms:.1f}), "
+                         f"{channel.deadline_misses} missed, {channel.frames_skipped} skipped"
+                         for channel in self.channels.values())
+
+    def close(self):
+        self._running = False
+        for channel in self.channels.values():
+            with channel.condition:
+                channel.condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
@@ -0,0 +1,187 @@
+import itertools
+
+import numpy as np
+
+# Landmark indices used by the classifiers
+WRIST = 0
+THUMB_TIP = 4
+MIDDLE_MCP = 9
+RING_MCP = 13
+FINGER_TIPS = (8, 12, 16, 20)  # Index, middle, ring, pinky
+
+# Index and thumb tips closer than this (normalized units) are a pinch
+PINCH_DISTANCE = 0.1
+
+# Rule sets of classify_batch(): the GUI's zones and hand angle, or the finger gestures
+RULES_ZONES = 'zones'
+RULES_FINGERS = 'fingers'
+
+# The GUI's default zone layout (normalized coordinates)
+DEFAULT_ZONES = {
+    'forward_zone': {'x': 0.4, 'y': 0.0, 'width': 0.2, 'height': 0.3},
+    'backward_zone': {'x': 0.4, 'y': 0.7, 'width': 0.2, 'height': 0.3},
+    'turn_angle_threshold': 20
+}
+
+# Poses classified per vectorized pass; bounds classify_batch()'s temporary arrays
+BATCH_SIZE = 1 << 16
+
+
+def landmark_array(hands):
+    """
+    Convert hands to one ``(hands, 21, 3)`` float32 array.
+
+    ``hands`` is a ``multi_hand_landmarks`` list (objects with a
+    ``landmark`` list) or a list of landmark lists. All coordinates are read
+    in a single pass into a flat buffer, so the per-field attribute access
+    happens once per frame instead of once per rule.
+    """
+    hands = [getattr(hand, 'landmark', hand) for hand in hands or ()]
+    coordinates = itertools.chain.from_iterable((point.x, point.y, point.z) for hand in hands for point in hand)
+    return np.fromiter(coordinates, np.float32, count=len(hands) * 63).reshape(len(hands), 21, 3)
+
+
+class HandFeatures:
+    """
+    Everything the gesture classifiers derive from landmarks, for all hands at once.
+
+    Computed in one vectorized pass over a ``(hands, 21, 3)`` array (in
+    float64, so the results match the per-attribute Python arithmetic the
+    classifiers used to do):
+
+    - ``angle``: wrist-to-middle-MCP angle in degrees, 0 for an upright hand,
+      positive when tilted right (``(hands,)``)
+    - ``pinch``: index-to-thumb tip distance in the image plane (``(hands,)``)
+    - ``index_pointing``: the index tip is above the other three fingertips
+    - ``index_left``: the index tip is left of the wrist
+    - ``tips_above_wrist``: per fingertip (index, middle, ring, pinky), above
+      the wrist (``(hands, 4)``); ``tips_above_wrist_relaxed`` allows a margin
+      of the thumb-to-pinky spread
+    - ``zones``: landmarks 9 and 13 both strictly inside each pixel rectangle
+      ``(x, y, w, h)`` of ``zones`` in a ``width`` x ``height`` frame, with the
+      coordinates truncated to whole pixels (``(hands, len(zones))``)
+    """
+
+    __slots__ = ('points', 'angle', 'pinch', 'index_pointing', 'index_left', 'tips_above_wrist',
+                 'tips_above_wrist_relaxed', 'zones')
+
+    def __init__(self, points, zones=(), width=1, height=1):
+        self.points = points
+        x = points[..., 0].astype(np.float64)
+        y = points[..., 1].astype(np.float64)
+
+        angle = np.degrees(np.arctan2(y[:, WRIST] - y[:, MIDDLE_MCP], x[:, WRIST] - x[:, MIDDLE_MCP])) - 90
+        self.angle = np.where(angle <= -180, angle + 360, np.where(angle > 180, angle - 360, angle))
+
+        self.pinch = np.sqrt((x[:, 8] - x[:, THUMB_TIP]) ** 2 + (y[:, 8] - y[:, THUMB_TIP]) ** 2)
+
+        tips_y = y[:, FINGER_TIPS]
+        self.index_pointing = (tips_y[:, :1] < tips_y[:, 1:]).all(axis=1)
+        self.index_left = x[:, 8] < x[:, WRIST]
+        self.tips_above_wrist = tips_y < y[:, WRIST, None]
+        margin = np.abs(x[:, 20] - x[:, THUMB_TIP])
+        self.tips_above_wrist_relaxed = tips_y < (y[:, WRIST] + margin)[:, None]
+
+        if len(zones):
+            rects = np.asarray(zones, np.float64)
+            px = np.trunc(x[:, (MIDDLE_MCP, RING_MCP)] * width)[:, :, None]
+            py = np.trunc(y[:, (MIDDLE_MCP, RING_MCP)] * height)[:, :, None]
+            left, top = rects[:, 0], rects[:, 1]
+            inside = (left < px) & (px < left + rects[:, 2]) & (top < py) & (py < top + rects[:, 3])
+            self.zones = inside.all(axis=1)
+        else:
+            self.zones = np.zeros((len(points), 0), bool)
+
+    def __len__(self):
+        return len(self.points)
+
+
+def extract_features(hands, zones=(), width=1, height=1):
+    """``HandFeatures`` for a ``multi_hand_landmarks`` list (or landmark lists); see ``landmark_array``."""
+    return HandFeatures(landmark_array(hands), zones, width, height)
+
+
+def zone_command(features, hand, zone_commands, turn_threshold=20):
+    """
+    The zone-and-angle command of one hand.
+
+    ``zone_commands`` names the command of each zone passed to
+    ``extract_features``, in priority order (None skips zones that belong to
+    other hands); a hand in none of them turns RIGHT/LEFT beyond
+    ``turn_threshold`` degrees, else STOP.
+    """
+    for command, inside in zip(zone_commands, features.zones[hand]):
+        if inside and command is not None:
+            return command
+    angle = features.angle[hand]
+    if angle > turn_threshold:
+        return "RIGHT"
+    if angle < -turn_threshold:
+        return "LEFT"
+    return "STOP"
+
+
+def finger_command(features, hand, relaxed=False, default="STOP"):
+    """
+    The finger-gesture command of one hand.
+
+    A pinch is BACKWARD; an index finger above the other fingertips points
+    RIGHT when it is left of the wrist (the frame is mirrored) and LEFT
+    otherwise; all fingertips above the wrist (with the thumb-to-pinky margin
+    when ``relaxed``) is FORWARD; anything else is ``default``.
+    """
+    if features.pinch[hand] < PINCH_DISTANCE:
+        return "BACKWARD"
+    if features.index_pointing[hand]:
+        return "RIGHT" if features.index_left[hand] else "LEFT"
+    tips = features.tips_above_wrist_relaxed if relaxed else features.tips_above_wrist
+    if tips[hand].all():
+        return "FORWARD"
+    return default
+
+
+def zone_rects(zones, width, height):
+    """The forward and backward zones of a GUI-style layout as ``(x, y, w, h)`` pixel rectangles."""
+    return [(int(zone['x'] * width), int(zone['y'] * height), int(zone['width'] * width), int(zone['height'] * height))
+            for zone in (zones['forward_zone'], zones['backward_zone'])]
+
+
+def classify_batch(landmarks, settings=None, rules=RULES_ZONES, width=1280, height=720, relaxed=False,
+                   default="STOP"):
+    """
+    Classify ``N`` hand poses at once; return an ``(N,)`` array of command strings.
+
+    ``landmarks`` is an ``(N, 21, 3)`` array in normalized coordinates (e.g.
+    recorded ``landmark_array`` rows). With ``RULES_ZONES`` every pose gets
+    the command the GUI would send for it in a ``width`` x ``height`` frame,
+    using the zones and turn threshold of ``settings['zones']`` (GUI
+    settings; the default layout when None). With ``RULES_FINGERS`` it gets
+    ``finger_command(..., relaxed, default)``. The features and rules are the
+    per-frame ones, evaluated with ``np.select`` on ``BATCH_SIZE`` poses at a
+    time, so no Python code runs per pose.
+    """
+    points = np.asarray(landmarks, np.float32).reshape(-1, 21, 3)
+    if rules == RULES_ZONES:
+        zones = (settings or {}).get('zones', DEFAULT_ZONES)
+        rects = zone_rects(zones, width, height)
+        threshold = zones.get('turn_angle_threshold', 20)
+        names = ("FORWARD", "BACKWARD", "RIGHT", "LEFT", "STOP")
+    elif rules == RULES_FINGERS:
+        rects = ()
+        names = ("BACKWARD", "RIGHT", "LEFT", "FORWARD", default)
+    else:
+        raise ValueError(f"Unknown gesture rules: {rules}")
+
+    codes = np.empty(len(points), np.uint8)
+    for start in range(0, len(points), BATCH_SIZE):
+        features = HandFeatures(points[start:start + BATCH_SIZE], rects, width, height)
+        if rules == RULES_ZONES:
+            conditions = [features.zones[:, 0], features.zones[:, 1], features.angle > threshold,
+                          features.angle < -threshold]
+        else:
+            pinch = features.pinch < PINCH_DISTANCE
+            tips = features.tips_above_wrist_relaxed if relaxed else features.tips_above_wrist
+            conditions = [pinch, features.index_pointing & features.index_left, features.index_pointing,
+                          tips.all(axis=1)]
+        codes[start:start + BATCH_SIZE] = np.select(conditions, [0, 1, 2, 3], 4)
+    return np.array(names)[codes]
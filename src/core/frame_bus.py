@@ -0,0 +1,210 @@
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from .timing import CaptureStats
+
+# Header layout (int64 words) at the start of the shared memory block
+_MAGIC = 0x4652414D45425553  # "FRAMEBUS"
+_HEADER_FIELDS = 6           # magic, height, width, channels, slots, latest sequence
+_LATEST = 5
+
+
+class SharedFrameRing:
+    """
+    A ring of frame slots in shared memory for passing frames between processes.
+
+    The writer publishes frames into fixed-size slots tagged with increasing
+    sequence numbers; readers in any process attach by name and get numpy
+    views of the slots, so no frame is pickled or copied on the way. A slot is
+    only rewritten after ``slots - 1`` newer frames have been published, and
+    every slot carries its own sequence number, so a reader can confirm with
+    ``is_current()`` that the frame it was working on was not overwritten in
+    the meantime (the same idea as a seqlock). Slots also carry the frame's
+    ``time.monotonic()`` capture time, which is comparable across processes
+    on the same machine.
+
+    One process creates the ring with ``create=True`` and owns its lifetime;
+    others attach with the same ``name``.
+    """
+
+    def __init__(self, name, shape=None, slots=4, create=False):
+        self.name = name
+        if create:
+            if shape is None:
+                raise ValueError("shape is required when creating a frame ring")
+            height, width, channels = shape
+            header_size = (_HEADER_FIELDS + 2 * slots) * 8
+            frame_size = height * width * channels
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=header_size + frame_size * slots)
+            header = np.ndarray((_HEADER_FIELDS + slots,), np.int64, self.shm.buf)
+            header[:] = -1
+            header[:_LATEST] = (_MAGIC, height, width, channels, slots)
+        else:
+            self.shm = self._attach(name)
+            header = np.ndarray((_HEADER_FIELDS,), np.int64, self.shm.buf)
+            if header[0] != _MAGIC:
+                self.shm.close()
+                raise ValueError(f"Shared memory block '{name}' is not a frame ring")
+            height, width, channels, slots = (int(v) for v in header[1:5])
+
+        self.owner = create
+        self.shape = (height, width, channels)
+        self.slots = slots
+        self.header = np.ndarray((_HEADER_FIELDS + slots,), np.int64, self.shm.buf)
+        self.slot_sequences = self.header[_HEADER_FIELDS:]
+        self.slot_timestamps = np.ndarray((slots,), np.float64, self.shm.buf, offset=(_HEADER_FIELDS + slots) * 8)
+        self.frames = np.ndarray((slots,) + self.shape, np.uint8, self.shm.buf,
+                                 offset=(_HEADER_FIELDS + 2 * slots) * 8)
+        self._next_sequence = int(self.header[_LATEST]) + 1
+
+    @staticmethod
+    def _attach(name):
+        try:
+            return shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching registers the block with the resource
+            # tracker, which would unlink it when this process exits. Unregistering
+            # afterwards is not enough: spawned children share their parent's
+            # tracker and would drop the owner's registration too.
+            register = resource_tracker.register
+            resource_tracker.register = lambda name, rtype: None
+            try:
+                return shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+
+    @property
+    def latest_sequence(self):
+        return int(self.header[_LATEST])
+
+    def claim(self):
+        """Return ``(sequence, view)`` of the next slot so the writer can fill it in place."""
+        sequence = self._next_sequence
+        slot = sequence % self.slots
+        # Mark the slot as being written
+        self.slot_sequences[slot] = -1
+        return sequence, self.frames[slot]
+
+    def commit(self, sequence, timestamp=None):
+        """Publish a slot obtained from ``claim()``, stamped with its capture time."""
+        self.slot_timestamps[sequence % self.slots] = time.monotonic() if timestamp is None else timestamp
+        self.slot_sequences[sequence % self.slots] = sequence
+        self.header[_LATEST] = sequence
+        self._next_sequence = sequence + 1
+
+    def publish(self, frame, timestamp=None):
+        """Copy ``frame`` into the next slot and publish it; returns its sequence number."""
+        sequence, view = self.claim()
+        np.copyto(view, frame)
+        self.commit(sequence, timestamp)
+        return sequence
+
+    def read_latest(self, after=-1):
+        """Return ``(sequence, view)`` for the newest frame newer than ``after``, or ``(None, None)``."""
+        sequence = self.latest_sequence
+        if sequence <= after or sequence < 0:
+            return None, None
+        slot = sequence % self.slots
+        if self.slot_sequences[slot] != sequence:
+            return None, None
+        return sequence, self.frames[slot]
+
+    def wait_latest(self, after=-1, timeout=1.0, poll_interval=0.0005):
+        """Block until a frame newer than ``after`` is published or ``timeout`` expires."""
+        deadline = time.monotonic() + timeout
+        while True:
+            sequence, view = self.read_latest(after)
+            if sequence is not None or time.monotonic() >= deadline:
+                return sequence, view
+            time.sleep(poll_interval)
+
+    def timestamp(self, sequence):
+        """Capture time of the frame published as ``sequence``."""
+        return float(self.slot_timestamps[sequence % self.slots])
+
+    def is_current(self, sequence):
+        """True while the slot holding ``sequence`` has not been rewritten."""
+        return self.slot_sequences[sequence % self.slots] == sequence
+
+    def close(self):
+        """Detach from the ring; the creating process also removes it."""
+        self.frames = None
+        self.header = None
+        self.slot_sequences = None
+        self.slot_timestamps = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class FrameBusSource:
+    """
+    Capture source that reads the newest frames published to a ``SharedFrameRing``.
+
+    ``read()`` returns a view into shared memory. The view is valid until the
+    writer wraps around the ring; callers that copy it out (e.g. the mirrored
+    flip in ``FramePreprocessor``) can check ``is_current()`` afterwards.
+    ``frame_info`` carries the ring sequence number and the capture time the
+    publisher stamped the frame with.
+    """
+
+    is_live = True
+
+    def __init__(self, name, timeout=1.0):
+        self.ring = SharedFrameRing(name)
+        self.timeout = timeout
+        self.sequence = -1
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.stats = CaptureStats()
+        self.frame_info = None
+        self._opened = True
+
+    def read(self, image=None):
+        sequence, view = self.ring.wait_latest(self.sequence, self.timeout)
+        if sequence is None:
+            return False, None
+        if self.sequence >= 0:
+            self.frames_dropped += sequence - self.sequence - 1
+        self.sequence = sequence
+        self.frames_captured += 1
+        self.frame_info = self.stats.record(sequence, self.ring.timestamp(sequence))
+        return True, view
+
+    def is_current(self):
+        return self.ring.is_current(self.sequence)
+
+    def recycle(self, frame):
+        """Frames are views into shared memory; nothing to recycle."""
+
+    def isOpened(self):
+        return self._opened
+
+    def release(self):
+        if self._opened:
+            self._opened = False
+            self.ring.close()
+
+
+class FrameBusPublisher:
+    """Publish frames to a ``SharedFrameRing`` that is created on the first frame."""
+
+    def __init__(self, name, slots=4):
+        self.name = name
+        self.slots = slots
+        self.ring = None
+
+    def publish(self, frame, timestamp=None):
+        if self.ring is not None and self.ring.shape != frame.shape:
+            self.ring.close()
+            self.ring = None
+        if self.ring is None:
+            self.ring = SharedFrameRing(self.name, frame.shape, self.slots, create=True)
+        return self.ring.publish(frame, timestamp)
+
+    def close(self):
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
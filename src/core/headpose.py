@@ -0,0 +1,214 @@
+import time
+
+import cv2
+import numpy as np
+
+# dlib's 68-point landmark model (download shape_predictor_68_face_landmarks.dat from dlib's website)
+DEFAULT_PREDICTOR_PATH = "shape_predictor_68_face_landmarks.dat"
+
+# 3D model points for the head, and the 68-point landmarks they correspond to
+MODEL_POINTS = np.array([
+    (0.0, 0.0, 0.0),          # Nose tip
+    (0.0, -330.0, -65.0),     # Chin
+    (-225.0, 170.0, -135.0),  # Left eye left corner
+    (225.0, 170.0, -135.0),   # Right eye right corner
+    (-150.0, -150.0, -125.0), # Left mouth corner
+    (150.0, -150.0, -125.0)   # Right mouth corner
+], dtype=np.float32)
+MODEL_LANDMARKS = (30, 8, 36, 45, 48, 54)
+
+# Axis drawn from the nose tip to visualize the pose
+AXIS_POINTS = np.float32([[200, 0, 0], [0, 200, 0], [0, 0, 200]])
+
+
+class HeadPose:
+    """One head-pose estimate: pitch/yaw/roll in degrees, the solvePnP vectors and the command."""
+
+    __slots__ = ('angles', 'rotation_vector', 'translation_vector', 'image_points', 'command', 'tracked')
+
+    def __init__(self, angles, rotation_vector, translation_vector, image_points, command, tracked):
+        self.angles = angles
+        self.rotation_vector = rotation_vector
+        self.translation_vector = translation_vector
+        self.image_points = image_points
+        self.command = command
+        self.tracked = tracked
+
+
+class HeadPoseEstimator:
+    """
+    Head-pose commands from dlib face landmarks, detecting only when needed.
+
+    The HOG face detector runs on a grayscale frame downscaled to
+    ``detect_width`` and only while no face is being tracked (or every
+    ``redetect_interval`` frames, to correct drift; 0 = never). In between,
+    a dlib correlation tracker follows the face box; when its peak-to-sidelobe
+    ratio falls below ``min_tracking_quality`` the face counts as lost and
+    the next frame detects again. ``solvePnP`` is seeded with the previous
+    frame's rotation and translation (``useExtrinsicGuess``), so its
+    iterations start next to the answer.
+
+    ``process()`` returns a ``HeadPose`` whose ``command`` uses the hand
+    controllers' vocabulary: LEFT/RIGHT for yaw beyond ``yaw_threshold``
+    degrees, FORWARD/BACKWARD for pitch (nodding down/up) beyond
+    ``pitch_threshold``, else STOP. Without a face it returns None.
+    """
+
+    def __init__(self, predictor_path=DEFAULT_PREDICTOR_PATH, detect_width=320, redetect_interval=60,
+                 min_tracking_quality=7.0, focal_length=950.0, yaw_threshold=10.0, pitch_threshold=10.0):
+        import dlib
+        self._dlib = dlib
+        self.detector = dlib.get_frontal_face_detector()
+        self.predictor = dlib.shape_predictor(predictor_path)
+        self.detect_width = detect_width
+        self.redetect_interval = redetect_interval
+        self.min_tracking_quality = min_tracking_quality
+        self.focal_length = focal_length
+        self.yaw_threshold = yaw_threshold
+        self.pitch_threshold = pitch_threshold
+
+        self.tracker = None
+        self.frames_since_detection = 0
+        self._pose = None
+        self._camera_matrix = None
+        self._dist_coeffs = np.zeros((4, 1))
+        self._gray = None
+        self._small = None
+
+        self.detections = 0
+        self.frames_tracked = 0
+        self.tracking_lost = 0
+        self.pose_ms = 0.0
+        self.frames_processed = 0
+
+    def reset(self):
+        if self.tracker is not None:
+            self.tracking_lost += 1
+        self.tracker = None
+        self._pose = None
+
+    def _camera(self, width, height):
+        if self._camera_matrix is None or self._camera_matrix[0, 2] != width / 2 or self._camera_matrix[1, 2] != height / 2:
+            self._camera_matrix = np.array([[self.focal_length, 0, width / 2],
+                                            [0, self.focal_length, height / 2],
+                                            [0, 0, 1]], dtype=np.float64)
+            self._pose = None
+        return self._camera_matrix
+
+    def _detect(self, gray):
+        height, width = gray.shape
+        scale = min(1.0, self.detect_width / width) if self.detect_width else 1.0
+        if scale < 1.0:
+            size = (int(width * scale), int(height * scale))
+            if self._small is None or self._small.shape[::-1] != size:
+                self._small = np.empty((size[1], size[0]), np.uint8)
+            cv2.resize(gray, size, dst=self._small, interpolation=cv2.INTER_AREA)
+            faces = self.detector(self._small, 0)
+        else:
+            faces = self.detector(gray, 0)
+        self.detections += 1
+        self.frames_since_detection = 0
+        if not faces:
+            return None
+        # The largest face is the operator's
+        face = max(faces, key=lambda rect: rect.area())
+        return self._dlib.rectangle(int(face.left() / scale), int(face.top() / scale),
+                                    int(face.right() / scale), int(face.bottom() / scale))
+
+    def _face_box(self, gray):
+        if self.tracker is not None and (not self.redetect_interval
+                                         or self.frames_since_detection < self.redetect_interval):
+            quality = self.tracker.update(gray)
+            if quality >= self.min_tracking_quality:
+                self.frames_since_detection += 1
+                self.frames_tracked += 1
+                position = self.tracker.get_position()
+                return self._dlib.rectangle(int(position.left()), int(position.top()),
+                                            int(position.right()), int(position.bottom())), True
+            self.reset()
+
+        face = self._detect(gray)
+        if face is None:
+            self.reset()
+            return None, False
+        self.tracker = self._dlib.correlation_tracker()
+        self.tracker.start_track(gray, face)
+        return face, False
+
+    def process(self, frame):
+        """Estimate the head pose in a BGR ``frame``; return a ``HeadPose`` or None without a face."""
+        started = time.monotonic()
+        self.frames_processed += 1
+        height, width = frame.shape[:2]
+        if self._gray is None or self._gray.shape != (height, width):
+            self._gray = np.empty((height, width), np.uint8)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        face, tracked = self._face_box(gray)
+        if face is None:
+            self._record(started)
+            return None
+        shape = self.predictor(gray, face)
+        image_points = np.array([(shape.part(i).x, shape.part(i).y) for i in MODEL_LANDMARKS], dtype=np.float32)
+
+        camera_matrix = self._camera(width, height)
+        if self._pose is not None:
+            rotation_vector, translation_vector = self._pose
+            ok, rotation_vector, translation_vector = cv2.solvePnP(
+                MODEL_POINTS, image_points, camera_matrix, self._dist_coeffs,
+                rvec=rotation_vector, tvec=translation_vector, useExtrinsicGuess=True)
+        else:
+            ok, rotation_vector, translation_vector = cv2.solvePnP(
+                MODEL_POINTS, image_points, camera_matrix, self._dist_coeffs)
+        if not ok:
+            self.reset()
+            self._record(started)
+            return None
+        self._pose = (rotation_vector, translation_vector)
+
+        rotation_matrix, _ = cv2.Rodrigues(rotation_vector)
+        angles = list(cv2.RQDecomp3x3(rotation_matrix)[0])
+        # The model's y axis points up and the image's down, so a level head
+        # decomposes to a pitch near +-180; fold it back around 0
+        if angles[0] > 90:
+            angles[0] -= 180
+        elif angles[0] < -90:
+            angles[0] += 180
+
+        pose = HeadPose(tuple(angles), rotation_vector, translation_vector, image_points,
+                        self.command(angles), tracked)
+        self._record(started)
+        return pose
+
+    def command(self, angles):
+        pitch, yaw = angles[0], angles[1]
+        if yaw < -self.yaw_threshold:
+            return "LEFT"
+        if yaw > self.yaw_threshold:
+            return "RIGHT"
+        if pitch < -self.pitch_threshold:
+            return "FORWARD"
+        if pitch > self.pitch_threshold:
+            return "BACKWARD"
+        return "STOP"
+
+    def _record(self, started):
+        latency = (time.monotonic() - started) * 1000.0
+        if self.frames_processed == 1:
+            self.pose_ms = latency
+        else:
+            self.pose_ms += (latency - self.pose_ms) / 16
+
+    def draw(self, frame, pose):
+        """Draw the pose axis from the nose tip on ``frame``."""
+        imgpts, _ = cv2.projectPoints(AXIS_POINTS, pose.rotation_vector, pose.translation_vector,
+                                      self._camera_matrix, self._dist_coeffs)
+        nose_tip = tuple(map(int, pose.image_points[0]))
+        imgpts = np.int32(imgpts).reshape(-1, 2)
+        cv2.line(frame, nose_tip, tuple(imgpts[0]), (0, 0, 255), 3)  # X-axis (Red)
+        cv2.line(frame, nose_tip, tuple(imgpts[1]), (0, 255, 0), 3)  # Y-axis (Green)
+        cv2.line(frame, nose_tip, tuple(imgpts[2]), (255, 0, 0), 3)  # Z-axis (Blue)
+
+    def summary(self):
+        return (f"{self.detections} detections, {self.frames_tracked} tracked frames, "
+                f"{self.tracking_lost} times lost, {self.pose_ms:.1f} ms per frame")
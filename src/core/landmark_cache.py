@@ -0,0 +1,205 @@
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+from .capture import SESSION_MANIFEST, IMAGE_EXTENSIONS
+from .landmarks import Classification, Handedness, HandLandmarks, Landmark, LandmarkResult
+
+# Where replay runs keep their landmarks
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'gesture-control', 'landmarks')
+
+# Handedness labels stored as small integers
+LABELS = ('Left', 'Right')
+UNKNOWN_LABEL = len(LABELS)
+
+
+def clip_hash(source):
+    """Content hash of a replayable clip (video file, image directory or recorded session), or None."""
+    if not isinstance(source, str):
+        return None
+    digest = hashlib.sha1()
+    if os.path.isfile(source):
+        files = [source]
+    elif os.path.isdir(source):
+        files = sorted(os.path.join(source, name) for name in os.listdir(source)
+                       if name.lower().endswith(IMAGE_EXTENSIONS) or name == SESSION_MANIFEST)
+    else:
+        return None
+    for path in files:
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ClipLandmarks:
+    """
+    Cached landmark results of one clip under one set of detection settings.
+
+    ``get(index)`` returns the ``LandmarkResult`` stored for frame ``index``
+    (full-frame coordinates, no ``context``), or None on a miss;
+    ``put(index, result)`` stores a fresh result. ``save()`` writes the
+    entry as float32/uint8 arrays: all hands' landmarks as one
+    ``(hands, 21, 3)`` array plus a hand count per cached frame.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.frames = {}
+        self.dirty = False
+        if os.path.exists(path):
+            try:
+                self._load()
+                # Recently used entries are evicted last
+                os.utime(path)
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+                # A damaged entry costs a rerun of inference, never the run itself
+                print(f"Ignoring unreadable landmark cache {path}: {e}")
+                self.frames = {}
+
+    def _load(self):
+        with np.load(self.path) as data:
+            landmarks, counts = data['landmarks'], data['hand_counts']
+            labels, scores = data['labels'], data['scores']
+            start = 0
+            for index, count in zip(data['frames'].tolist(), counts.tolist()):
+                end = start + count
+                self.frames[index] = (landmarks[start:end], labels[start:end], scores[start:end])
+                start = end
+
+    def get(self, index):
+        entry = self.frames.get(index)
+        if entry is None:
+            return None
+        landmarks, labels, scores = entry
+        hands = [HandLandmarks([Landmark(float(x), float(y), float(z)) for x, y, z in hand]) for hand in landmarks]
+        handedness = [Handedness([Classification(int(label), LABELS[label] if label < len(LABELS) else '',
+                                                 float(score))])
+                      for label, score in zip(labels.tolist(), scores.tolist())]
+        return LandmarkResult(hands, handedness)
+
+    def put(self, index, result):
+        hands = result.multi_hand_landmarks or ()
+        landmarks = np.array([[(point.x, point.y, point.z) for point in hand.landmark] for hand in hands],
+                             np.float32).reshape(len(hands), 21, 3)
+        labels = np.full(len(hands), UNKNOWN_LABEL, np.uint8)
+        scores = np.ones(len(hands), np.float32)
+        for i, hand in enumerate((result.multi_handedness or ())[:len(hands)]):
+            if hand.classification:
+                classification = hand.classification[0]
+                labels[i] = LABELS.index(classification.label) if classification.label in LABELS else UNKNOWN_LABEL
+                scores[i] = classification.score
+        self.frames[index] = (landmarks, labels, scores)
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        indices = sorted(self.frames)
+        entries = [self.frames[index] for index in indices]
+        empty = np.zeros((0, 21, 3), np.float32)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Write to a temporary file of this writer first, so a crash or another
+        # process saving the same entry never leaves a truncated one; the
+        # suffix keeps it out of eviction while it is written
+        fd, temporary = tempfile.mkstemp(prefix=os.path.basename(self.path) + '.', suffix='.tmp',
+                                         dir=os.path.dirname(self.path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f,
+                         frames=np.array(indices, np.int32),
+                         hand_counts=np.array([len(entry[0]) for entry in entries], np.uint8),
+                         landmarks=np.concatenate([entry[0] for entry in entries] or [empty]),
+                         labels=np.concatenate([entry[1] for entry in entries] or [np.zeros(0, np.uint8)]),
+                         scores=np.concatenate([entry[2] for entry in entries] or [np.zeros(0, np.float32)]))
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self.dirty = False
+
+
+class LandmarkCache:
+    """
+    Persistent landmark results for replayed clips.
+
+    Tuning zones or thresholds against a recording reruns the same frames
+    through the same model. ``open(clip, params)`` returns the
+    ``ClipLandmarks`` for a clip's content hash (``clip_hash()``) and the
+    detection settings ``params`` (a JSON-serializable dict), so a second
+    run with the same settings reads every landmark from disk and never runs
+    inference; any settings change selects a different entry. Entries live
+    as ``.npz`` files in ``directory``; after each ``close()`` the least
+    recently used ones are deleted until the total is below ``max_bytes``.
+    Only synchronous backends are cached, since asynchronous results are not
+    tied to a frame index.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.entry = None
+
+    def open(self, clip, params):
+        """Switch to the entry for ``clip`` (a content hash) under ``params``, saving the previous one."""
+        self.close()
+        key = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+        self.entry = ClipLandmarks(os.path.join(self.directory, f"{clip[:16]}-{key}.npz"))
+        return self.entry
+
+    def get(self, index):
+        result = self.entry.get(index)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def put(self, index, result):
+        self.entry.put(index, result)
+
+    def close(self):
+        """Save the current entry and evict old entries beyond ``max_bytes``."""
+        if self.entry is None:
+            return
+        try:
+            self.entry.save()
+        except OSError as e:
+            print(f"Failed to save landmark cache: {e}")
+        self.entry = None
+        self.evict()
+
+    def evict(self):
+        try:
+            paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                     if name.endswith('.npz')]
+            entries = sorted((os.path.getmtime(path), os.path.getsize(path), path) for path in paths)
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evicted += 1
+
+    @property
+    def hit_ratio(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self):
+        return (f"{self.hits} hits, {self.misses} misses ({self.hit_ratio:.0%} hit ratio), "
+                f"{self.evicted} entries evicted")
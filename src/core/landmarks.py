@@ -0,0 +1,255 @@
+import os
+import threading
+import time
+
+import cv2
+
+# Backend names accepted by create_landmark_backend() and settings.json
+BACKEND_SOLUTIONS = 'solutions'  # Legacy mp.solutions.hands.Hands, synchronous
+BACKEND_TASKS = 'tasks'          # Tasks HandLandmarker in LIVE_STREAM mode, asynchronous
+
+# Model bundle for the Tasks backend (download hand_landmarker.task from the
+# MediaPipe model page into this directory)
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'models',
+                                  'hand_landmarker.task')
+
+# The 21-point hand skeleton, the same connections MediaPipe draws
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+)
+
+
+class Landmark:
+    """One normalized landmark, shaped like the legacy ``NormalizedLandmark``."""
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class HandLandmarks:
+    """The 21 normalized landmarks of one hand, shaped like the legacy ``NormalizedLandmarkList``."""
+
+    __slots__ = ('landmark',)
+
+    def __init__(self, landmark):
+        self.landmark = landmark
+
+
+class Classification:
+    __slots__ = ('index', 'label', 'score')
+
+    def __init__(self, index, label, score):
+        self.index = index
+        self.label = label
+        self.score = score
+
+
+class Handedness:
+    """Handedness of one hand, shaped like the legacy ``ClassificationList``."""
+
+    __slots__ = ('classification',)
+
+    def __init__(self, classification):
+        self.classification = classification
+
+
+class LandmarkResult:
+    """
+    Hand landmarks for one frame, independent of the backend that produced them.
+
+    ``multi_hand_landmarks`` and ``multi_handedness`` follow the legacy
+    ``Hands.process()`` result: lists with one entry per hand, or None when
+    no hand was found, so existing classification code reads them unchanged.
+    ``context`` is the value passed to ``process()`` with the frame the
+    result belongs to, which matters for asynchronous backends whose results
+    arrive a frame or two later (e.g. the ROI the frame was cropped to).
+    """
+
+    __slots__ = ('multi_hand_landmarks', 'multi_handedness', 'context', 'timestamp_ms')
+
+    def __init__(self, multi_hand_landmarks=None, multi_handedness=None, context=None, timestamp_ms=None):
+        self.multi_hand_landmarks = multi_hand_landmarks or None
+        self.multi_handedness = multi_handedness or None
+        self.context = context
+        self.timestamp_ms = timestamp_ms
+
+
+class LandmarkBackend:
+    """
+    Interface between the frame loop and a hand landmark model.
+
+    ``process(rgb_frame, context)`` submits an RGB frame and returns a
+    ``LandmarkResult``, or None if no new result is available yet. Synchronous
+    backends return the result for the submitted frame. Asynchronous backends
+    return immediately with the newest result that arrived since the last
+    call, so inference overlaps with capture and drawing; callers keep using
+    their previous result when None is returned. ``inference_ms`` is a
+    smoothed submit-to-result time and ``frames_submitted`` /
+    ``results_received`` count the traffic.
+    """
+
+    name = None
+    asynchronous = False
+
+    def __init__(self):
+        self.frames_submitted = 0
+        self.results_received = 0
+        self.inference_ms = 0.0
+
+    def _record_latency(self, started):
+        latency = (time.monotonic() - started) * 1000.0
+        if self.results_received == 0:
+            self.inference_ms = latency
+        else:
+            self.inference_ms += (latency - self.inference_ms) / 16
+        self.results_received += 1
+
+    def process(self, rgb_frame, context=None):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SolutionsBackend(LandmarkBackend):
+    """The legacy ``mp.solutions.hands.Hands`` graph; ``process()`` blocks for the full inference."""
+
+    name = BACKEND_SOLUTIONS
+
+    def __init__(self, min_detection_confidence=0.7, min_tracking_confidence=0.7, max_num_hands=2,
+                 model_complexity=1, **unused):
+        super().__init__()
+        import mediapipe as mp
+        self.hands = mp.solutions.hands.Hands(
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            max_num_hands=max_num_hands,
+            model_complexity=model_complexity
+        )
+
+    def process(self, rgb_frame, context=None):
+        started = time.monotonic()
+        self.frames_submitted += 1
+        result = self.hands.process(rgb_frame)
+        self._record_latency(started)
+        return LandmarkResult(result.multi_hand_landmarks, result.multi_handedness, context)
+
+    def close(self):
+        self.hands.close()
+
+
+class TasksBackend(LandmarkBackend):
+    """
+    The Tasks ``HandLandmarker`` in LIVE_STREAM mode.
+
+    Frames are submitted with ``detect_async()`` and results are delivered to
+    a callback on MediaPipe's own thread, so ``process()`` returns as soon as
+    the frame is queued. While the graph is busy MediaPipe drops newly
+    submitted frames itself, so the loop never builds a backlog. ``context``
+    values are kept per submitted timestamp and handed back with the result.
+    """
+
+    name = BACKEND_TASKS
+    asynchronous = True
+
+    def __init__(self, min_detection_confidence=0.7, min_tracking_confidence=0.7, max_num_hands=2,
+                 model_path=DEFAULT_MODEL_PATH, **unused):
+        super().__init__()
+        import mediapipe as mp
+        self._mp = mp
+        if not hasattr(getattr(getattr(mp, 'tasks', None), 'vision', None), 'HandLandmarker'):
+            raise RuntimeError(f"The tasks backend needs mediapipe 0.10 or later (installed: "
+                               f"{getattr(mp, '__version__', 'unknown')}); install the 'tasks' extra")
+        if not os.path.isfile(model_path):
+            raise FileNotFoundError(f"Hand landmarker model not found: {model_path}")
+
+        vision = mp.tasks.vision
+        options = vision.HandLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_tracking_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            result_callback=self._on_result
+        )
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._latest = None
+        self._last_timestamp_ms = -1
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+
+    def _on_result(self, result, image, timestamp_ms):
+        with self._lock:
+            submitted = self._pending.pop(timestamp_ms, None)
+            # Frames MediaPipe dropped before this one never produce a result
+            for stale in [t for t in self._pending if t < timestamp_ms]:
+                del self._pending[stale]
+        context, started = submitted if submitted is not None else (None, time.monotonic())
+
+        hands = [HandLandmarks(landmarks) for landmarks in result.hand_landmarks]
+        handedness = [
+            Handedness([Classification(c.index, c.category_name, c.score) for c in categories])
+            for categories in result.handedness
+        ]
+        with self._lock:
+            self._record_latency(started)
+            self._latest = LandmarkResult(hands, handedness, context, timestamp_ms)
+
+    def process(self, rgb_frame, context=None):
+        # Timestamps must increase strictly; use the submit time in milliseconds
+        timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        with self._lock:
+            self._pending[timestamp_ms] = (context, time.monotonic())
+        self.frames_submitted += 1
+        # mp.Image copies the pixels, so the caller may reuse rgb_frame right away
+        self.landmarker.detect_async(self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=rgb_frame),
+                                     timestamp_ms)
+
+        with self._lock:
+            result, self._latest = self._latest, None
+        return result
+
+    def close(self):
+        self.landmarker.close()
+
+
+BACKENDS = {
+    BACKEND_SOLUTIONS: SolutionsBackend,
+    BACKEND_TASKS: TasksBackend,
+}
+
+
+def create_landmark_backend(backend=BACKEND_SOLUTIONS, **params):
+    """
+    Create a landmark backend by name.
+
+    ``params`` are the detection settings (``min_detection_confidence``,
+    ``min_tracking_confidence``, ``max_num_hands``, ``model_complexity``,
+    ``model_path``); each backend uses the ones it supports.
+    """
+    try:
+        backend_class = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown landmark backend: {backend} (expected one of {', '.join(BACKENDS)})")
+    return backend_class(**params)
+
+
+def draw_landmarks(image, hand_landmarks, connection_color=(224, 224, 224), landmark_color=(0, 0, 255)):
+    """Draw one hand's skeleton on a BGR image, in the style of MediaPipe's drawing utilities."""
+    height, width = image.shape[:2]
+    points = [(int(point.x * width), int(point.y * height)) for point in hand_landmarks.landmark]
+    for start, end in HAND_CONNECTIONS:
+        cv2.line(image, points[start], points[end], connection_color, 2)
+    for point in points:
+        cv2.circle(image, point, 3, (224, 224, 224), 2)
+        cv2.circle(image, point, 2, landmark_color, 2)
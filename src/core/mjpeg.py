@@ -0,0 +1,202 @@
+import threading
+import time
+import urllib.request
+
+import cv2
+import numpy as np
+
+from .timing import CaptureStats
+
+# cv2.imdecode flags for each supported decode scale
+DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+class MJPEGStreamReader:
+    """
+    Low-latency reader for MJPEG-over-HTTP cameras such as phone IP-camera apps.
+
+    A background thread parses the ``multipart/x-mixed-replace`` stream and
+    keeps only the newest JPEG; older parts are discarded without being
+    decoded and counted in ``frames_dropped``. ``read()`` decodes the newest
+    JPEG on demand, optionally at a reduced scale (2, 4 or 8) which makes
+    decoding much cheaper. The reader follows the ``cv2.VideoCapture``
+    ``read()``/``isOpened()``/``release()`` calls so it can replace one.
+
+    If a part carries an ``X-Timestamp`` header (``time.monotonic()`` on the
+    sender), it is exposed as ``timestamp`` for latency measurements.
+    Independently, every part is stamped with a sequence number and its local
+    arrival time, available as ``frame_info`` after ``read()``.
+    """
+
+    is_live = True
+
+    def __init__(self, url, scale=1, timeout=5.0, reconnect_delay=1.0):
+        if scale not in DECODE_FLAGS:
+            raise ValueError(f"Unsupported decode scale: {scale}")
+        self.url = url
+        self.scale = scale
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.frames_decoded = 0
+        self.decode_failures = 0
+        self.connected = False
+        self.timestamp = None
+        self.stats = CaptureStats()
+        self.frame_info = None
+
+        # Single-slot buffer with the newest undecoded JPEG
+        self._condition = threading.Condition()
+        self._jpeg = None
+        self._jpeg_timestamp = None
+        self._jpeg_stamp = None
+        self._response = None
+        self._thread = None
+        self.running = False
+
+    def start(self):
+        """Start the reader thread."""
+        if self._thread is not None:
+            return self
+        self.running = True
+        self._thread = threading.Thread(target=self._reader_loop, name="MJPEGStreamReader", daemon=True)
+        self._thread.start()
+        return self
+
+    def _reader_loop(self):
+        while self.running:
+            try:
+                self._response = urllib.request.urlopen(self.url, timeout=self.timeout)
+                content_type = self._response.headers.get('Content-Type', '')
+                self.connected = True
+                self._parse_stream(self._response, self._boundary(content_type))
+            except Exception as e:
+                if self.running:
+                    print(f"MJPEG stream error: {e}")
+            finally:
+                self.connected = False
+                if self._response is not None:
+                    self._response.close()
+                    self._response = None
+
+            if self.running:
+                time.sleep(self.reconnect_delay)
+
+    @staticmethod
+    def _boundary(content_type):
+        for param in content_type.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.lower() == 'boundary':
+                return value.strip('"').encode()
+        return None
+
+    def _is_boundary(self, line, boundary):
+        line = line.strip()
+        if boundary is None:
+            return line.startswith(b'--')
+        return line.lstrip(b'-').startswith(boundary.lstrip(b'-'))
+
+    def _parse_stream(self, stream, boundary):
+        at_boundary = False
+        while self.running:
+            # Skip forward to the next part boundary
+            if not at_boundary:
+                line = stream.readline()
+                if not line:
+                    return
+                if not self._is_boundary(line, boundary):
+                    continue
+
+            # Part headers
+            headers = {}
+            while True:
+                line = stream.readline()
+                if not line:
+                    return
+                line = line.strip()
+                if not line:
+                    break
+                name, _, value = line.partition(b':')
+                headers[name.strip().lower()] = value.strip()
+
+            length = headers.get(b'content-length')
+            if length:
+                jpeg = stream.read(int(length))
+                at_boundary = False
+            else:
+                # No length given: the JPEG runs until the next boundary line
+                chunks = []
+                while True:
+                    line = stream.readline()
+                    if not line:
+                        return
+                    if self._is_boundary(line, boundary):
+                        break
+                    chunks.append(line)
+                jpeg = b''.join(chunks).rstrip(b'\r\n')
+                at_boundary = True
+
+            timestamp = headers.get(b'x-timestamp')
+            self._publish(jpeg, float(timestamp) if timestamp else None)
+
+    def _publish(self, jpeg, timestamp):
+        arrived_at = time.monotonic()
+        with self._condition:
+            if self._jpeg is not None:
+                # The previous JPEG was never read
+                self.frames_dropped += 1
+            self._jpeg = jpeg
+            self._jpeg_timestamp = timestamp
+            self._jpeg_stamp = (self.frames_captured, arrived_at)
+            self.frames_captured += 1
+            self._condition.notify_all()
+
+    def read(self, image=None, timeout=1.0):
+        """Decode and return ``(ret, frame)`` for the newest JPEG not yet read."""
+        with self._condition:
+            if self._jpeg is None and self.running:
+                self._condition.wait_for(lambda: self._jpeg is not None or not self.running, timeout)
+            jpeg = self._jpeg
+            timestamp = self._jpeg_timestamp
+            stamp = self._jpeg_stamp
+            self._jpeg = None
+        if jpeg is None:
+            return False, None
+
+        frame = cv2.imdecode(np.frombuffer(jpeg, np.uint8), DECODE_FLAGS[self.scale])
+        if frame is None:
+            self.decode_failures += 1
+            return False, None
+        self.frames_decoded += 1
+        self.timestamp = timestamp
+        self.frame_info = self.stats.record(*stamp)
+        return True, frame
+
+    def recycle(self, frame):
+        """Decoded frames are not pooled; present for capture API compatibility."""
+
+    def isOpened(self):
+        return self.running
+
+    def release(self):
+        """Stop the reader thread and close the connection."""
+        with self._condition:
+            self.running = False
+            self._jpeg = None
+            self._condition.notify_all()
+        response = self._response
+        if response is not None:
+            try:
+                response.close()
+            except Exception:
+                pass
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
@@ -0,0 +1,196 @@
+import json
+import socket
+import struct
+import threading
+import time
+
+import cv2
+
+from .landmarks import Classification, Handedness, HandLandmarks, Landmark, LandmarkBackend, LandmarkResult
+
+BACKEND_REMOTE = 'remote'
+
+# Default address of the inference server
+DEFAULT_PORT = 5600
+
+# Message header: type, sequence number, client capture time, payload length
+HEADER = struct.Struct('!BIdI')
+MESSAGE_FRAME = 1    # Client -> server, payload is a JPEG
+MESSAGE_RESULT = 2   # Server -> client, payload is JSON
+
+
+def send_message(sock, kind, sequence, timestamp, payload):
+    sock.sendall(HEADER.pack(kind, sequence, timestamp, len(payload)) + payload)
+
+
+def _recv_exactly(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        data += chunk
+    return bytes(data)
+
+
+def recv_message(sock):
+    """Return ``(kind, sequence, timestamp, payload)`` for the next message on ``sock``."""
+    kind, sequence, timestamp, size = HEADER.unpack(_recv_exactly(sock, HEADER.size))
+    return kind, sequence, timestamp, _recv_exactly(sock, size)
+
+
+def pack_result(result):
+    """Landmarks and handedness of a ``LandmarkResult`` as JSON-friendly lists."""
+    if result is None:
+        return {'hands': None, 'handedness': None}
+    return {
+        'hands': [[(point.x, point.y, point.z) for point in hand.landmark]
+                  for hand in result.multi_hand_landmarks or ()],
+        'handedness': [[(c.index, c.label, c.score) for c in hand.classification]
+                       for hand in result.multi_handedness or ()],
+    }
+
+
+def unpack_result(message, context=None):
+    if message['hands'] is None:
+        return None
+    return LandmarkResult([HandLandmarks([Landmark(*point) for point in hand]) for hand in message['hands']],
+                          [Handedness([Classification(*c) for c in hand]) for hand in message['handedness']],
+                          context)
+
+
+def parse_address(value, default_port=DEFAULT_PORT):
+    host, _, port = value.rpartition(':') if ':' in value else (value, None, None)
+    return host or '127.0.0.1', int(port) if port else default_port
+
+
+class RemoteBackend(LandmarkBackend):
+    """
+    Landmark backend that offloads inference to an inference server.
+
+    ``process()`` JPEG-encodes the (downscaled) RGB frame and streams it to
+    the server; a receiver thread collects the replies. At most one frame is
+    in flight: while the server is busy with it, newer frames replace each
+    other in a single pending slot and only the newest one is sent when the
+    reply arrives, so a slow link or a loaded server adds no queueing delay
+    (``frames_dropped`` counts the replaced frames). Like other asynchronous
+    backends, ``process()`` returns the newest result that arrived since the
+    last call, or None.
+
+    The server also returns the command it classified for the frame
+    (``command``), its own queueing and inference time (``server_ms``), and
+    ``round_trip_ms`` is the smoothed time from submitting a frame to
+    receiving its landmarks. A frame that gets no reply within
+    ``reply_timeout`` seconds is given up (``replies_lost``): the next call
+    returns an empty result, so the robot stops, and sends the newest frame.
+    """
+
+    name = BACKEND_REMOTE
+    asynchronous = True
+
+    def __init__(self, address=f'127.0.0.1:{DEFAULT_PORT}', jpeg_quality=80, timeout=5.0, reply_timeout=1.0,
+                 **unused):
+        super().__init__()
+        self.address = parse_address(address)
+        self.jpeg_quality = jpeg_quality
+        self.reply_timeout = reply_timeout
+        self.frames_dropped = 0
+        self.replies_lost = 0
+        self.command = "STOP"
+        self.server_ms = 0.0
+        self.round_trip_ms = 0.0
+        self.connected = False
+
+        self.sock = socket.create_connection(self.address, timeout=timeout)
+        self.sock.settimeout(None)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connected = True
+
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._in_flight = None
+        self._in_flight_since = 0.0
+        self._pending = None
+        self._contexts = {}
+        self._latest = None
+        self._running = True
+        self._receiver = threading.Thread(target=self._receive_loop, name="RemoteBackend", daemon=True)
+        self._receiver.start()
+
+    def _send(self, frame):
+        sequence, timestamp, jpeg = frame
+        self._in_flight = sequence
+        self._in_flight_since = time.monotonic()
+        send_message(self.sock, MESSAGE_FRAME, sequence, timestamp, jpeg)
+
+    def process(self, rgb_frame, context=None):
+        if not self.connected:
+            # Without a server there are no landmarks: report no hands so the robot stops
+            return LandmarkResult(context=context)
+        ok, jpeg = cv2.imencode('.jpg', rgb_frame, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+        if not ok:
+            return None
+        with self._lock:
+            self._sequence += 1
+            self.frames_submitted += 1
+            self._contexts[self._sequence] = context
+            frame = (self._sequence, time.monotonic(), jpeg.tobytes())
+            if self._in_flight is not None and frame[1] - self._in_flight_since > self.reply_timeout:
+                # The server lost this frame: report no hands until it answers again
+                self.replies_lost += 1
+                self._contexts.pop(self._in_flight, None)
+                self._in_flight = None
+                self._latest = LandmarkResult(context=context)
+                # The frame waiting behind it is older than this one; sending it
+                # later would reach the server's tracking model out of order
+                if self._pending is not None:
+                    self.frames_dropped += 1
+                    self._contexts.pop(self._pending[0], None)
+                    self._pending = None
+            if self._in_flight is None:
+                try:
+                    self._send(frame)
+                except OSError:
+                    self.connected = False
+            else:
+                if self._pending is not None:
+                    self.frames_dropped += 1
+                    self._contexts.pop(self._pending[0], None)
+                self._pending = frame
+            result, self._latest = self._latest, None
+        return result
+
+    def _receive_loop(self):
+        try:
+            while self._running:
+                kind, sequence, timestamp, payload = recv_message(self.sock)
+                if kind != MESSAGE_RESULT:
+                    continue
+                message = json.loads(payload)
+                with self._lock:
+                    if sequence != self._in_flight:
+                        # Reply to a frame that was already given up
+                        continue
+                    context = self._contexts.pop(sequence, None)
+                    self._record_latency(timestamp)
+                    self.round_trip_ms = self.inference_ms
+                    self.server_ms = message.get('server_ms', 0.0)
+                    self.command = message.get('command', "STOP")
+                    self._latest = unpack_result(message, context) or LandmarkResult(context=context)
+                    self._in_flight = None
+                    if self._pending is not None:
+                        frame, self._pending = self._pending, None
+                        self._send(frame)
+        except (ConnectionError, OSError) as e:
+            self.connected = False
+            if self._running:
+                print(f"Inference server connection lost: {e}")
+
+    def close(self):
+        self._running = False
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        self._receiver.join(timeout=1.0)
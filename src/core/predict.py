@@ -0,0 +1,108 @@
+import numpy as np
+
+from .landmarks import HandLandmarks, Landmark, LandmarkResult
+
+
+class LandmarkPredictor:
+    """
+    Predict hand landmarks on the frames between inferences.
+
+    Full inference runs on every ``cadence``-th frame only. ``observe()`` is
+    called with each inferred result and keeps a constant-velocity model of
+    all 21 landmarks per hand; on the frames in between ``predict()``
+    extrapolates them to the frame's capture time, so the zone and angle
+    classification keeps following a moving hand.
+
+    The cadence adapts to how well the model predicts: on each observation
+    the landmarks are compared with where the model expected them, and the
+    cadence goes up (up to ``max_cadence``) while the mean error stays under
+    half of ``tolerance`` and down while it exceeds ``tolerance`` (normalized
+    image units). Fast or jerky motion therefore drops back to inferring every
+    frame. Without a tracked hand the cadence is 1 so a new hand is picked up
+    on the next frame. Prediction never extrapolates more than ``max_horizon``
+    seconds past the last observation.
+    """
+
+    # Weight of the newest velocity measurement; the rest is the previous estimate
+    VELOCITY_GAIN = 0.6
+
+    def __init__(self, max_cadence=3, tolerance=0.01, max_horizon=0.2):
+        self.max_cadence = max_cadence
+        self.tolerance = tolerance
+        self.max_horizon = max_horizon
+        self.cadence = 1
+        self.last_error = None
+
+        self.frames_observed = 0
+        self.frames_predicted = 0
+        self._positions = None
+        self._velocity = None
+        self._timestamp = None
+        self._handedness = None
+        self._frames_since = 0
+
+    def due(self, cadence=None):
+        """Return True if the next frame should be inferred rather than predicted."""
+        cadence = max(self.cadence, cadence or 1)
+        return self._frames_since + 1 >= cadence
+
+    @staticmethod
+    def _positions_of(result):
+        return np.array([[(point.x, point.y, point.z) for point in hand.landmark]
+                         for hand in result.multi_hand_landmarks], dtype=np.float32)
+
+    def observe(self, result, timestamp):
+        """Update the motion model with an inferred result captured at ``timestamp`` (seconds)."""
+        self.frames_observed += 1
+        self._frames_since = 0
+        if result is None or not result.multi_hand_landmarks:
+            self.reset()
+            return
+
+        positions = self._positions_of(result)
+        previous = self._positions
+        if previous is not None and previous.shape == positions.shape and timestamp > self._timestamp:
+            dt = timestamp - self._timestamp
+            expected = previous + self._velocity * min(dt, self.max_horizon)
+            self.last_error = float(np.mean(np.abs(expected[..., :2] - positions[..., :2])))
+            if self.last_error > self.tolerance:
+                self.cadence = max(1, self.cadence - 1)
+            elif self.last_error < self.tolerance / 2:
+                self.cadence = min(self.max_cadence, self.cadence + 1)
+
+            velocity = (positions - previous) / dt
+            self._velocity += (velocity - self._velocity) * self.VELOCITY_GAIN
+        else:
+            # New hand or a different number of hands: start from rest
+            self._velocity = np.zeros_like(positions)
+            self.cadence = 1
+
+        self._positions = positions
+        self._timestamp = timestamp
+        self._handedness = result.multi_handedness
+
+    def predict(self, timestamp):
+        """Return the landmarks extrapolated to ``timestamp``, or None without a tracked hand."""
+        self._frames_since += 1
+        if self._positions is None:
+            return None
+        self.frames_predicted += 1
+
+        dt = min(max(timestamp - self._timestamp, 0.0), self.max_horizon)
+        positions = self._positions + self._velocity * dt
+        hands = [HandLandmarks([Landmark(float(x), float(y), float(z)) for x, y, z in hand])
+                 for hand in positions]
+        return LandmarkResult(hands, self._handedness)
+
+    def reset(self):
+        """Forget the tracked hands (hand lost, or the model was rebuilt)."""
+        self._positions = None
+        self._velocity = None
+        self._timestamp = None
+        self._handedness = None
+        self.cadence = 1
+
+    @property
+    def predict_ratio(self):
+        total = self.frames_observed + self.frames_predicted
+        return self.frames_predicted / total if total else 0.0
@@ -0,0 +1,64 @@
+import cv2
+
+from .buffers import BufferRing
+
+
+class FramePreprocessor:
+    """
+    Mirror captured frames and prepare the RGB inference input using reusable buffers.
+
+    ``process()`` returns the mirrored BGR frame used for drawing and display,
+    and the RGB frame handed to MediaPipe. Both live in preallocated buffers
+    that are written with ``dst=``, so steady-state processing does not
+    allocate any frame-sized arrays. The display frame comes from a small ring
+    so that a QImage still waiting in the GUI thread's event queue is not
+    overwritten by the next frame.
+
+    When ``inference_width`` is set and smaller than the captured width, the
+    inference frame is downscaled once (keeping the aspect ratio) before the
+    colour conversion. MediaPipe returns normalized landmarks, so everything
+    downstream keeps working in full-resolution display coordinates.
+
+    An optional pixel ``region`` crops the inference frame, see ``HandROITracker``.
+    """
+
+    def __init__(self, display_buffers=4, inference_width=0):
+        self.inference_width = inference_width
+        self.display_ring = BufferRing(display_buffers)
+        self.inference_ring = BufferRing(1)
+        self.rgb_ring = BufferRing(1)
+
+    def inference_size(self, width, height):
+        """Return the ``(width, height)`` MediaPipe is fed for a frame of the given size."""
+        if not self.inference_width or self.inference_width >= width:
+            return width, height
+        return self.inference_width, max(1, round(height * self.inference_width / width))
+
+    def process(self, captured, region=None):
+        frame = self.mirror(captured)
+        return frame, self.prepare_inference(frame, region)
+
+    def mirror(self, captured):
+        """Return the mirrored display frame without preparing the inference input."""
+        # Flip frame for a mirrored effect
+        return cv2.flip(captured, 1, dst=self.display_ring.next(captured.shape))
+
+    def prepare_inference(self, frame, region=None):
+        """Return the RGB inference frame for ``frame``, optionally cropped to a pixel ``region``."""
+        source = frame
+        if region is not None:
+            x, y, w, h = region
+            source = frame[y:y + h, x:x + w]
+
+        height, width = source.shape[:2]
+        inference_width, inference_height = self.inference_size(width, height)
+        if (inference_width, inference_height) != (width, height):
+            source = cv2.resize(source, (inference_width, inference_height),
+                                dst=self.inference_ring.next((inference_height, inference_width) + frame.shape[2:]),
+                                interpolation=cv2.INTER_AREA)
+
+        return cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=self.rgb_ring.next(source.shape))
+
+    @property
+    def allocations(self):
+        return self.display_ring.allocations + self.inference_ring.allocations + self.rgb_ring.allocations
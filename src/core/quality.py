@@ -0,0 +1,175 @@
+import time
+
+# Inference widths the controller steps down through, largest first
+WIDTH_STEPS = (960, 640, 480, 320)
+
+# Below this width the controller first gives up model complexity and extra hands
+COARSE_WIDTH = 480
+
+
+class QualityLevel:
+    """
+    One setting of the quality knobs.
+
+    ``inference_width`` is the width of the frame passed to the model (0 =
+    full resolution), ``model_complexity`` and ``max_num_hands`` are the
+    landmark model parameters, and ``cadence`` runs inference on every
+    ``cadence``-th frame only, reusing the previous result in between.
+    """
+
+    __slots__ = ('inference_width', 'model_complexity', 'max_num_hands', 'cadence')
+
+    def __init__(self, inference_width=0, model_complexity=1, max_num_hands=2, cadence=1):
+        self.inference_width = inference_width
+        self.model_complexity = model_complexity
+        self.max_num_hands = max_num_hands
+        self.cadence = cadence
+
+    def replace(self, **changes):
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return QualityLevel(**values)
+
+    def describe(self):
+        width = f"{self.inference_width} px" if self.inference_width else "full res"
+        hands = "1 hand" if self.max_num_hands == 1 else f"{self.max_num_hands} hands"
+        cadence = "every frame" if self.cadence == 1 else f"every {self.cadence} frames"
+        return f"{width}, complexity {self.model_complexity}, {hands}, {cadence}"
+
+    def __eq__(self, other):
+        return isinstance(other, QualityLevel) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return (f"QualityLevel(inference_width={self.inference_width}, model_complexity={self.model_complexity}, "
+                f"max_num_hands={self.max_num_hands}, cadence={self.cadence})")
+
+
+def quality_ladder(inference_width=640, model_complexity=1, max_num_hands=2, min_width=320, max_cadence=3):
+    """
+    Build the list of quality levels, best first, starting from the configured settings.
+
+    Each level lowers one knob. The resolution goes down to ``COARSE_WIDTH``
+    first, then the model complexity and the number of hands, then the
+    resolution down to ``min_width``, and finally inference is spread over
+    up to ``max_cadence`` frames.
+    """
+    levels = [QualityLevel(inference_width, model_complexity, max_num_hands, 1)]
+
+    def lower_width(floor):
+        for width in WIDTH_STEPS:
+            current = levels[-1].inference_width
+            if floor <= width and (not current or width < current):
+                levels.append(levels[-1].replace(inference_width=width))
+
+    lower_width(max(COARSE_WIDTH, min_width))
+    if model_complexity > 0:
+        levels.append(levels[-1].replace(model_complexity=0))
+    if max_num_hands > 1:
+        levels.append(levels[-1].replace(max_num_hands=1))
+    lower_width(min_width)
+    for cadence in range(2, max_cadence + 1):
+        levels.append(levels[-1].replace(cadence=cadence))
+    return levels
+
+
+class AdaptiveQualityController:
+    """
+    Feedback controller that trades detection quality for latency.
+
+    ``update(latency_ms)`` is called once per frame with the frame's
+    capture-to-output latency. The latency is smoothed, and when it stays
+    above ``budget_ms`` the controller steps one level down the ladder, at
+    most once per ``cooldown`` seconds so each change can take effect before
+    the next one. When the smoothed latency has stayed below
+    ``headroom * budget_ms`` for ``recovery`` seconds it steps one level back
+    up. The gap between the two thresholds keeps it from oscillating between
+    neighbouring levels. A step up that is taken back within ``recovery``
+    seconds doubles the wait before the next step up (up to ``max_recovery``).
+
+    ``level`` is the current ``QualityLevel`` and ``decision`` a short
+    description of the last change, for logs and the GUI.
+    """
+
+    GAIN = 1.0 / 8
+
+    def __init__(self, levels, budget_ms=60.0, headroom=0.7, cooldown=1.0, recovery=3.0, max_recovery=30.0):
+        self.levels = levels
+        self.budget_ms = budget_ms
+        self.headroom = headroom
+        self.cooldown = cooldown
+        self.recovery = recovery
+        self.max_recovery = max_recovery
+        self.index = 0
+        self.latency_ms = None
+        self.steps_down = 0
+        self.steps_up = 0
+        self.decision = "starting at full quality"
+
+        self._wait_up = recovery
+        self._last_change = None
+        self._last_step_up = None
+        self._below_since = None
+
+    @property
+    def level(self):
+        return self.levels[self.index]
+
+    def update(self, latency_ms, now=None):
+        """Fold in one frame's latency; return True if the quality level changed."""
+        if now is None:
+            now = time.monotonic()
+        if self.latency_ms is None:
+            self.latency_ms = latency_ms
+            self._last_change = now
+        else:
+            self.latency_ms += (latency_ms - self.latency_ms) * self.GAIN
+        if self.budget_ms <= 0:
+            return False
+
+        settled = now - self._last_change >= self.cooldown
+        if self.latency_ms > self.budget_ms:
+            self._below_since = None
+            if settled and self.index < len(self.levels) - 1:
+                if self._last_step_up is not None and now - self._last_step_up < self.recovery:
+                    # The last step up did not hold: wait longer before trying again
+                    self._wait_up = min(self._wait_up * 2, self.max_recovery)
+                self._change(self.index + 1, now, f"{self.latency_ms:.0f} ms over the {self.budget_ms:.0f} ms budget")
+                return True
+            return False
+
+        if self.latency_ms < self.budget_ms * self.headroom:
+            if self._below_since is None:
+                self._below_since = now
+            if self.index > 0 and settled and now - self._below_since >= self._wait_up:
+                self._change(self.index - 1, now, f"{self.latency_ms:.0f} ms leaves headroom "
+                                                  f"in the {self.budget_ms:.0f} ms budget")
+                self._last_step_up = now
+                self._below_since = now
+                return True
+        else:
+            self._below_since = None
+        return False
+
+    def _change(self, index, now, reason):
+        if index > self.index:
+            self.steps_down += 1
+        else:
+            self.steps_up += 1
+        self.index = index
+        self._last_change = now
+        self.decision = f"level {index + 1}/{len(self.levels)} ({self.level.describe()}): {reason}"
+
+    def reset(self, levels=None):
+        """Start over at the top of ``levels`` (or the current ladder), e.g. after the settings changed."""
+        self.index = 0
+        if levels is not None:
+            self.levels = levels
+        self.latency_ms = None
+        self._wait_up = self.recovery
+        self._last_step_up = None
+        self._below_since = None
+        self.decision = "starting at full quality"
+
+    def describe(self):
+        return f"quality {self.index + 1}/{len(self.levels)} ({self.level.describe()})"
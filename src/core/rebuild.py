@@ -0,0 +1,119 @@
+import threading
+import time
+
+
+class DebouncedRebuilder:
+    """
+    Rebuild an expensive object (e.g. a MediaPipe ``Hands`` graph) off the frame loop.
+
+    ``request(params)`` asks for an instance built with ``params``. Requests
+    equal to the parameters of the instance in use are ignored, and a burst
+    of requests (a slider being dragged) only produces a build once no new
+    request arrived for ``delay`` seconds. The build runs on a background
+    thread with ``factory(params)``. The frame loop calls ``take()`` between
+    frames and swaps in the finished instance, so the object it is using is
+    never closed or replaced underneath it. A build whose parameters were
+    superseded while it was running is discarded.
+    """
+
+    def __init__(self, factory, params, delay=0.3, close=None):
+        self.factory = factory
+        self.delay = delay
+        self.close = close or (lambda instance: instance.close())
+        self.current = params
+        self.builds = 0
+        self.build_failures = 0
+        self.last_build_time = 0.0
+
+        self._condition = threading.Condition()
+        self._wanted = params
+        self._deadline = 0.0
+        self._ready = None
+        self._running = True
+        self._thread = threading.Thread(target=self._build_loop, name="DebouncedRebuilder", daemon=True)
+        self._thread.start()
+
+    def request(self, params):
+        """Ask for an instance built with ``params``; cheap and safe to call on every settings change."""
+        with self._condition:
+            self._wanted = params
+            self._deadline = time.monotonic() + self.delay
+            self._condition.notify_all()
+
+    def _needs_build(self):
+        if self._wanted == self.current:
+            return False
+        return self._ready is None or self._ready[1] != self._wanted
+
+    def _build_loop(self):
+        while True:
+            with self._condition:
+                # Wait for a request that differs from what is in use or ready
+                self._condition.wait_for(lambda: not self._running or self._needs_build())
+                # Debounce: wait until requests stop arriving
+                while self._running and time.monotonic() < self._deadline:
+                    self._condition.wait(self._deadline - time.monotonic())
+                if not self._running:
+                    return
+                if not self._needs_build():
+                    continue
+                params = self._wanted
+
+            start = time.monotonic()
+            try:
+                instance = self.factory(params)
+            except Exception as e:
+                print(f"Rebuild failed: {e}")
+                with self._condition:
+                    self.build_failures += 1
+                    # Do not retry the same parameters until they change again
+                    self._wanted = self.current
+                continue
+            self.last_build_time = time.monotonic() - start
+
+            with self._condition:
+                stale = None
+                if not self._running or params != self._wanted:
+                    stale = instance
+                else:
+                    stale = self._ready[0] if self._ready is not None else None
+                    self._ready = (instance, params)
+                    self.builds += 1
+            if stale is not None:
+                self.close(stale)
+
+    def take(self):
+        """Return ``(instance, params)`` if a rebuilt instance is ready, else None."""
+        if self._ready is None:
+            return None
+        with self._condition:
+            ready = self._ready
+            if ready is None or ready[1] != self._wanted:
+                if ready is None or self._wanted != self.current:
+                    # A newer build is on its way
+                    return None
+                # The parameters went back to the ones in use
+                self._ready = None
+            else:
+                self._ready = None
+                self.current = ready[1]
+                return ready
+        self.close(ready[0])
+        return None
+
+    @property
+    def pending(self):
+        """True while a requested rebuild has not been taken yet."""
+        with self._condition:
+            return self._wanted != self.current
+
+    def stop(self):
+        """Stop the builder thread and close any instance that was never taken."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join(timeout=5.0)
+        with self._condition:
+            ready, self._ready = self._ready, None
+        if ready is not None:
+            self.close(ready[0])
@@ -0,0 +1,91 @@
+class HandROITracker:
+    """
+    Crop hand inference to the region around the last known hand.
+
+    After a frame with detected hands, ``region()`` returns a square pixel
+    rectangle ``(x, y, w, h)`` around the landmark bounding box plus a margin.
+    The next inference input is cropped to that rectangle and
+    ``map_to_frame()`` converts the returned landmarks back to full-frame
+    normalized coordinates. The region is only moved when the hand gets close
+    to its border or becomes much smaller than it, which keeps the input
+    stable for MediaPipe's own frame-to-frame tracking. When no hand is found
+    the tracker resets and inference falls back to the full frame.
+    """
+
+    def __init__(self, margin=0.3, min_size=0.25, max_coverage=0.8):
+        self.margin = margin              # Padding on each side, relative to the hand size
+        self.min_size = min_size          # Smallest region, relative to the shorter frame side
+        self.max_coverage = max_coverage  # Use the full frame when the region would cover more than this
+
+        self.roi = None
+        self.frames_cropped = 0
+        self.frames_full = 0
+        self.tracking_lost = 0
+
+    def region(self):
+        """Return the pixel rectangle for the next inference, or ``None`` for the full frame."""
+        if self.roi is None:
+            self.frames_full += 1
+        else:
+            self.frames_cropped += 1
+        return self.roi
+
+    def reset(self):
+        if self.roi is not None:
+            self.tracking_lost += 1
+        self.roi = None
+
+    @staticmethod
+    def map_to_frame(result, region, width, height):
+        """Convert landmarks detected in ``region`` to full-frame normalized coordinates, in place."""
+        if region is None or not result or not result.multi_hand_landmarks:
+            return
+        x, y, w, h = region
+        for hand_landmarks in result.multi_hand_landmarks:
+            for landmark in hand_landmarks.landmark:
+                landmark.x = (x + landmark.x * w) / width
+                landmark.y = (y + landmark.y * h) / height
+                # Depth uses the same scale as x
+                landmark.z = landmark.z * w / width
+
+    def update(self, result, width, height):
+        """Compute the next region from full-frame landmarks."""
+        if not result or not result.multi_hand_landmarks:
+            self.reset()
+            return
+
+        xs = [landmark.x for hand in result.multi_hand_landmarks for landmark in hand.landmark]
+        ys = [landmark.y for hand in result.multi_hand_landmarks for landmark in hand.landmark]
+        bbox = (min(xs) * width, min(ys) * height, max(xs) * width, max(ys) * height)
+
+        # Keep the current region while the hand stays comfortably inside it
+        needed = self._expand(bbox, self.margin / 2, width, height)
+        if self.roi is not None and self._contains(self.roi, needed) and self.roi[2] <= 2 * needed[2]:
+            return
+
+        roi = self._expand(bbox, self.margin, width, height)
+        if roi[2] * roi[3] >= self.max_coverage * width * height:
+            roi = None
+        self.roi = roi
+
+    def _expand(self, bbox, margin, width, height):
+        x0, y0, x1, y1 = bbox
+        center_x = (x0 + x1) / 2
+        center_y = (y0 + y1) / 2
+
+        # Square region so a rotating hand stays inside
+        side = max(x1 - x0, y1 - y0) * (1 + 2 * margin)
+        side = max(side, self.min_size * min(width, height))
+        region_w = int(min(side, width))
+        region_h = int(min(side, height))
+
+        # Shift the region back inside the frame instead of shrinking it
+        x = int(min(max(center_x - region_w / 2, 0), width - region_w))
+        y = int(min(max(center_y - region_h / 2, 0), height - region_h))
+        return (x, y, region_w, region_h)
+
+    @staticmethod
+    def _contains(outer, inner):
+        return (outer[0] <= inner[0] and outer[1] <= inner[1] and
+                inner[0] + inner[2] <= outer[0] + outer[2] and
+                inner[1] + inner[3] <= outer[1] + outer[3])
@@ -0,0 +1,257 @@
+import itertools
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from .frame_bus import SharedFrameRing
+from .landmarks import (BACKEND_SOLUTIONS, BACKENDS, Classification, Handedness, HandLandmarks, Landmark,
+                        LandmarkBackend, LandmarkResult, create_landmark_backend)
+
+# Frames the workers run through a new model before reporting ready
+WARMUP_FRAMES = 3
+
+# Numbers the shared frame rings of all supervised backends in this process
+_ring_ids = itertools.count()
+
+
+def _pack(result):
+    """Reduce a ``LandmarkResult`` to plain tuples for the pipe."""
+    if result is None:
+        return None
+    hands = [[(point.x, point.y, point.z) for point in hand.landmark] for hand in result.multi_hand_landmarks or ()]
+    handedness = [[(c.index, c.label, c.score) for c in hand.classification] for hand in result.multi_handedness or ()]
+    return hands, handedness
+
+
+def _unpack(packed, context):
+    if packed is None:
+        return None
+    hands, handedness = packed
+    return LandmarkResult([HandLandmarks([Landmark(*point) for point in hand]) for hand in hands],
+                          [Handedness([Classification(*c) for c in hand]) for hand in handedness],
+                          context)
+
+
+def _frame_view(ring, sequence, shape):
+    """View the start of a ring slot as a contiguous frame of ``shape``."""
+    size = shape[0] * shape[1] * shape[2]
+    return ring.frames[sequence % ring.slots].reshape(-1)[:size].reshape(shape)
+
+
+def _inference_worker(params, conn):
+    """Worker process entry point: build and warm a backend, then answer frame requests."""
+    try:
+        backend = create_landmark_backend(**params)
+        frame = np.full((360, 640, 3), 128, np.uint8)
+        for _ in range(WARMUP_FRAMES):
+            backend.process(frame)
+    except Exception as e:
+        conn.send(('error', None, str(e)))
+        return
+    conn.send(('ready', None, os.getpid()))
+
+    ring = None
+    try:
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            request_id, ring_name, sequence, shape = request
+            if ring is None or ring.name != ring_name:
+                if ring is not None:
+                    ring.close()
+                ring = SharedFrameRing(ring_name)
+            result = backend.process(_frame_view(ring, sequence, shape))
+            conn.send(('result', request_id, _pack(result)))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        if ring is not None:
+            ring.close()
+        backend.close()
+
+
+class _Worker:
+    def __init__(self, context, params):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_inference_worker, args=(params, child_conn),
+                                       name="inference-worker", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.started = time.monotonic()
+        self.ready = False
+        self.failed = False
+
+    def poll_ready(self, timeout=0.0):
+        """Check for the ready message; True once the worker can take frames."""
+        if self.ready or self.failed:
+            return self.ready
+        try:
+            if self.conn.poll(timeout):
+                kind, _, detail = self.conn.recv()
+                if kind == 'ready':
+                    self.ready = True
+                else:
+                    print(f"Inference worker failed to start: {detail}")
+                    self.failed = True
+        except (EOFError, OSError):
+            self.failed = True
+        if not self.ready and not self.process.is_alive():
+            self.failed = True
+        return self.ready
+
+    def kill(self):
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1.0)
+
+    def close(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1.0)
+        self.kill()
+
+
+class SupervisedBackend(LandmarkBackend):
+    """
+    Run a landmark backend in a supervised worker process with a hot standby.
+
+    Two worker processes each build and warm up the same backend. Frames go
+    to the active worker through a ``SharedFrameRing`` and ``process()``
+    waits at most ``deadline`` seconds for the landmarks. If the active
+    worker misses the deadline or dies it is killed, the warm standby takes
+    over and gets the same frame right away, and a new standby is started in
+    the background. While no worker can answer, ``process()`` returns an
+    empty result so callers fall back to STOP instead of holding the last
+    command.
+
+    ``failovers`` counts takeovers, ``failover_ms`` / ``max_failover_ms`` the
+    time from detecting the failure to the first result from the new worker,
+    and ``gap_frames`` the frames that got an empty result for lack of a
+    working worker.
+    """
+
+    def __init__(self, backend=BACKEND_SOLUTIONS, deadline=0.15, startup_timeout=60.0, **params):
+        super().__init__()
+        self.params = dict(params, backend=backend)
+        self.name = f"supervised {backend}"
+        self.asynchronous = BACKENDS[backend].asynchronous
+        self.deadline = deadline
+
+        self.failovers = 0
+        self.deadline_misses = 0
+        self.worker_crashes = 0
+        self.gap_frames = 0
+        self.failover_ms = 0.0
+        self.max_failover_ms = 0.0
+
+        self._context = multiprocessing.get_context('spawn')
+        self._ring = None
+        self._request_id = 0
+        self._failed_at = None
+
+        self.active = _Worker(self._context, self.params)
+        self.standby = _Worker(self._context, self.params)
+        if not self.active.poll_ready(startup_timeout):
+            self.close()
+            raise RuntimeError("Inference worker did not start")
+
+    def _write_frame(self, rgb_frame):
+        needed = rgb_frame.size
+        if self._ring is None or self._ring.frames[0].size < needed:
+            # Grow the ring; workers attach to the new one by name on their next request
+            if self._ring is not None:
+                self._ring.close()
+            self._ring = SharedFrameRing(f"inference-{os.getpid()}-{next(_ring_ids)}", rgb_frame.shape,
+                                         slots=2, create=True)
+        sequence, _ = self._ring.claim()
+        np.copyto(_frame_view(self._ring, sequence, rgb_frame.shape), rgb_frame)
+        self._ring.commit(sequence)
+        return sequence
+
+    def _request(self, worker, sequence, shape, context):
+        """Send one frame to ``worker``; return ``(ok, result)`` within the deadline."""
+        self._request_id += 1
+        request_id = self._request_id
+        try:
+            worker.conn.send((request_id, self._ring.name, sequence, shape))
+            deadline = time.monotonic() + self.deadline
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not worker.conn.poll(remaining):
+                    self.deadline_misses += 1
+                    print(f"Inference worker missed the {self.deadline * 1000:.0f} ms deadline")
+                    return False, None
+                kind, reply_id, payload = worker.conn.recv()
+                if kind == 'result' and reply_id == request_id:
+                    return True, _unpack(payload, context)
+                # Anything else is a late reply to an earlier request
+        except (EOFError, OSError, BrokenPipeError):
+            self.worker_crashes += 1
+            print(f"Inference worker exited (code {worker.process.exitcode})")
+            return False, None
+
+    def _fail_over(self):
+        """Replace the active worker by the standby (if ready) and start a new standby."""
+        self.active.kill()
+        if self._failed_at is None:
+            self._failed_at = time.monotonic()
+        if self.standby.poll_ready():
+            self.active, self.standby = self.standby, _Worker(self._context, self.params)
+            self.failovers += 1
+            return True
+        # No warm standby: wait for the one that is starting
+        self.active = self.standby if not self.standby.failed else _Worker(self._context, self.params)
+        self.standby = _Worker(self._context, self.params)
+        return False
+
+    def process(self, rgb_frame, context=None):
+        started = time.monotonic()
+        self.frames_submitted += 1
+        if self.standby.failed or not self.standby.process.is_alive():
+            self.standby.kill()
+            self.standby = _Worker(self._context, self.params)
+
+        sequence = self._write_frame(rgb_frame)
+        for _ in range(2):
+            if not self.active.poll_ready():
+                if self.active.failed:
+                    self._fail_over()
+                    continue
+                break
+            ok, result = self._request(self.active, sequence, rgb_frame.shape, context)
+            if ok:
+                if self._failed_at is not None:
+                    self.failover_ms = (time.monotonic() - self._failed_at) * 1000.0
+                    self.max_failover_ms = max(self.max_failover_ms, self.failover_ms)
+                    print(f"Inference failed over in {self.failover_ms:.0f} ms")
+                    self._failed_at = None
+                if result is not None:
+                    self._record_latency(started)
+                return result
+            if not self._fail_over():
+                break
+
+        # No worker could answer in time: report no hands so the robot stops
+        self.gap_frames += 1
+        return LandmarkResult(context=context)
+
+    def summary(self):
+        return (f"{self.failovers} failovers ({self.deadline_misses} missed deadlines, "
+                f"{self.worker_crashes} crashes), last {self.failover_ms:.0f} ms, "
+                f"max {self.max_failover_ms:.0f} ms, {self.gap_frames} frames without a worker")
+
+    def close(self):
+        self.active.close()
+        self.standby.close()
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
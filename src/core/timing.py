@@ -0,0 +1,120 @@
+import collections
+import time
+
+
+class FrameInfo:
+    """
+    Capture metadata that travels with a frame through the pipeline.
+
+    ``sequence`` numbers every frame the source captured, including frames
+    that were dropped before anyone read them, so gaps show where frames were
+    lost. ``timestamp`` is the ``time.monotonic()`` capture time. Later stages
+    call ``mark()`` (e.g. ``'inference'``, ``'send'``, ``'display'``) so the
+    time spent between capture and each stage can be attributed.
+    """
+
+    __slots__ = ('sequence', 'timestamp', 'stages')
+
+    def __init__(self, sequence, timestamp):
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.stages = {}
+
+    def mark(self, stage):
+        """Record the time this frame reached ``stage``."""
+        self.stages[stage] = time.monotonic()
+
+    def latency(self, stage=None):
+        """Milliseconds from capture to ``stage`` (or to now if not given)."""
+        end = self.stages[stage] if stage is not None else time.monotonic()
+        return (end - self.timestamp) * 1000.0
+
+    def __repr__(self):
+        return f"FrameInfo(sequence={self.sequence}, timestamp={self.timestamp:.6f})"
+
+
+class CaptureStats:
+    """
+    Running frame-rate, jitter and dropped-frame counters for a capture source.
+
+    ``record()`` is called once per delivered frame. Dropped frames are counted
+    from gaps in the sequence numbers, the effective frame rate is the number
+    of frames delivered during the last ``window`` seconds, and jitter is a
+    smoothed mean deviation of the inter-frame interval from its running
+    average (the same 1/16 gain RTP uses for its jitter estimate).
+    ``record_stages()`` keeps smoothed capture-to-stage latencies for frames
+    whose ``FrameInfo`` was marked downstream.
+    """
+
+    GAIN = 1.0 / 16
+
+    def __init__(self, window=1.0):
+        self.window = window
+        self.frames = 0
+        self.dropped = 0
+        self.interval_ms = 0.0
+        self.jitter_ms = 0.0
+        self.max_interval_ms = 0.0
+        self.stage_latency_ms = {}
+        self._last = None
+        self._times = collections.deque()
+
+    def record(self, sequence, timestamp=None):
+        """Account for a delivered frame and return its ``FrameInfo``."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        info = FrameInfo(sequence, timestamp)
+
+        if self._last is not None:
+            gap = sequence - self._last.sequence - 1
+            if gap > 0:
+                self.dropped += gap
+            interval = (timestamp - self._last.timestamp) * 1000.0
+            if self.frames == 1:
+                self.interval_ms = interval
+            deviation = abs(interval - self.interval_ms)
+            self.interval_ms += (interval - self.interval_ms) * self.GAIN
+            self.jitter_ms += (deviation - self.jitter_ms) * self.GAIN
+            self.max_interval_ms = max(self.max_interval_ms, interval)
+
+        self.frames += 1
+        self._last = info
+        self._times.append(timestamp)
+        while self._times and self._times[0] < timestamp - self.window:
+            self._times.popleft()
+        return info
+
+    def record_stages(self, info):
+        """Fold the stage marks of a processed frame into the latency averages."""
+        for stage in info.stages:
+            latency = info.latency(stage)
+            average = self.stage_latency_ms.get(stage)
+            self.stage_latency_ms[stage] = latency if average is None else average + (latency - average) * self.GAIN
+
+    @property
+    def fps(self):
+        if len(self._times) < 2:
+            return 0.0
+        span = self._times[-1] - self._times[0]
+        return (len(self._times) - 1) / span if span > 0 else 0.0
+
+    def snapshot(self):
+        """Return the current counters as a plain dict (for logs, GUIs and IPC)."""
+        return {
+            'frames': self.frames,
+            'dropped': self.dropped,
+            'fps': self.fps,
+            'interval_ms': self.interval_ms,
+            'jitter_ms': self.jitter_ms,
+            'max_interval_ms': self.max_interval_ms,
+            'latency_ms': dict(self.stage_latency_ms),
+        }
+
+    def summary(self):
+        """One-line human-readable summary."""
+        text = (f"{self.fps:.1f} FPS, jitter {self.jitter_ms:.1f} ms, "
+                f"{self.dropped} dropped of {self.frames + self.dropped}")
+        if self.stage_latency_ms:
+            stages = ', '.join(f"{stage} {latency:.0f} ms" for stage, latency in self.stage_latency_ms.items())
+            text += f", capture to {stages}"
+        return text
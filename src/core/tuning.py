@@ -0,0 +1,207 @@
+import contextlib
+import multiprocessing
+import os
+import threading
+import time
+
+# Settings applied when nothing was tuned: OpenCV's default thread pool, no pinning
+DEFAULT_CPU_CONFIG = {'opencv_threads': 0, 'process_cpus': [], 'worker_cpus': []}
+
+# Configurations within this fraction of the best frame rate compete on p99 latency
+FPS_TOLERANCE = 0.1
+
+
+def available_cpus():
+    """The CPUs this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def pin_current_thread(cpus):
+    """
+    Restrict the calling thread to ``cpus`` (no-op for an empty list or where unsupported).
+
+    On Linux affinity is per thread and inherited by threads started
+    afterwards, so pinning the thread that builds the landmark model also
+    pins the thread pools MediaPipe and OpenCV start from it.
+    """
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cpus)
+
+
+@contextlib.contextmanager
+def pinned_thread(cpus):
+    """
+    Pin the calling thread to ``cpus`` for the duration of the block, then restore its affinity.
+
+    Threads started inside the block (e.g. MediaPipe's pools while a model
+    is built) keep the pinned CPUs; the calling thread itself, such as a
+    background builder, goes back to where it was allowed to run before.
+    """
+    if not cpus or not hasattr(os, 'sched_setaffinity'):
+        yield
+        return
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpus)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+def apply_cpu_config(config):
+    """Apply the process-wide part of a CPU configuration (call before starting any threads)."""
+    import cv2
+    config = config or DEFAULT_CPU_CONFIG
+    pin_current_thread(config.get('process_cpus'))
+    if config.get('opencv_threads'):
+        cv2.setNumThreads(config['opencv_threads'])
+
+
+def describe_cpu_config(config):
+    threads = config.get('opencv_threads') or 'default'
+    process = ','.join(map(str, config['process_cpus'])) if config.get('process_cpus') else 'all'
+    worker = ','.join(map(str, config['worker_cpus'])) if config.get('worker_cpus') else 'unpinned'
+    return f"cv2 threads {threads}, process CPUs {process}, worker {worker}"
+
+
+def candidate_configs(cpus=None):
+    """
+    The configurations the tuner tries.
+
+    Every OpenCV thread count from a small set is combined with three
+    placements: no pinning, the inference worker kept off the first CPU
+    (which the Qt main thread then has to itself), and the whole process
+    kept off the last CPU (left to other services on the box).
+    """
+    cpus = cpus or available_cpus()
+    count = len(cpus)
+    thread_counts = sorted({0, 1, 2, max(1, count - 1)})
+    placements = [([], [])]
+    if count > 1:
+        placements.append(([], cpus[1:]))
+    if count > 2:
+        placements.append((cpus[:-1], []))
+    return [{'opencv_threads': threads, 'process_cpus': process, 'worker_cpus': worker}
+            for threads in thread_counts for process, worker in placements]
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def _measure(config, clip, frames, backend_params, inference_width, results):
+    """Child process: run the pipeline on ``clip`` under ``config`` and report its timings."""
+    apply_cpu_config(config)
+    import cv2
+    from .capture import PACING_FAST, open_capture
+    from .landmarks import create_landmark_backend, draw_landmarks
+    from .preprocess import FramePreprocessor
+
+    # Stand-in for the Qt main thread: how late do its 10 ms timers fire?
+    ui_lag = []
+    stop = threading.Event()
+
+    def ui_probe():
+        while not stop.is_set():
+            start = time.perf_counter()
+            time.sleep(0.01)
+            ui_lag.append((time.perf_counter() - start - 0.01) * 1000.0)
+
+    latencies = []
+
+    def worker():
+        pin_current_thread(config.get('worker_cpus'))
+        backend = create_landmark_backend(**backend_params)
+        cap = open_capture(clip, 1280, 720, PACING_FAST)
+        preprocessor = FramePreprocessor(display_buffers=1, inference_width=inference_width)
+        result = None
+        while len(latencies) < frames and cap.isOpened():
+            start = time.perf_counter()
+            ret, captured = cap.read()
+            if not ret:
+                break
+            frame, rgb_frame = preprocessor.process(captured)
+            cap.recycle(captured)
+            result = backend.process(rgb_frame) or result
+            if result is not None and result.multi_hand_landmarks:
+                for hand_landmarks in result.multi_hand_landmarks:
+                    draw_landmarks(frame, hand_landmarks)
+            cv2.putText(frame, "tuning", (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+        cap.release()
+        backend.close()
+
+    probe = threading.Thread(target=ui_probe, daemon=True)
+    probe.start()
+    start = time.perf_counter()
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    probe.join()
+
+    # The first frames include model start-up; leave them out of the latency figures
+    steady = latencies[min(10, len(latencies) // 10):]
+    results.put({
+        'frames': len(latencies),
+        'fps': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': _percentile(steady, 0.5),
+        'p99_ms': _percentile(steady, 0.99),
+        'ui_lag_p99_ms': _percentile(ui_lag, 0.99),
+    })
+
+
+def measure_config(config, clip, frames=300, backend_params=None, inference_width=640, timeout=300.0):
+    """Run the pipeline on ``clip`` in a fresh process under ``config``; return its timings or None."""
+    # A fresh spawned process per configuration, since thread pools cannot be resized once started
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_measure, daemon=True,
+                              args=(config, clip, frames, backend_params or {}, inference_width, results))
+    process.start()
+    try:
+        return results.get(timeout=timeout)
+    except Exception as e:
+        print(f"Measurement failed for {describe_cpu_config(config)}: {e}")
+        return None
+    finally:
+        process.join(timeout=5.0)
+        if process.is_alive():
+            process.kill()
+
+
+def choose_best(measurements):
+    """
+    Pick the best ``(config, timings)`` pair.
+
+    Among the configurations within ``FPS_TOLERANCE`` of the highest frame
+    rate, the one with the lowest p99 latency wins; the UI thread's lag
+    breaks ties.
+    """
+    measured = [(config, timings) for config, timings in measurements if timings]
+    if not measured:
+        return None
+    best_fps = max(timings['fps'] for _, timings in measured)
+    contenders = [item for item in measured if item[1]['fps'] >= best_fps * (1 - FPS_TOLERANCE)]
+    return min(contenders, key=lambda item: (round(item[1]['p99_ms'], 1), item[1]['ui_lag_p99_ms']))
+
+
+def tune(clip, frames=300, backend_params=None, inference_width=640, configs=None):
+    """Measure every candidate configuration, print a report and return the best configuration."""
+    measurements = []
+    print(f"{'configuration':<62} {'FPS':>6} {'p50':>8} {'p99':>8} {'UI lag p99':>11}")
+    for config in configs or candidate_configs():
+        timings = measure_config(config, clip, frames, backend_params, inference_width)
+        measurements.append((config, timings))
+        if timings:
+            print(f"{describe_cpu_config(config):<62} {timings['fps']:6.1f} {timings['p50_ms']:6.1f}ms "
+                  f"{timings['p99_ms']:6.1f}ms {timings['ui_lag_p99_ms']:9.1f}ms")
+    best = choose_best(measurements)
+    if best is None:
+        return None
+    print(f"Best: {describe_cpu_config(best[0])}")
+    return best[0]
@@ -0,0 +1,95 @@
+import threading
+import time
+
+import numpy as np
+
+
+class BackendWarmer:
+    """
+    Build and warm up a landmark backend in the background, ahead of use.
+
+    Creating a MediaPipe graph takes a while and its first ``process()`` call
+    is much slower than later ones (model loading, delegate set-up, memory
+    allocation). The warmer starts a thread that calls ``factory(params)`` and
+    feeds the new backend ``frames`` synthetic frames of ``frame_size``, so
+    whoever starts the camera later gets a model that is already hot.
+
+    ``take(params)`` hands the backend over if it was built with ``params``
+    (waiting up to ``timeout`` seconds for a warm-up that is still running)
+    and returns None otherwise, in which case the caller builds its own.
+    ``build_time`` and ``warmup_time`` report how long each phase took.
+    """
+
+    def __init__(self, factory, params, frame_size=(640, 360), frames=3, result_timeout=2.0):
+        self.factory = factory
+        self.params = params
+        self.frame_size = frame_size
+        self.frames = frames
+        self.result_timeout = result_timeout
+        self.build_time = None
+        self.warmup_time = None
+        self.error = None
+
+        self._backend = None
+        self._taken = False
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._warm, name="BackendWarmer", daemon=True)
+        self._thread.start()
+
+    def _warm(self):
+        try:
+            start = time.monotonic()
+            backend = self.factory(self.params)
+            self.build_time = time.monotonic() - start
+
+            # A mid-grey frame runs the full palm detection path without finding a hand
+            width, height = self.frame_size
+            frame = np.full((height, width, 3), 128, np.uint8)
+            start = time.monotonic()
+            for _ in range(self.frames):
+                backend.process(frame)
+            # Asynchronous backends are only warm once a result came back
+            deadline = time.monotonic() + self.result_timeout
+            while backend.results_received == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.warmup_time = time.monotonic() - start
+            # Keep the warm-up frames out of the backend's statistics
+            backend.frames_submitted = backend.results_received = 0
+            backend.inference_ms = 0.0
+        except Exception as e:
+            print(f"Backend warm-up failed: {e}")
+            self.error = e
+            self._done.set()
+            return
+
+        with self._lock:
+            if self._taken:
+                # Cancelled while warming up
+                backend.close()
+            else:
+                self._backend = backend
+        self._done.set()
+
+    @property
+    def ready(self):
+        return self._done.is_set() and self._backend is not None
+
+    def take(self, params, timeout=None):
+        """Return the warmed backend if it was built with ``params``, else None."""
+        if params != self.params:
+            self.cancel()
+            return None
+        self._done.wait(timeout)
+        with self._lock:
+            backend, self._backend = self._backend, None
+            self._taken = True
+        return backend
+
+    def cancel(self):
+        """Close the backend if it was never taken (also stops one that is still warming up)."""
+        with self._lock:
+            backend, self._backend = self._backend, None
+            self._taken = True
+        if backend is not None:
+            backend.close()
@@ -1,19 +1,42 @@
+import argparse
 import cv2
-import mediapipe as mp
-import math
 import socket
 import sys
+import threading
 import os
 import json
+import time
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QLineEdit, QSlider, QGroupBox, QTabWidget,
                              QSpinBox, QCheckBox, QMessageBox, QFileDialog, QGridLayout)
 from PyQt5.QtGui import QImage, QPixmap, QIcon, QColor, QPainter, QPen, QFont
 from PyQt5.QtCore import Qt, QTimer, QRect, QThread, pyqtSignal, QSettings
 
+from core.arbitration import HandArbiter
+from core.capture import PACING_REALTIME, open_capture
+from core.change import FrameChangeDetector
+from core.features import DEFAULT_ZONES, extract_features, zone_command, zone_rects
+from core.frame_bus import FrameBusPublisher
+from core.landmark_cache import LandmarkCache, clip_hash
+from core.landmarks import BACKEND_SOLUTIONS, BACKENDS, create_landmark_backend, draw_landmarks
+from core.predict import LandmarkPredictor
+from core.preprocess import FramePreprocessor
+from core.quality import AdaptiveQualityController, quality_ladder
+from core.rebuild import DebouncedRebuilder
+from core.roi import HandROITracker
+from core.supervisor import SupervisedBackend
+from core.tuning import DEFAULT_CPU_CONFIG, apply_cpu_config, pin_current_thread, pinned_thread, tune
+from core.warmup import BackendWarmer
+
 # Settings file path
 SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'settings.json')
 
+# How often the camera thread reports capture statistics to the GUI (seconds)
+STATS_INTERVAL = 1.0
+
+# Quiet period after the last detection settings change before the model is rebuilt (seconds)
+REBUILD_DELAY = 0.3
+
 # Default settings
 DEFAULT_SETTINGS = {
     'network': {
@@ -22,13 +45,34 @@ DEFAULT_SETTINGS = {
     },
     'detection': {
         'min_detection_confidence': 0.7,
-        'min_tracking_confidence': 0.7
+        'min_tracking_confidence': 0.7,
+        'inference_width': 640,
+        'roi_tracking': True,
+        'change_threshold': 8.0,
+        'max_skipped_frames': 5,
+        'backend': BACKEND_SOLUTIONS,
+        'model_path': '',
+        'model_complexity': 1,
+        'max_num_hands': 2,
+        'latency_budget_ms': 60,
+        'max_cadence': 3,
+        'inference_deadline_ms': 0,
+        'operator_hand': '',
+        'operator_min_score': 0.8
     },
     'zones': {
         'forward_zone': {'x': 0.4, 'y': 0.0, 'width': 0.2, 'height': 0.3},
         'backward_zone': {'x': 0.4, 'y': 0.7, 'width': 0.2, 'height': 0.3},
         'turn_angle_threshold': 20
-    }
+    },
+    'capture': {
+        'source': 0,
+        'pacing': PACING_REALTIME,
+        'publish_bus': '',
+        'landmark_cache_mb': 256
+    },
+    'performance': dict(DEFAULT_CPU_CONFIG),
+    'operators': []
 }
 
 # Load settings
@@ -50,56 +94,234 @@ def save_settings(settings):
     except Exception as e:
         print(f"Error saving settings: {e}")
 
+def quality_levels(settings):
+    """The quality ladder, starting from the configured detection settings."""
+    detection = settings['detection']
+    return quality_ladder(detection.get('inference_width', 0), detection.get('model_complexity', 1),
+                          detection.get('max_num_hands', 2))
+
+def backend_params(settings, level, single_hand=False):
+    """
+    The detection settings a landmark backend is built from, at the given quality level.
+    
+    ``single_hand`` limits the model to one hand while an operator's hand is locked.
+    """
+    detection = settings['detection']
+    params = {
+        'backend': detection.get('backend', BACKEND_SOLUTIONS),
+        'min_detection_confidence': detection['min_detection_confidence'],
+        'min_tracking_confidence': detection['min_tracking_confidence'],
+        'model_complexity': level.model_complexity,
+        'max_num_hands': 1 if single_hand else level.max_num_hands,
+        'inference_deadline_ms': detection.get('inference_deadline_ms', 0),
+        'worker_cpus': settings.get('performance', DEFAULT_CPU_CONFIG).get('worker_cpus', []),
+    }
+    if detection.get('model_path'):
+        params['model_path'] = detection['model_path']
+    return params
+
+def create_backend(params):
+    # With a deadline, inference runs in a supervised worker process with a hot standby
+    params = dict(params)
+    deadline_ms = params.pop('inference_deadline_ms', 0)
+    # The thread pools MediaPipe starts while building inherit the pinned CPUs;
+    # the building thread (warmer, rebuilder or camera thread) is restored after
+    with pinned_thread(params.pop('worker_cpus', [])):
+        if deadline_ms:
+            return SupervisedBackend(deadline=deadline_ms / 1000.0, **params)
+        return create_landmark_backend(**params)
+
+# Start building and warming the landmark model as soon as the app launches
+def start_warmup(settings):
+    width = settings['detection'].get('inference_width', 0) or 1280
+    return BackendWarmer(create_backend, backend_params(settings, quality_levels(settings)[0]),
+                         frame_size=(width, round(width * 720 / 1280)))
+
 # Camera thread for processing frames
 class CameraThread(QThread):
     update_frame = pyqtSignal(QImage)
     update_command = pyqtSignal(str)
+    update_stats = pyqtSignal(str)
+    first_command = pyqtSignal(str)
     initialization_complete = pyqtSignal(bool)
     
-    def __init__(self, settings):
+    def __init__(self, settings, warmer=None, started=None):
         super().__init__()
         self.settings = settings
+        
+        # Pre-warmed backend from app launch, and when Start was pressed
+        self.warmer = warmer
+        self.started = started if started is not None else time.monotonic()
+        self.time_to_first_command = None
         self.running = False
         self.command = "STOP"
         
-        # Will initialize MediaPipe in the thread to avoid blocking UI
-        self.mp_hands = mp.solutions.hands
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.hands = None
+        # Will initialize the landmark backend in the thread to avoid blocking UI
+        self.backend = None
+        
+        # Rebuilds the backend in the background when detection parameters change
+        self.backend_builder = None
         
         # Initialize camera
         self.cap = None
         
+        # Optional shared-memory ring the captured frames are published to
+        self.publisher = None
+        # Frames from a shared-memory ring that were overwritten while being read
+        self.frames_torn = 0
+        
+        # Reusable buffers for the mirrored display frame and the RGB inference frame
+        self.preprocessor = FramePreprocessor()
+        
+        # Crops inference to the area around the last detected hand
+        self.roi_tracker = HandROITracker()
+        
+        # Reuses the previous result for duplicate or unchanged frames
+        self.change_detector = FrameChangeDetector()
+        
+        # Predicts the landmarks on the frames between inferences
+        self.predictor = LandmarkPredictor(settings['detection'].get('max_cadence', 1))
+        
+        # Lowers inference quality when the frame loop runs over its latency budget
+        self.quality = AdaptiveQualityController(self.quality_levels(),
+                                                 settings['detection'].get('latency_budget_ms', 0))
+        
+        # Settings changed on the Qt thread, applied by the frame loop between frames
+        self.settings_lock = threading.Lock()
+        self.pending_settings = None
+        
+        # Landmarks of earlier runs over the same replayed clip
+        self.cache = None
+        self.clip_hash = None
+        self.cache_params = None
+        
+        # Locks onto one operator hand and ignores the others until it is lost
+        self.arbiter = HandArbiter(settings['detection'].get('operator_hand', ''),
+                                   settings['detection'].get('operator_min_score', 0.8))
+        
+    def quality_levels(self):
+        return quality_levels(self.settings)
+    
+    def backend_params(self):
+        return backend_params(self.settings, self.quality.level, self.arbiter.locked)
+    
+    def create_backend(self, params):
+        return create_backend(params)
+    
+    def landmark_cache_params(self):
+        """
+        The settings landmarks are cached under: the configured detection settings.
+        
+        The automatic quality and single-hand adjustments keep using the same
+        entry, so a replay that hits the cache makes the same decisions.
+        """
+        params = backend_params(self.settings, self.quality.levels[0])
+        del params['inference_deadline_ms'], params['worker_cpus']
+        detection = self.settings['detection']
+        params.update(inference_width=detection.get('inference_width', 0),
+                      roi_tracking=detection.get('roi_tracking', True), size=(1280, 720))
+        return params
+    
+    def open_landmark_cache(self):
+        """Use the landmark cache when replaying a clip with synchronous in-process inference."""
+        detection = self.settings['detection']
+        capture_settings = self.settings.get('capture', DEFAULT_SETTINGS['capture'])
+        cache_mb = capture_settings.get('landmark_cache_mb', 0)
+        backend_class = BACKENDS.get(detection.get('backend', BACKEND_SOLUTIONS))
+        if (not cache_mb or self.cap.is_live or backend_class is None or backend_class.asynchronous
+                or detection.get('inference_deadline_ms', 0)):
+            return
+        self.clip_hash = self.clip_hash or clip_hash(capture_settings.get('source', 0))
+        if self.clip_hash is None:
+            return
+        if self.cache is None:
+            self.cache = LandmarkCache(max_bytes=cache_mb * 1024 * 1024)
+        params = self.landmark_cache_params()
+        if params != self.cache_params:
+            self.cache_params = params
+            self.cache.open(self.clip_hash, params)
+    
     def update_settings(self, settings):
+        # Called on the Qt thread: the frame loop applies the change between
+        # frames, so the quality controller and the arbiter are never modified
+        # while it is using them
+        with self.settings_lock:
+            self.pending_settings = settings
+    
+    def apply_settings(self):
+        # Zones, thresholds and the other per-frame settings are read on every
+        # frame. Only a change of the detection parameters needs a new backend,
+        # which is built in the background and swapped in between frames.
+        with self.settings_lock:
+            settings, self.pending_settings = self.pending_settings, None
+        if settings is None:
+            return
         self.settings = settings
-        # Update MediaPipe settings if hands object exists
-        if self.hands is not None:
-            self.hands.close()
-            self.hands = self.mp_hands.Hands(
-                min_detection_confidence=self.settings['detection']['min_detection_confidence'],
-                min_tracking_confidence=self.settings['detection']['min_tracking_confidence']
-            )
+        levels = self.quality_levels()
+        if levels != self.quality.levels:
+            self.quality.reset(levels)
+        self.quality.budget_ms = settings['detection'].get('latency_budget_ms', 0)
+        self.predictor.max_cadence = settings['detection'].get('max_cadence', 1)
+        operator_hand = settings['detection'].get('operator_hand', '')
+        if operator_hand != self.arbiter.hand:
+            self.arbiter.hand = operator_hand
+            self.arbiter.reset()
+        self.arbiter.min_score = settings['detection'].get('operator_min_score', 0.8)
+        if self.backend_builder is not None:
+            self.backend_builder.request(self.backend_params())
+    
+    def swap_backend(self):
+        """Swap in a rebuilt landmark backend if one is ready (called between frames)."""
+        builder = self.backend_builder
+        rebuilt = builder.take() if builder is not None else None
+        if rebuilt is None:
+            return
+        old_backend, (self.backend, params) = self.backend, rebuilt
+        if old_backend is not None:
+            old_backend.close()
+        # Results from the old model must not be reused
+        self.change_detector.reset()
+        self.roi_tracker.reset()
+        self.predictor.reset()
+        print(f"Landmark backend rebuilt in {builder.last_build_time * 1000:.0f} ms with {params}")
     
     def run(self):
         try:
-            # Initialize MediaPipe Hands in the thread to avoid blocking UI
-            self.hands = self.mp_hands.Hands(
-                min_detection_confidence=self.settings['detection']['min_detection_confidence'],
-                min_tracking_confidence=self.settings['detection']['min_tracking_confidence']
-            )
+            # Keep the frame loop off the CPUs the tuner left to the Qt main thread
+            pin_current_thread(self.settings.get('performance', DEFAULT_CPU_CONFIG).get('worker_cpus', []))
+            
+            # Attach to the backend warmed up since launch, or initialize one
+            # in the thread to avoid blocking UI
+            params = self.backend_params()
+            if self.warmer is not None:
+                self.backend = self.warmer.take(params)
+                self.warmer = None
+            if self.backend is not None:
+                print("Using the pre-warmed landmark backend")
+            else:
+                self.backend = self.create_backend(params)
+            self.backend_builder = DebouncedRebuilder(self.create_backend, params, REBUILD_DELAY)
             
-            # Initialize camera with timeout
-            self.cap = cv2.VideoCapture(0)
+            # Initialize the capture source: live cameras are read on a grabber
+            # thread, recorded clips are replayed frame by frame
+            capture_settings = self.settings.get('capture', DEFAULT_SETTINGS['capture'])
+            self.cap = open_capture(capture_settings.get('source', 0), 1280, 720,
+                                    capture_settings.get('pacing', PACING_REALTIME))
             if not self.cap.isOpened():
                 print("Error: Could not open camera.")
+                self.cap.release()
+                self.cap = None
                 self.initialization_complete.emit(False)
                 return
-                
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+            
+            if capture_settings.get('publish_bus'):
+                self.publisher = FrameBusPublisher(capture_settings['publish_bus'])
+            self.open_landmark_cache()
             
             self.running = True
             self.initialization_complete.emit(True)
+            last_stats_time = time.monotonic()
+            result = None
             
             while self.running and self.cap is not None and self.cap.isOpened():
                 try:
@@ -107,63 +329,105 @@ class CameraThread(QThread):
                     if not self.running:
                         break
                         
-                    ret, frame = self.cap.read()
+                    ret, captured = self.cap.read()
                     if not ret:
-                        print("Failed to read frame from camera")
-                        self.msleep(100)  # Short delay before retry
+                        if self.cap.is_live:
+                            print("Failed to read frame from camera")
                         continue
                     
                     # Check again if thread should still be running
                     if not self.running:
                         break
+                    
+                    # Sequence number and capture time of this frame
+                    info = self.cap.frame_info
+                    
+                    # Settings changes never rebuild the model or switch cache entries mid-frame
+                    self.apply_settings()
+                    self.swap_backend()
+                    if self.cache is not None:
+                        self.open_landmark_cache()
                         
-                    # Flip frame for a mirrored effect
-                    frame = cv2.flip(frame, 1)
+                    # Share the raw captured frame with other processes, which
+                    # mirror and infer on it themselves
+                    if self.publisher is not None:
+                        try:
+                            self.publisher.publish(captured, info.timestamp)
+                        except Exception as e:
+                            print(f"Frame bus error: {e}")
+                    
+                    # Mirror into a preallocated buffer, then hand the capture
+                    # buffer back to the grabber for reuse
+                    frame = self.preprocessor.mirror(captured)
+                    self.cap.recycle(captured)
+                    if hasattr(self.cap, 'is_current') and not self.cap.is_current():
+                        # Read from a shared-memory ring that wrapped around during the copy
+                        self.frames_torn += 1
+                        continue
                     height, width, channels = frame.shape
                     
+                    detection = self.settings['detection']
+                    quality = self.quality.level
+                    self.preprocessor.inference_width = quality.inference_width
+                    # Frames between inferences get predicted landmarks; under load
+                    # at least every quality.cadence-th frame is predicted
+                    inference_due = self.predictor.due(quality.cadence)
+                    roi_tracking = detection.get('roi_tracking', True)
+                    self.change_detector.threshold = detection.get('change_threshold', 0)
+                    self.change_detector.max_skip = detection.get('max_skipped_frames', 5)
+                    region = None
+                    
                     # Process the frame with MediaPipe - with error handling
                     try:
-                        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        if self.hands is None:  # Ensure hands object exists
-                            self.hands = self.mp_hands.Hands(
-                                min_detection_confidence=self.settings['detection']['min_detection_confidence'],
-                                min_tracking_confidence=self.settings['detection']['min_tracking_confidence']
-                            )
-                        result = self.hands.process(rgb_frame)
+                        if self.backend is None:  # Ensure the backend exists
+                            self.backend = self.create_backend(self.backend_params())
+                        
+                        # Duplicate or unchanged frames reuse the previous result
+                        if result is None or (inference_due and self.change_detector.should_infer(frame)):
+                            # Replayed clips reuse full-frame landmarks cached by earlier runs
+                            latest = self.cache.get(info.sequence) if self.cache is not None else None
+                            if latest is None:
+                                # The model gets a frame downscaled to the configured
+                                # inference width, cropped to the tracked hand if any.
+                                # Asynchronous backends return the newest finished
+                                # result (or None), tagged with the region of its frame.
+                                region = self.roi_tracker.region() if roi_tracking else None
+                                latest = self.backend.process(self.preprocessor.prepare_inference(frame, region),
+                                                              region)
+                                if latest is not None and latest.context is not None:
+                                    self.roi_tracker.map_to_frame(latest, latest.context, width, height)
+                                    if not latest.multi_hand_landmarks and not self.backend.asynchronous:
+                                        # Hand lost inside the region: fall back to the full frame
+                                        latest = self.backend.process(self.preprocessor.prepare_inference(frame))
+                                if latest is not None and self.cache is not None:
+                                    self.cache.put(info.sequence, latest)
+                            
+                            if latest is not None:
+                                if roi_tracking:
+                                    self.roi_tracker.update(latest, width, height)
+                                self.predictor.observe(latest, info.timestamp)
+                                result = latest
+                        elif not inference_due:
+                            result = self.predictor.predict(info.timestamp) or result
                     except Exception as e:
                         print(f"MediaPipe processing error: {e}")
                         self.msleep(100)
                         continue
+                    info.mark('inference')
                     
                     # Default command
                     self.command = "STOP"
                     
                     # Get zone coordinates from settings - with validation
                     try:
-                        forward_zone = self.settings['zones']['forward_zone']
-                        backward_zone = self.settings['zones']['backward_zone']
+                        # Actual pixel coordinates for zones
+                        forward_rect, backward_rect = zone_rects(self.settings['zones'], width, height)
                         turn_threshold = self.settings['zones']['turn_angle_threshold']
-                        
-                        # Calculate actual pixel coordinates for zones
-                        forward_rect = (
-                            int(forward_zone['x'] * width),
-                            int(forward_zone['y'] * height),
-                            int(forward_zone['width'] * width),
-                            int(forward_zone['height'] * height)
-                        )
-                        
-                        backward_rect = (
-                            int(backward_zone['x'] * width),
-                            int(backward_zone['y'] * height),
-                            int(backward_zone['width'] * width),
-                            int(backward_zone['height'] * height)
-                        )
                     except (KeyError, TypeError) as e:
                         print(f"Zone settings error: {e}")
                         # Use default values if settings are corrupted
-                        forward_rect = (int(0.4 * width), 0, int(0.2 * width), int(0.3 * height))
-                        backward_rect = (int(0.4 * width), int(0.7 * height), int(0.2 * width), int(0.3 * height))
-                        turn_threshold = 20
+                        forward_rect, backward_rect = zone_rects(DEFAULT_ZONES, width, height)
+                        turn_threshold = DEFAULT_ZONES['turn_angle_threshold']
                     
                     # Draw the control zones - with bounds checking
                     try:
@@ -183,57 +447,38 @@ class CameraThread(QThread):
                     except Exception as e:
                         print(f"Drawing error: {e}")
                     
+                    # Show the inference region while a hand is being tracked
+                    if region is not None:
+                        x, y, w, h = region
+                        cv2.rectangle(frame, (x, y), (x + w, y + h), (128, 128, 128), 1)
+                    
+                    # Only the operator's hand drives the robot; while it is locked
+                    # the model tracks a single hand
+                    locked = self.arbiter.locked
+                    operator = self.arbiter.select(result)
+                    if self.arbiter.locked != locked:
+                        self.backend_builder.request(self.backend_params())
+                    
                     # Process hand landmarks with error handling
                     if result and result.multi_hand_landmarks:
-                        for hand_landmarks in result.multi_hand_landmarks:
+                        # Angle, zone membership and finger flags of all hands in one pass
+                        features = extract_features(result.multi_hand_landmarks, (forward_rect, backward_rect),
+                                                    width, height)
+                        for index, hand_landmarks in enumerate(result.multi_hand_landmarks):
                             try:
-                                self.mp_drawing.draw_landmarks(frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-                                landmarks = hand_landmarks.landmark
-                                
-                                # Get the wrist and middle MCP for angle calculation
-                                wrist = landmarks[0]
-                                middle_mcp = landmarks[9]
-                                
-                                # Calculate rotation angle for turning
-                                angle = math.atan2(wrist.y - middle_mcp.y, wrist.x - middle_mcp.x)
-                                angle = math.degrees(angle) - 90
-                                if angle <= -180:
-                                    angle += 360
-                                elif angle > 180:
-                                    angle -= 360
-                                
-                                # Determine if landmarks[9] and landmarks[13] are in the zones
-                                index_mcp = landmarks[9]
-                                middle_pip = landmarks[13]
+                                if index != operator:
+                                    # Bystanders' hands are drawn in grey and ignored
+                                    draw_landmarks(frame, hand_landmarks, landmark_color=(128, 128, 128))
+                                    continue
+                                draw_landmarks(frame, hand_landmarks)
                                 
-                                # Convert normalized coordinates to pixel coordinates
-                                index_mcp_x = int(index_mcp.x * width)
-                                index_mcp_y = int(index_mcp.y * height)
-                                middle_pip_x = int(middle_pip.x * width)
-                                middle_pip_y = int(middle_pip.y * height)
-                                
-                                # Check if the hand is inside the forward zone
-                                if (forward_rect[0] < index_mcp_x < forward_rect[0] + forward_rect[2] and
-                                    forward_rect[1] < index_mcp_y < forward_rect[1] + forward_rect[3] and
-                                    forward_rect[0] < middle_pip_x < forward_rect[0] + forward_rect[2] and
-                                    forward_rect[1] < middle_pip_y < forward_rect[1] + forward_rect[3]):
-                                    self.command = "FORWARD"
-                                
-                                # Check if the hand is inside the backward zone
-                                elif (backward_rect[0] < index_mcp_x < backward_rect[0] + backward_rect[2] and
-                                    backward_rect[1] < index_mcp_y < backward_rect[1] + backward_rect[3] and
-                                    backward_rect[0] < middle_pip_x < backward_rect[0] + backward_rect[2] and
-                                    backward_rect[1] < middle_pip_y < backward_rect[1] + backward_rect[3]):
-                                    self.command = "BACKWARD"
-                                
-                                # Check for left or right turns based on angle
-                                elif angle > turn_threshold:
-                                    self.command = "RIGHT"
-                                elif angle < -turn_threshold:
-                                    self.command = "LEFT"
+                                # Both landmarks[9] and landmarks[13] inside the forward or
+                                # backward zone, else a turn beyond the threshold angle
+                                self.command = zone_command(features, index, ("FORWARD", "BACKWARD"),
+                                                            turn_threshold)
                                 
                                 # Display angle on frame
-                                cv2.putText(frame, f"Angle: {angle:.1f}", (50, 100), 
+                                cv2.putText(frame, f"Angle: {features.angle[index]:.1f}", (50, 100), 
                                             cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
                             except Exception as e:
                                 print(f"Hand landmark processing error: {e}")
@@ -245,10 +490,23 @@ class CameraThread(QThread):
                     except Exception as e:
                         print(f"Command display error: {e}")
                     
+                    # Frame sequence number, capture age and capture counters
+                    stats = self.cap.stats
+                    cv2.putText(frame, f"#{info.sequence}  {info.latency():.0f} ms  {stats.fps:.1f} FPS  "
+                                f"jitter {stats.jitter_ms:.1f} ms  dropped {stats.dropped}",
+                                (10, height - 15), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                    
                     # Send the command to ESP32 - only if still running
                     if self.running:
                         try:
                             self.send_command_to_esp32(self.command)
+                            info.mark('send')
+                            if self.time_to_first_command is None:
+                                self.time_to_first_command = info.stages['send'] - self.started
+                                text = (f"Time to first command: {self.time_to_first_command * 1000:.0f} ms, "
+                                        f"first frame {(info.stages['send'] - info.timestamp) * 1000:.0f} ms")
+                                print(text)
+                                self.first_command.emit(text)
                         except Exception as e:
                             print(f"Command sending error: {e}")
                     
@@ -257,15 +515,35 @@ class CameraThread(QThread):
                         try:
                             self.update_command.emit(self.command)
                             
-                            # Convert the frame to QImage and emit signal
-                            rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                            h, w, ch = rgb_image.shape
-                            bytes_per_line = ch * w
-                            qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
+                            # Wrap the BGR frame in a QImage without a colour conversion;
+                            # the frame buffer stays valid until the preprocessor ring wraps around
+                            h, w, ch = frame.shape
+                            bytes_per_line = frame.strides[0]
+                            qt_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_BGR888)
                             
                             # Only emit if image is valid
                             if not qt_image.isNull():
                                 self.update_frame.emit(qt_image)
+                                info.mark('display')
+                            
+                            stats.record_stages(info)
+                            now = time.monotonic()
+                            
+                            # Adjust quality to the frame's capture-to-display latency,
+                            # but not while a model with the last settings is being built
+                            if not self.backend_builder.pending and self.quality.update(info.latency(), now):
+                                print(f"Quality {self.quality.decision}")
+                                self.backend_builder.request(self.backend_params())
+                            
+                            if now - last_stats_time >= STATS_INTERVAL:
+                                self.update_stats.emit(f"{stats.summary()}, "
+                                                       f"{self.change_detector.frames_skipped} unchanged frames skipped, "
+                                                       f"{self.predictor.frames_predicted} predicted "
+                                                       f"(cadence {self.predictor.cadence}), "
+                                                       f"{self.arbiter.describe()}"
+                                                       f"{self.supervisor_stats()}\n"
+                                                       f"{self.quality.describe()}: {self.quality.decision}")
+                                last_stats_time = now
                         except Exception as e:
                             print(f"Signal emission error: {e}")
                 except Exception as e:
@@ -294,15 +572,62 @@ class CameraThread(QThread):
         except Exception as e:
             print(f"Failed to send command: {e}")
     
+    def supervisor_stats(self):
+        """Failover counters when inference runs in a supervised worker, else an empty string."""
+        backend = self.backend
+        if not isinstance(backend, SupervisedBackend):
+            return ""
+        return f", {backend.failovers} failovers (last {backend.failover_ms:.0f} ms)"
+    
+    @property
+    def dropped_frames(self):
+        return self.cap.frames_dropped if self.cap is not None else 0
+    
+    @property
+    def capture_stats(self):
+        """Effective FPS, inter-frame jitter, dropped frames and per-stage latency."""
+        return self.cap.stats.snapshot() if self.cap is not None else {}
+    
     def stop(self):
         self.running = False
         # Release resources in a safe way
         if self.cap is not None:
+            print(f"Camera stopped ({self.cap.frames_dropped} stale frames dropped, "
+                  f"{self.roi_tracker.frames_cropped} cropped / {self.roi_tracker.frames_full} full-frame inferences)")
+            print(f"Capture: {self.cap.stats.summary()}")
+            if hasattr(self.cap, 'is_current'):
+                print(f"Dropped {self.frames_torn} frames overwritten in the frame ring while being read")
+            print(f"Inference skipped on {self.change_detector.frames_skipped} unchanged frames "
+                  f"({self.change_detector.skip_ratio:.0%})")
+            print(f"Landmarks predicted on {self.predictor.frames_predicted} frames "
+                  f"({self.predictor.predict_ratio:.0%}), final cadence {self.predictor.cadence}")
+            if self.cache is not None:
+                print(f"Landmark cache: {self.cache.summary()}")
+                self.cache.close()
+                self.cache = None
+                self.cache_params = None
+            print(f"Operator hand locked {self.arbiter.locks} times, "
+                  f"{self.arbiter.hands_ignored} other hands ignored")
+            print(f"Ended at {self.quality.describe()} after {self.quality.steps_down} steps down "
+                  f"and {self.quality.steps_up} steps up")
             self.cap.release()
             self.cap = None
-        if self.hands is not None:
-            self.hands.close()
-            self.hands = None
+        if self.publisher is not None:
+            self.publisher.close()
+            self.publisher = None
+        if self.warmer is not None:
+            self.warmer.cancel()
+            self.warmer = None
+        if self.backend_builder is not None:
+            self.backend_builder.stop()
+            self.backend_builder = None
+        if self.backend is not None:
+            print(f"Landmark backend '{self.backend.name}': {self.backend.results_received} results for "
+                  f"{self.backend.frames_submitted} frames, {self.backend.inference_ms:.1f} ms per result")
+            if isinstance(self.backend, SupervisedBackend):
+                print(f"Inference supervisor: {self.backend.summary()}")
+            self.backend.close()
+            self.backend = None
 
 # Zone Editor Widget
 class ZoneEditorWidget(QWidget):
@@ -383,7 +708,30 @@ class GestureControlApp(QMainWindow):
         self.settings = load_settings()
         self.camera_thread = None
         self.resize_timer = None
+        self.closing = False
         self.initUI()
+        self.warmer = None
+        self.start_warmup()
+    
+    def start_warmup(self):
+        """Build and warm the landmark model in the background so Start attaches to a hot model."""
+        if self.warmer is not None:
+            self.warmer.cancel()
+        self.warmer = start_warmup(self.settings)
+        self.startup_label.setText("Warming up hand detection model...")
+        QTimer.singleShot(100, self.check_warmup)
+    
+    def check_warmup(self):
+        warmer = self.warmer
+        if warmer is None or self.camera_thread is not None:
+            return
+        if warmer.ready:
+            self.startup_label.setText(f"Model ready (built in {warmer.build_time * 1000:.0f} ms, "
+                                       f"warmed up in {warmer.warmup_time * 1000:.0f} ms)")
+        elif warmer.error is not None:
+            self.startup_label.setText("Model warm-up failed; it will be built on Start")
+        else:
+            QTimer.singleShot(100, self.check_warmup)
         
     def resizeEvent(self, event):
         # Handle window resize events safely
@@ -421,6 +769,14 @@ class GestureControlApp(QMainWindow):
         self.command_label = QLabel("Command: STOP")
         self.command_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #009900;")
         
+        # Capture statistics (frame rate, jitter, drops, latency)
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet("color: #666666;")
+        
+        # Model warm-up state and time to first command
+        self.startup_label = QLabel("")
+        self.startup_label.setStyleSheet("color: #666666;")
+        
         # Camera controls
         camera_control_layout = QHBoxLayout()
         
@@ -439,6 +795,8 @@ class GestureControlApp(QMainWindow):
         left_layout = QVBoxLayout(left_panel)
         left_layout.addWidget(self.camera_feed)
         left_layout.addWidget(self.command_label)
+        left_layout.addWidget(self.stats_label)
+        left_layout.addWidget(self.startup_label)
         left_layout.addLayout(camera_control_layout)
         
         # Right panel - Settings
@@ -577,6 +935,9 @@ class GestureControlApp(QMainWindow):
         self.setCentralWidget(main_widget)
     
     def start_camera(self):
+        # Time to first command is measured from here
+        started = time.monotonic()
+        
         # Update network settings before starting
         self.settings['network']['ip_address'] = self.ip_input.text()
         self.settings['network']['port'] = self.port_input.value()
@@ -597,21 +958,21 @@ class GestureControlApp(QMainWindow):
         # Disable start button to prevent multiple clicks
         self.start_button.setEnabled(False)
         
-        # Disable all parameter controls while camera is running
+        # Disable the connection controls while camera is running. Detection,
+        # threshold and zone controls stay live: the camera thread applies them
+        # between frames and rebuild the model in the background when needed.
         self.ip_input.setEnabled(False)
         self.port_input.setEnabled(False)
-        self.detection_conf_slider.setEnabled(False)
-        self.tracking_conf_slider.setEnabled(False)
-        self.turn_threshold_slider.setEnabled(False)
-        self.forward_zone_editor.setEnabled(False)
-        self.backward_zone_editor.setEnabled(False)
         self.save_settings_button.setEnabled(False)
         self.reset_settings_button.setEnabled(False)
         
         # Create and start camera thread
-        self.camera_thread = CameraThread(self.settings)
+        warmer, self.warmer = self.warmer, None
+        self.camera_thread = CameraThread(self.settings, warmer, started)
         self.camera_thread.update_frame.connect(self.update_frame)
         self.camera_thread.update_command.connect(self.update_command)
+        self.camera_thread.update_stats.connect(self.stats_label.setText)
+        self.camera_thread.first_command.connect(self.startup_label.setText)
         self.camera_thread.initialization_complete.connect(self.on_camera_initialized)
         self.camera_thread.start()
     
@@ -643,6 +1004,10 @@ class GestureControlApp(QMainWindow):
             except Exception as e:
                 print(f"Error clearing camera feed: {e}")
         
+        # Warm up a model for the next start
+        if self.warmer is None and not self.closing:
+            self.start_warmup()
+        
         # Update UI
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
@@ -773,12 +1138,46 @@ class GestureControlApp(QMainWindow):
     
     def closeEvent(self, event):
         # Stop camera thread when closing the application
+        self.closing = True
         self.stop_camera()
+        if self.warmer is not None:
+            self.warmer.cancel()
+            self.warmer = None
         event.accept()
 
+# Measure thread counts and CPU placements on a reference clip and keep the best one
+def tune_performance(clip, frames):
+    settings = load_settings()
+    detection = settings['detection']
+    # Measured in-process, without the supervisor, pinned by the configuration under test
+    params = backend_params(settings, quality_levels(settings)[0])
+    params.pop('inference_deadline_ms')
+    params.pop('worker_cpus')
+    best = tune(clip, frames, params, detection.get('inference_width', 0))
+    if best is None:
+        print("No configuration could be measured; settings left unchanged")
+        return
+    settings['performance'] = best
+    save_settings(settings)
+    print(f"Saved to {SETTINGS_FILE}")
+
 # Main application entry point
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
+def main():
+    parser = argparse.ArgumentParser(description="Gesture control GUI")
+    parser.add_argument('--tune', metavar='CLIP',
+                        help="Tune OpenCV threads and CPU affinity on a reference clip, save the best and exit")
+    parser.add_argument('--tune-frames', type=int, default=300, help="Frames measured per configuration")
+    args, qt_args = parser.parse_known_args()
+    if args.tune:
+        tune_performance(args.tune, args.tune_frames)
+        sys.exit(0)
+    
+    # Thread counts and process affinity must be set before any thread pool starts
+    apply_cpu_config(load_settings().get('performance'))
+    app = QApplication(sys.argv[:1] + qt_args)
     window = GestureControlApp()
     window.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    sys.exit(app.exec_())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+import argparse
+import json
+import multiprocessing
+import queue
+import socket
+import threading
+import time
+
+from core.capture import PACING_FAST, PACING_REALTIME
+from core.landmarks import BACKEND_SOLUTIONS, BACKENDS
+
+# How often workers report their state to the supervisor (seconds)
+STATS_INTERVAL = 1.0
+
+def send_command(ip, port, command):
+    """Send a single UDP command to an ESP32."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(0.5)
+            sock.sendto(command.encode(), (ip, port))
+    except Exception as e:
+        print(f"Failed to send {command} to {ip}:{port}: {e}")
+
+def _run_worker(index, robot, pacing, inference_width, backend, stop_event, stats_queue):
+    """Run one GestureController for one capture source and robot (worker process entry point)."""
+    import cv2
+    from gesture_control_simple import GestureController
+
+    # One process per camera already uses every core; keep OpenCV from
+    # starting its own thread pool on top of that
+    cv2.setNumThreads(1)
+
+    # Workers share the landmark cache directory: a clip replayed by several
+    # robots maps to the same entry, and each save replaces it atomically
+    controller = GestureController(robot['ip'], robot['port'], source=robot['source'], pacing=pacing,
+                                   show_window=False, inference_width=inference_width, verbose=False,
+                                   backend=backend)
+
+    def report():
+        last_frames = 0
+        last_time = time.monotonic()
+        while True:
+            stopping = stop_event.wait(STATS_INTERVAL)
+            if stopping:
+                controller.running = False
+            now = time.monotonic()
+            frames = controller.frames_processed
+            stats_queue.put({
+                'index': index,
+                'frames': frames,
+                'fps': (frames - last_frames) / (now - last_time),
+                'command': controller.command,
+                'dropped': controller.dropped_frames,
+                'jitter_ms': controller.capture_stats.get('jitter_ms', 0.0),
+                'skipped': controller.change_detector.frames_skipped,
+                'running': controller.running,
+            })
+            last_frames, last_time = frames, now
+            if stopping or not controller.running:
+                return
+
+    reporter = threading.Thread(target=report, daemon=True)
+    reporter.start()
+    try:
+        controller.run()
+    finally:
+        controller.running = False
+        reporter.join(timeout=STATS_INTERVAL * 2)
+
+class MultiCameraController:
+    """
+    Drive several robots from one workstation, one camera per robot.
+
+    Every robot gets its own worker process running a ``GestureController``
+    on its capture source, so MediaPipe inference for each camera runs on its
+    own core instead of sharing one interpreter lock. Workers report frame
+    rate and state once per second; the supervisor prints an aggregated
+    health table, sends STOP to any robot whose worker dies, and on shutdown
+    stops every worker and sends STOP to every robot.
+    """
+
+    def __init__(self, robots, pacing=PACING_REALTIME, inference_width=640, backend=BACKEND_SOLUTIONS):
+        self.robots = robots
+        self.pacing = pacing
+        self.inference_width = inference_width
+        self.backend = backend
+
+        # Spawned (not forked) workers so each gets a clean MediaPipe/OpenCV state
+        self.context = multiprocessing.get_context('spawn')
+        self.stop_event = self.context.Event()
+        self.stats_queue = self.context.Queue()
+        self.workers = []
+        self.stats = {}
+        self.failed = set()
+
+    def start(self):
+        """Start one worker process per robot."""
+        for index, robot in enumerate(self.robots):
+            worker = self.context.Process(
+                target=_run_worker,
+                args=(index, robot, self.pacing, self.inference_width, self.backend, self.stop_event,
+                      self.stats_queue),
+                name=f"gesture-worker-{index}",
+                daemon=True
+            )
+            worker.start()
+            self.workers.append(worker)
+
+    def _collect_stats(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                stats = self.stats_queue.get(timeout=remaining)
+            except queue.Empty:
+                return
+            self.stats[stats['index']] = stats
+
+    def _check_health(self):
+        for index, worker in enumerate(self.workers):
+            if index in self.failed or worker.is_alive():
+                continue
+            # Replayed clips end normally; anything else is a crash
+            if worker.exitcode != 0:
+                print(f"Worker {index} exited with code {worker.exitcode}")
+            robot = self.robots[index]
+            send_command(robot['ip'], robot['port'], "STOP")
+            self.failed.add(index)
+
+    def print_health(self):
+        total_fps = 0.0
+        print("-" * 72)
+        for index, robot in enumerate(self.robots):
+            stats = self.stats.get(index)
+            alive = self.workers[index].is_alive() if index < len(self.workers) else False
+            if stats is None:
+                state = "starting..." if alive else "failed"
+                print(f"[{index}] {robot['ip']}:{robot['port']:<5} source={robot['source']!s:<12} {state}")
+                continue
+            if alive:
+                total_fps += stats['fps']
+            state = "running" if alive else "stopped"
+            print(f"[{index}] {robot['ip']}:{robot['port']:<5} source={robot['source']!s:<12} "
+                  f"{state:<8} {stats['fps']:5.1f} FPS  frames={stats['frames']:<6} "
+                  f"dropped={stats['dropped']:<5} skipped={stats['skipped']:<5} jitter={stats['jitter_ms']:4.1f}ms "
+                  f"command={stats['command']}")
+        print(f"Total: {total_fps:.1f} FPS across {sum(w.is_alive() for w in self.workers)} workers")
+
+    def run(self):
+        """Supervise the workers until they all finish or the user interrupts."""
+        self.start()
+        try:
+            while any(worker.is_alive() for worker in self.workers):
+                self._collect_stats(STATS_INTERVAL)
+                self._check_health()
+                self.print_health()
+        except KeyboardInterrupt:
+            print("\nInterrupted by user")
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Stop every worker and make sure every robot receives STOP."""
+        self.stop_event.set()
+        for worker in self.workers:
+            worker.join(timeout=3.0)
+            if worker.is_alive():
+                print(f"Warning: {worker.name} did not terminate properly")
+                worker.terminate()
+                worker.join(timeout=1.0)
+        self._collect_stats(0.1)
+
+        for robot in self.robots:
+            send_command(robot['ip'], robot['port'], "STOP")
+        self.print_health()
+
+def parse_robot(value):
+    """Parse a SOURCE=IP[:PORT] command-line robot definition."""
+    source, _, target = value.partition('=')
+    if not target:
+        raise argparse.ArgumentTypeError("expected SOURCE=IP[:PORT]")
+    ip, _, port = target.partition(':')
+    return {'source': source, 'ip': ip, 'port': int(port) if port else 4210}
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Drive several robots, one camera and worker process each")
+    parser.add_argument('--robot', action='append', type=parse_robot, default=[], metavar='SOURCE=IP[:PORT]',
+                        help="Capture source and ESP32 target for one robot (repeatable)")
+    parser.add_argument('--config', help="JSON file with a list of {source, ip, port} robot entries")
+    parser.add_argument('--pacing', choices=[PACING_REALTIME, PACING_FAST], default=PACING_REALTIME,
+                        help="Replay at the recorded frame rate or as fast as possible")
+    parser.add_argument('--inference-width', type=int, default=640,
+                        help="Width of the frame passed to MediaPipe (0 = full resolution)")
+    parser.add_argument('--backend', choices=list(BACKENDS), default=BACKEND_SOLUTIONS,
+                        help="Landmark backend used by every worker")
+    return parser.parse_args()
+
+def main():
+    """Main function to run the multi-camera controller."""
+    args = parse_args()
+    robots = list(args.robot)
+    if args.config:
+        with open(args.config, 'r') as f:
+            robots.extend({'port': 4210, **robot} for robot in json.load(f))
+    if not robots:
+        print("No robots configured; use --robot SOURCE=IP[:PORT] or --config FILE")
+        return
+
+    controller = MultiCameraController(robots, pacing=args.pacing, inference_width=args.inference_width,
+                                       backend=args.backend)
+    controller.run()
+    print("Multi-camera gesture control stopped")
+
+if __name__ == "__main__":
+    main()
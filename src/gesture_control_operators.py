@@ -0,0 +1,237 @@
+import argparse
+import json
+import os
+import socket
+import time
+
+import cv2
+
+from core.arbitration import HandSlotTracker
+from core.capture import PACING_FAST, PACING_REALTIME, open_capture
+from core.features import extract_features, zone_command, zone_rects
+from core.landmarks import BACKEND_SOLUTIONS, BACKENDS, create_landmark_backend, draw_landmarks
+from core.preprocess import FramePreprocessor
+
+# The GUI's settings file; its 'operators' list maps hand slots to robots
+SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'settings.json')
+
+# How often the per-operator table is printed (seconds)
+STATS_INTERVAL = 1.0
+
+# Colours the slots' hands and zones are drawn in (BGR)
+SLOT_COLORS = [(0, 200, 255), (255, 160, 0), (0, 220, 0), (220, 0, 220), (255, 255, 0), (0, 0, 255)]
+
+def default_zones(region):
+    """The GUI's default zone layout, scaled into a slot's horizontal ``(x0, x1)`` region."""
+    x0, x1 = region
+    width = x1 - x0
+    return {
+        'forward_zone': {'x': x0 + 0.4 * width, 'y': 0.0, 'width': 0.2 * width, 'height': 0.3},
+        'backward_zone': {'x': x0 + 0.4 * width, 'y': 0.7, 'width': 0.2 * width, 'height': 0.3},
+        'turn_angle_threshold': 20
+    }
+
+def load_operators(path=SETTINGS_FILE):
+    """
+    Read the operator slots from the settings file.
+
+    Each entry is ``{'ip', 'port', 'region': {'x', 'width'}, 'zones': {...}}``;
+    ``region`` is the horizontal strip of the frame the operator stands in
+    (default: equal strips, left to right) and ``zones`` uses the GUI's zone
+    format (default: the GUI layout scaled into the region).
+    """
+    with open(path, 'r') as f:
+        return normalize_operators(json.load(f).get('operators', []))
+
+def normalize_operators(operators):
+    count = len(operators)
+    slots = []
+    for index, operator in enumerate(operators):
+        region = operator.get('region') or {'x': index / count, 'width': 1.0 / count}
+        span = (region['x'], region['x'] + region['width'])
+        slots.append({
+            'ip': operator['ip'],
+            'port': operator.get('port', 4210),
+            'region': span,
+            'zones': operator.get('zones') or default_zones(span),
+        })
+    return slots
+
+def parse_robot(value):
+    """Parse an IP[:PORT] command-line robot definition."""
+    ip, _, port = value.partition(':')
+    return {'ip': ip, 'port': int(port) if port else 4210}
+
+class MultiOperatorController:
+    """
+    Drive several robots from one camera, one operator hand per robot.
+
+    Every frame goes through a single landmark inference with
+    ``max_num_hands`` equal to the number of operators. A ``HandSlotTracker``
+    keeps each hand bound to its operator slot across frames; each slot has
+    its own ESP32 target and zone layout, and gets STOP while its hand is
+    missing. Compared with one ``GestureController`` per robot, capture,
+    preprocessing and inference run once per frame instead of once per robot
+    (``benchmarks/multi_operator.py`` measures the difference).
+    """
+
+    def __init__(self, operators, source=0, pacing=PACING_REALTIME, inference_width=640,
+                 backend=BACKEND_SOLUTIONS, show_window=True):
+        self.operators = operators
+        self.width = 1280
+        self.height = 720
+        self.backend = create_landmark_backend(backend, min_detection_confidence=0.7, min_tracking_confidence=0.7,
+                                               max_num_hands=len(operators))
+        self.tracker = HandSlotTracker([operator['region'] for operator in operators])
+        self.cap = open_capture(source, self.width, self.height, pacing)
+        self.preprocessor = FramePreprocessor(display_buffers=1, inference_width=inference_width)
+        self.show_window = show_window
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        # All slots' zones go through one feature pass; each slot only
+        # considers its own forward/backward pair
+        self.zones = [rect for operator in operators
+                      for rect in zone_rects(operator['zones'], self.width, self.height)]
+        self.zone_commands = [[None] * (2 * slot) + ["FORWARD", "BACKWARD"] for slot in range(len(operators))]
+
+        self.commands = ["STOP"] * len(operators)
+        self.frames_with_hand = [0] * len(operators)
+        self.frames_processed = 0
+        self.running = False
+
+    def send_command(self, slot, command):
+        operator = self.operators[slot]
+        try:
+            self.sock.sendto(command.encode(), (operator['ip'], operator['port']))
+        except OSError as e:
+            print(f"Failed to send {command} to {operator['ip']}:{operator['port']}: {e}")
+
+    def draw_zones(self, frame):
+        for slot, operator in enumerate(self.operators):
+            color = SLOT_COLORS[slot % len(SLOT_COLORS)]
+            for name, (x, y, w, h) in zip(("FORWARD", "BACKWARD"), self.zones[2 * slot:2 * slot + 2]):
+                cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
+                cv2.putText(frame, name, (x, max(y - 10, 10)), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+            x0 = int(operator['region'][0] * self.width)
+            cv2.line(frame, (x0, 0), (x0, self.height), (128, 128, 128), 1)
+            cv2.putText(frame, f"{slot}: {self.commands[slot]}", (x0 + 10, self.height // 2),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.9, color, 2)
+
+    def process_frame(self, frame):
+        """Run one inference for all operators and return the annotated frame and the per-slot commands."""
+        frame, rgb_frame = self.preprocessor.process(frame)
+        result = self.backend.process(rgb_frame)
+        if result is None:
+            # Asynchronous backend without a new result: keep the last commands
+            self.draw_zones(frame)
+            return frame, self.commands
+
+        assigned = self.tracker.assign(result)
+        operator_hands = {index: slot for slot, index in enumerate(assigned) if index is not None}
+        commands = ["STOP"] * len(self.operators)
+        features = extract_features(result.multi_hand_landmarks, self.zones, self.width, self.height)
+        for index, hand_landmarks in enumerate(result.multi_hand_landmarks or ()):
+            slot = operator_hands.get(index)
+            if slot is None:
+                draw_landmarks(frame, hand_landmarks, landmark_color=(128, 128, 128))
+                continue
+            draw_landmarks(frame, hand_landmarks, landmark_color=SLOT_COLORS[slot % len(SLOT_COLORS)])
+            commands[slot] = zone_command(features, index, self.zone_commands[slot],
+                                          self.operators[slot]['zones'].get('turn_angle_threshold', 20))
+            self.frames_with_hand[slot] += 1
+        self.commands = commands
+        self.draw_zones(frame)
+        return frame, commands
+
+    def print_stats(self, fps):
+        per_robot = self.backend.inference_ms / len(self.operators)
+        print(f"{fps:5.1f} FPS, inference {self.backend.inference_ms:.1f} ms per frame "
+              f"({per_robot:.1f} ms per robot)")
+        for slot, operator in enumerate(self.operators):
+            print(f"  [{slot}] {operator['ip']}:{operator['port']:<5} {self.commands[slot]:<8} "
+                  f"hand in {self.frames_with_hand[slot]} of {self.frames_processed} frames")
+
+    def run(self):
+        print(f"Driving {len(self.operators)} robots from one camera. Press 'q' to quit")
+        if not self.cap.isOpened():
+            print("Error: Could not open capture source.")
+
+        self.running = True
+        last_stats_time = time.monotonic()
+        last_frames = 0
+        while self.running and self.cap.isOpened():
+            ret, captured = self.cap.read()
+            if not ret:
+                if self.cap.is_live:
+                    print("Failed to read frame from camera")
+                break
+            frame, commands = self.process_frame(captured)
+            self.cap.recycle(captured)
+            self.frames_processed += 1
+            for slot, command in enumerate(commands):
+                self.send_command(slot, command)
+
+            now = time.monotonic()
+            if now - last_stats_time >= STATS_INTERVAL:
+                self.print_stats((self.frames_processed - last_frames) / (now - last_stats_time))
+                last_stats_time, last_frames = now, self.frames_processed
+
+            if self.show_window:
+                cv2.imshow("Multi-Operator Gesture Control", frame)
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+        self.cleanup()
+
+    def cleanup(self):
+        print("Cleaning up...")
+        self.running = False
+        for slot in range(len(self.operators)):
+            self.send_command(slot, "STOP")
+        print(f"Processed {self.frames_processed} frames, {self.tracker.claims} hands claimed a slot")
+        self.cap.release()
+        if self.show_window:
+            cv2.destroyAllWindows()
+        self.backend.close()
+        self.sock.close()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Drive several robots from one camera, one operator hand each")
+    parser.add_argument('--robot', action='append', type=parse_robot, default=[], metavar='IP[:PORT]',
+                        help="ESP32 target of the next operator, left to right (repeatable; "
+                             "default: the 'operators' list in settings.json)")
+    parser.add_argument('--settings', default=SETTINGS_FILE, help="Settings file with an 'operators' list")
+    parser.add_argument('--source', default='0',
+                        help="Camera index, stream URL, video file, image directory or recorded session")
+    parser.add_argument('--pacing', choices=[PACING_REALTIME, PACING_FAST], default=PACING_REALTIME,
+                        help="Replay at the recorded frame rate or as fast as possible")
+    parser.add_argument('--inference-width', type=int, default=640,
+                        help="Width of the frame passed to MediaPipe (0 = full resolution)")
+    parser.add_argument('--backend', choices=list(BACKENDS), default=BACKEND_SOLUTIONS,
+                        help="Landmark backend")
+    parser.add_argument('--no-window', action='store_true', help="Run without the preview window")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.robot:
+        operators = normalize_operators(args.robot)
+    elif os.path.exists(args.settings):
+        operators = load_operators(args.settings)
+    else:
+        operators = []
+    if not operators:
+        print("No operators configured; use --robot IP[:PORT] or an 'operators' list in settings.json")
+        return
+
+    controller = MultiOperatorController(operators, source=args.source, pacing=args.pacing,
+                                         inference_width=args.inference_width, backend=args.backend,
+                                         show_window=not args.no_window)
+    try:
+        controller.run()
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+        controller.cleanup()
+    print("Multi-operator gesture control stopped")
+
+if __name__ == "__main__":
+    main()
@@ -1,45 +1,203 @@
+import argparse
 import cv2
-import mediapipe as mp
-import math
 import socket
+import time
+
+from core.arbitration import HandArbiter
+from core.capture import PACING_FAST, PACING_REALTIME, SessionRecorder, open_capture
+from core.change import FrameChangeDetector
+from core.channels import ParallelInference
+from core.features import extract_features, zone_command
+from core.frame_bus import FrameBusPublisher
+from core.landmark_cache import LandmarkCache, clip_hash
+from core.landmarks import BACKEND_SOLUTIONS, BACKENDS, create_landmark_backend, draw_landmarks
+from core.offload import RemoteBackend
+from core.predict import LandmarkPredictor
+from core.preprocess import FramePreprocessor
+from core.rebuild import DebouncedRebuilder
+from core.supervisor import SupervisedBackend
 
 # WiFi Configuration
 ESP32_IP = "192.168.137.205"  # Replace with your ESP32's IP
 ESP32_PORT = 4210  # Port used by your ESP32
 
+# Width of the frame passed to MediaPipe (0 = full capture resolution)
+INFERENCE_WIDTH = 640
+
+# Frames whose thumbnail differs from the last inferred frame by less than this
+# many grey levels in every cell reuse the previous result (0 = always infer),
+# but inference still runs at least every MAX_SKIPPED_FRAMES + 1 frames
+CHANGE_THRESHOLD = 8.0
+MAX_SKIPPED_FRAMES = 5
+
+# Run full inference on at most every MAX_CADENCE-th frame while the hand moves
+# predictably, predicting the landmarks in between (1 = infer every frame)
+MAX_CADENCE = 3
+
+# With head pose enabled, hand and head-pose inference run in parallel and a
+# channel that takes longer than this is dropped for the frame
+CHANNEL_DEADLINE_MS = 100
+
+# A head pose older than this no longer counts as the operator facing the camera (seconds)
+HEAD_POSE_MAX_AGE = 0.3
+
+# Size limit of the on-disk landmark cache for replayed clips in MB (0 = off)
+LANDMARK_CACHE_MB = 256
+
+# Per-frame inference deadline in milliseconds; when set, inference runs in a
+# supervised worker process with a hot standby (0 = in this process)
+INFERENCE_DEADLINE_MS = 0
+
+# Commands of the top and bottom control boxes, in the order control_zones() returns them
+CONTROL_COMMANDS = ("BACKWARD", "FORWARD")
+
+# Hand tilt beyond which the robot turns (degrees)
+TURN_THRESHOLD = 20
+
+def control_boxes(width, height):
+    """Top (BACKWARD) and bottom (FORWARD) control boxes as ``(top_left, bottom_right)`` pixel corners."""
+    center_x = width // 2
+    top_box = ((center_x - 100, 0), (center_x + 100, 200))
+    bottom_box = ((center_x - 100, height - 200), (center_x + 100, height))
+    return top_box, bottom_box
+
+def control_zones(width, height):
+    """The control boxes as ``(x, y, w, h)`` pixel rectangles for ``extract_features``."""
+    return [(left, top, right - left, bottom - top)
+            for (left, top), (right, bottom) in control_boxes(width, height)]
+
+def hand_command(landmarks, width, height):
+    """Return ``(command, angle)`` for one hand's landmarks in a ``width`` x ``height`` frame."""
+    features = extract_features([landmarks], control_zones(width, height), width, height)
+    return zone_command(features, 0, CONTROL_COMMANDS, TURN_THRESHOLD), features.angle[0]
+
 class GestureController:
-    def __init__(self, esp32_ip=ESP32_IP, esp32_port=ESP32_PORT):
+    def __init__(self, esp32_ip=ESP32_IP, esp32_port=ESP32_PORT, source=0,
+                 pacing=PACING_REALTIME, record_path=None, show_window=True,
+                 inference_width=INFERENCE_WIDTH, verbose=True, publish_bus=None,
+                 change_threshold=CHANGE_THRESHOLD, max_skipped_frames=MAX_SKIPPED_FRAMES,
+                 backend=BACKEND_SOLUTIONS, model_path=None, max_cadence=MAX_CADENCE,
+                 inference_deadline_ms=INFERENCE_DEADLINE_MS, offload=None, operator_hand='',
+                 head_pose=None, channel_deadline_ms=CHANNEL_DEADLINE_MS, landmark_cache_mb=LANDMARK_CACHE_MB):
         # Network configuration
         self.esp32_ip = esp32_ip
         self.esp32_port = esp32_port
         
-        # Initialize MediaPipe Hands
-        self.mp_hands = mp.solutions.hands
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.hands = self.mp_hands.Hands(
-            min_detection_confidence=0.7, 
-            min_tracking_confidence=0.7
-        )
+        # Initialize the hand landmark backend (legacy Hands or Tasks HandLandmarker)
+        self.offload = offload
+        self.inference_deadline_ms = inference_deadline_ms
+        self.backend_params = {
+            'backend': backend,
+            'min_detection_confidence': 0.7,
+            'min_tracking_confidence': 0.7,
+        }
+        if model_path:
+            self.backend_params['model_path'] = model_path
+        self.backend = self.create_backend(self.backend_params)
         
-        # Initialize Camera
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        # Locks onto one operator hand; while locked the model is rebuilt in the
+        # background to track a single hand (the inference server decides for itself)
+        self.arbiter = HandArbiter(operator_hand)
+        self.backend_builder = None if offload else DebouncedRebuilder(self.create_backend, self.backend_params)
         
-        # Calculate the screen center and box coordinates
+        # Optional head pose as a dead-man switch: commands only pass while the
+        # operator faces the camera. Hand and head-pose inference then run in
+        # parallel on the same frame.
+        self.head_estimator = None
+        self.channels = None
+        self.head = None
+        self.head_time = 0.0
+        self.head_frame = None
+        if head_pose:
+            from core.headpose import HeadPoseEstimator
+            self.head_estimator = HeadPoseEstimator(head_pose)
+            # A hands job carries the backend it was submitted to, so a late job
+            # keeps using that instance even after a rebuild was swapped in
+            self.channels = ParallelInference({'hands': lambda job: job[0].process(job[1]),
+                                               'head': self.head_estimator.process},
+                                              deadline=channel_deadline_ms / 1000.0)
+        
+        # Frame size the control boxes are laid out for
         self.width = 1280
         self.height = 720
-        center_x = self.width // 2
-        center_y = self.height // 2
         
         # Define the top and bottom box coordinates
-        self.top_box_top_left = (center_x - 100, 0)
-        self.top_box_bottom_right = (center_x + 100, 200)
-        self.bottom_box_top_left = (center_x - 100, self.height - 200)
-        self.bottom_box_bottom_right = (center_x + 100, self.height)
+        ((self.top_box_top_left, self.top_box_bottom_right),
+         (self.bottom_box_top_left, self.bottom_box_bottom_right)) = control_boxes(self.width, self.height)
+        self.zones = control_zones(self.width, self.height)
+        
+        # Initialize capture: a camera index, stream URL, video file,
+        # image directory or recorded session
+        self.cap = open_capture(source, self.width, self.height, pacing)
+        self.recorder = SessionRecorder(record_path) if record_path else None
+        self.publisher = FrameBusPublisher(publish_bus) if publish_bus else None
+        # Frames read from a shared-memory ring can be overwritten while they are copied
+        self.frame_is_current = getattr(self.cap, 'is_current', None)
+        self.frames_torn = 0
+        self.preprocessor = FramePreprocessor(display_buffers=1, inference_width=inference_width)
+        self.change_detector = FrameChangeDetector(change_threshold, max_skipped_frames)
+        self.predictor = LandmarkPredictor(max_cadence)
+        self.result = None
         
+        # Replayed clips reuse the landmarks of earlier runs with the same detection
+        # settings (synchronous in-process inference only: results must belong to
+        # the frame they were submitted with)
+        self.cache = None
+        clip = clip_hash(source) if landmark_cache_mb and not offload and not inference_deadline_ms \
+            and not BACKENDS[backend].asynchronous else None
+        if clip:
+            self.cache = LandmarkCache(max_bytes=landmark_cache_mb * 1024 * 1024)
+            self.cache.open(clip, dict(self.backend_params, inference_width=inference_width,
+                                       size=(self.width, self.height)))
+        self.show_window = show_window
+        self.verbose = verbose
+        
+        self.command = "STOP"
+        self.frames_processed = 0
         self.running = False
     
+    @property
+    def dropped_frames(self):
+        return self.cap.frames_dropped if self.cap else 0
+    
+    @property
+    def capture_stats(self):
+        """Effective FPS, inter-frame jitter, dropped frames and per-stage latency."""
+        return self.cap.stats.snapshot() if self.cap else {}
+    
+    def draw_frame_info(self, frame, info):
+        """Overlay the frame's sequence number, capture age and the capture counters."""
+        stats = self.cap.stats
+        text = (f"#{info.sequence}  {info.latency():.0f} ms  {stats.fps:.1f} FPS  "
+                f"jitter {stats.jitter_ms:.1f} ms  dropped {stats.dropped}")
+        cv2.putText(frame, text, (10, self.height - 15), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+    
+    def create_backend(self, params):
+        if self.offload:
+            # Thin client: frames are JPEG-encoded and streamed to an inference server
+            return RemoteBackend(self.offload)
+        if self.inference_deadline_ms:
+            # Inference in a supervised worker process with a hot standby
+            return SupervisedBackend(deadline=self.inference_deadline_ms / 1000.0, **params)
+        return create_landmark_backend(**params)
+    
+    def swap_backend(self):
+        """Swap in a rebuilt landmark backend if one is ready (called between frames)."""
+        if self.backend_builder is None:
+            return
+        if self.channels is not None and self.channels.busy('hands'):
+            # The current backend is still inside a hands job that missed its
+            # deadline; leave the rebuilt one pending until that job returns
+            return
+        rebuilt = self.backend_builder.take()
+        if rebuilt is None:
+            return
+        old_backend, (self.backend, _) = self.backend, rebuilt
+        old_backend.close()
+        # Results from the old model must not be reused
+        self.change_detector.reset()
+        self.predictor.reset()
+    
     def send_command_to_esp32(self, command):
         """Send UDP command to ESP32."""
         try:
@@ -47,69 +205,104 @@ class GestureController:
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
                 # Send the command over UDP
                 sock.sendto(command.encode(), (self.esp32_ip, self.esp32_port))
-                print(f"Sent command: {command}")
+                if self.verbose:
+                    print(f"Sent command: {command}")
         except Exception as e:
             print(f"Failed to send command: {e}")
     
-    def process_frame(self, frame):
-        """Process a single frame and return the command."""
-        # Flip frame for a mirrored effect
-        frame = cv2.flip(frame, 1)
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    def process_frame(self, frame, timestamp=None, frame_index=None):
+        """
+        Process a single frame and return the command.
+        
+        ``timestamp`` is the frame's capture time (``time.monotonic()``), used to
+        predict the landmarks on frames between inferences. ``frame_index`` is
+        the frame's position in a replayed clip, used to look up cached landmarks.
+        The returned frame lives in a reusable buffer that the next call overwrites.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
         
-        # Process the frame with MediaPipe
-        result = self.hands.process(rgb_frame)
+        # Flip frame for a mirrored effect into a reusable buffer
+        frame = self.preprocessor.mirror(frame)
+        if self.frame_is_current is not None and not self.frame_is_current():
+            # The publisher wrapped around the ring during the copy: drop the
+            # torn frame and keep the last command
+            self.frames_torn += 1
+            return frame, self.command
+        self.swap_backend()
+        
+        # Process the (downscaled) RGB frame with the landmark backend, unless the
+        # frame is a duplicate or unchanged and the previous result can be reused.
+        # Asynchronous backends return None until a newer result is ready.
+        # Between inferences the landmarks are predicted from the hand's motion.
+        inference_due = self.predictor.due()
+        infer_hands = self.result is None or (inference_due and self.change_detector.should_infer(frame))
+        cached = None
+        if infer_hands and self.cache is not None and frame_index is not None:
+            cached = self.cache.get(frame_index)
+        if self.channels is not None:
+            # Hands and head pose in parallel; a channel that missed the deadline
+            # is left out (and skipped while it is still busy)
+            inputs = {}
+            if not self.channels.busy('head'):
+                # The head channel gets its own copy: the display frame is drawn on
+                # below and recycled next frame, while a late job may still read it
+                if self.head_frame is None or self.head_frame.shape != frame.shape:
+                    self.head_frame = frame.copy()
+                else:
+                    self.head_frame[...] = frame
+                inputs['head'] = self.head_frame
+            if infer_hands and cached is None and not self.channels.busy('hands'):
+                inputs['hands'] = (self.backend, self.preprocessor.prepare_inference(frame))
+            outputs = self.channels.run(inputs)
+            if 'head' in outputs:
+                self.head, self.head_time = outputs['head'], timestamp
+        if infer_hands:
+            if cached is not None:
+                latest = cached
+            elif self.channels is not None:
+                latest = outputs.get('hands')
+            else:
+                latest = self.backend.process(self.preprocessor.prepare_inference(frame))
+            if cached is None and latest is not None and self.cache is not None and frame_index is not None:
+                self.cache.put(frame_index, latest)
+            if latest is not None:
+                self.predictor.observe(latest, timestamp)
+                self.result = latest
+        elif not inference_due:
+            self.result = self.predictor.predict(timestamp) or self.result
+        result = self.result
         
         command = "STOP"  # Default command
         
-        if result.multi_hand_landmarks:
-            for hand_landmarks in result.multi_hand_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS
-                )
-                landmarks = hand_landmarks.landmark
-                
-                # Get the wrist and middle MCP for angle calculation
-                wrist = landmarks[0]
-                middle_mcp = landmarks[9]
-                
-                # Calculate rotation angle for turning
-                angle = math.atan2(wrist.y - middle_mcp.y, wrist.x - middle_mcp.x)
-                angle = math.degrees(angle) - 90
-                if angle <= -180:
-                    angle += 360
-                elif angle > 180:
-                    angle -= 360
-                
-                # Determine if landmarks[9] and landmarks[13] are in the boxes
-                index_mcp = landmarks[9]
-                middle_pip = landmarks[13]
-                
-                # Convert normalized coordinates to pixel coordinates
-                index_mcp_x = int(index_mcp.x * self.width)
-                index_mcp_y = int(index_mcp.y * self.height)
-                middle_pip_x = int(middle_pip.x * self.width)
-                middle_pip_y = int(middle_pip.y * self.height)
-                
-                # Check if the hand is inside the top box (BACKWARD)
-                if (self.top_box_top_left[0] < index_mcp_x < self.top_box_bottom_right[0] and
-                    self.top_box_top_left[1] < index_mcp_y < self.top_box_bottom_right[1] and
-                    self.top_box_top_left[0] < middle_pip_x < self.top_box_bottom_right[0] and
-                    self.top_box_top_left[1] < middle_pip_y < self.top_box_bottom_right[1]):
-                    command = "BACKWARD"
-                
-                # Check if the hand is inside the bottom box (FORWARD)
-                elif (self.bottom_box_top_left[0] < index_mcp_x < self.bottom_box_bottom_right[0] and
-                      self.bottom_box_top_left[1] < index_mcp_y < self.bottom_box_bottom_right[1] and
-                      self.bottom_box_top_left[0] < middle_pip_x < self.bottom_box_bottom_right[0] and
-                      self.bottom_box_top_left[1] < middle_pip_y < self.bottom_box_bottom_right[1]):
-                    command = "FORWARD"
-                
-                # Check for left or right turns based on angle
-                elif angle > 20:
-                    command = "RIGHT"
-                elif angle < -20:
-                    command = "LEFT"
+        # Merge the head-pose channel: without a recent pose facing the camera
+        # the hand command is not passed on
+        enabled = True
+        if self.channels is not None:
+            head = self.head if timestamp - self.head_time <= HEAD_POSE_MAX_AGE else None
+            enabled = head is not None and head.command == "STOP"
+            if head is not None:
+                self.head_estimator.draw(frame, head)
+            cv2.putText(frame, "Operator facing camera" if enabled else "Face the camera to drive",
+                        (50, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0) if enabled else (0, 0, 255), 2)
+        
+        # Only the operator's hand drives the robot
+        locked = self.arbiter.locked
+        operator = self.arbiter.select(result)
+        if self.backend_builder is not None and self.arbiter.locked != locked:
+            params = dict(self.backend_params, max_num_hands=1) if self.arbiter.locked else self.backend_params
+            self.backend_builder.request(params)
+        
+        if result is not None and result.multi_hand_landmarks:
+            # Angle, zone membership and finger flags of all hands in one pass
+            features = extract_features(result.multi_hand_landmarks, self.zones, self.width, self.height)
+            for index, hand_landmarks in enumerate(result.multi_hand_landmarks):
+                if index != operator:
+                    draw_landmarks(frame, hand_landmarks, landmark_color=(128, 128, 128))
+                    continue
+                draw_landmarks(frame, hand_landmarks)
+                if enabled:
+                    command = zone_command(features, index, CONTROL_COMMANDS, TURN_THRESHOLD)
                 
                 # Display the command on the frame
                 cv2.putText(frame, f"Command: {command}", (50, 50), 
@@ -130,25 +323,48 @@ class GestureController:
         print("Starting gesture control...")
         print("Press 'q' to quit")
         
+        if not self.cap.isOpened():
+            print("Error: Could not open capture source.")
+        
         self.running = True
         
         while self.running and self.cap.isOpened():
             ret, frame = self.cap.read()
             if not ret:
-                print("Failed to read frame from camera")
+                if self.cap.is_live:
+                    print("Failed to read frame from camera")
                 break
             
+            # Sequence number and capture time of this frame
+            info = self.cap.frame_info
+            
+            if self.recorder:
+                self.recorder.write(frame)
+            
+            # Share the raw captured frame with other processes, which mirror and
+            # infer on it themselves
+            if self.publisher:
+                self.publisher.publish(frame, info.timestamp)
+            
             # Process frame and get command
-            processed_frame, command = self.process_frame(frame)
+            processed_frame, self.command = self.process_frame(frame, info.timestamp, info.sequence)
+            self.cap.recycle(frame)
+            self.frames_processed += 1
+            info.mark('inference')
+            self.draw_frame_info(processed_frame, info)
             
             # Send command to ESP32
-            self.send_command_to_esp32(command)
+            self.send_command_to_esp32(self.command)
+            info.mark('send')
             
             # Display the frame
-            cv2.imshow("Hand Gesture Control", processed_frame)
+            if self.show_window:
+                cv2.imshow("Hand Gesture Control", processed_frame)
+                info.mark('display')
+            self.cap.stats.record_stages(info)
             
             # Check for quit command
-            if cv2.waitKey(1) & 0xFF == ord('q'):
+            if self.show_window and cv2.waitKey(1) & 0xFF == ord('q'):
                 break
         
         self.cleanup()
@@ -162,18 +378,106 @@ class GestureController:
         self.send_command_to_esp32("STOP")
         
         # Release resources
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+        if self.publisher:
+            self.publisher.close()
+            self.publisher = None
         if self.cap:
+            print(f"Processed {self.frames_processed} frames, dropped {self.cap.frames_dropped} stale frames")
+            if self.frame_is_current is not None:
+                print(f"Dropped {self.frames_torn} frames overwritten in the frame ring while being read")
+            print(f"Capture: {self.cap.stats.summary()}")
+            print(f"Inference skipped on {self.change_detector.frames_skipped} unchanged frames "
+                  f"({self.change_detector.skip_ratio:.0%})")
+            print(f"Landmarks predicted on {self.predictor.frames_predicted} frames "
+                  f"({self.predictor.predict_ratio:.0%}), final cadence {self.predictor.cadence}")
+            print(f"Operator hand locked {self.arbiter.locks} times, "
+                  f"{self.arbiter.hands_ignored} other hands ignored")
             self.cap.release()
-        cv2.destroyAllWindows()
+        if self.show_window:
+            cv2.destroyAllWindows()
         
-        if self.hands:
-            self.hands.close()
+        if self.cache:
+            print(f"Landmark cache: {self.cache.summary()}")
+            self.cache.close()
+            self.cache = None
+        if self.channels:
+            print(f"Inference channels: {self.channels.summary()}")
+            print(f"Head pose: {self.head_estimator.summary()}")
+            self.channels.close()
+            self.channels = None
+        if self.backend_builder:
+            self.backend_builder.stop()
+            self.backend_builder = None
+        if self.backend:
+            print(f"Landmark backend '{self.backend.name}': {self.backend.results_received} results for "
+                  f"{self.backend.frames_submitted} frames, {self.backend.inference_ms:.1f} ms per result")
+            if isinstance(self.backend, SupervisedBackend):
+                print(f"Inference supervisor: {self.backend.summary()}")
+            if isinstance(self.backend, RemoteBackend):
+                print(f"Inference server: {self.backend.round_trip_ms:.1f} ms round trip, "
+                      f"{self.backend.server_ms:.1f} ms on the server, "
+                      f"{self.backend.frames_dropped} stale frames not sent")
+            self.backend.close()
+            self.backend = None
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Hand gesture control for an ESP32 robot")
+    parser.add_argument('--ip', default=ESP32_IP, help="ESP32 IP address")
+    parser.add_argument('--port', type=int, default=ESP32_PORT, help="ESP32 UDP port")
+    parser.add_argument('--source', default='0',
+                        help="Camera index, stream URL, video file, image directory or recorded session")
+    parser.add_argument('--pacing', choices=[PACING_REALTIME, PACING_FAST], default=PACING_REALTIME,
+                        help="Replay at the recorded frame rate or as fast as possible")
+    parser.add_argument('--record', metavar='DIR', help="Record the captured frames as a replayable session")
+    parser.add_argument('--inference-width', type=int, default=INFERENCE_WIDTH,
+                        help="Width of the frame passed to MediaPipe (0 = full resolution)")
+    parser.add_argument('--backend', choices=list(BACKENDS), default=BACKEND_SOLUTIONS,
+                        help="Landmark backend: legacy solutions Hands or the Tasks HandLandmarker (live stream)")
+    parser.add_argument('--model-path', help="hand_landmarker.task bundle for the tasks backend")
+    parser.add_argument('--change-threshold', type=float, default=CHANGE_THRESHOLD,
+                        help="Reuse the previous result when a frame changed by less than this many grey levels (0 = off)")
+    parser.add_argument('--max-skipped-frames', type=int, default=MAX_SKIPPED_FRAMES,
+                        help="Run inference at least once every N+1 frames even if nothing changed")
+    parser.add_argument('--max-cadence', type=int, default=MAX_CADENCE,
+                        help="Infer at most every N-th frame while the hand moves predictably (1 = every frame)")
+    parser.add_argument('--inference-deadline-ms', type=float, default=INFERENCE_DEADLINE_MS,
+                        help="Run inference in a supervised worker with a hot standby that takes over "
+                             "when a frame misses this deadline (0 = in-process)")
+    parser.add_argument('--publish-bus', metavar='NAME',
+                        help="Publish the captured frames to a shared-memory frame ring (read with --source shm://NAME)")
+    parser.add_argument('--offload', metavar='HOST[:PORT]',
+                        help="Only capture here and stream frames to an inference server (src/inference_server.py)")
+    parser.add_argument('--operator-hand', choices=['Left', 'Right'], default='',
+                        help="Only lock onto this hand (as labelled in the mirrored preview)")
+    parser.add_argument('--head-pose', metavar='PREDICTOR_DAT',
+                        help="Require the operator to face the camera (dlib 68-point shape predictor file); "
+                             "head pose runs in parallel with hand inference")
+    parser.add_argument('--channel-deadline-ms', type=float, default=CHANNEL_DEADLINE_MS,
+                        help="Drop a hand or head-pose result that takes longer than this")
+    parser.add_argument('--landmark-cache-mb', type=int, default=LANDMARK_CACHE_MB,
+                        help="Reuse landmarks of earlier runs over the same clip with the same detection "
+                             "settings, keeping at most this many MB on disk (0 = off)")
+    parser.add_argument('--no-window', action='store_true', help="Run without the preview window")
+    return parser.parse_args()
 
 def main():
     """Main function to run the gesture controller."""
+    args = parse_args()
     try:
-        # You can customize the IP and port here
-        controller = GestureController(ESP32_IP, ESP32_PORT)
+        controller = GestureController(args.ip, args.port, source=args.source, pacing=args.pacing,
+                                       record_path=args.record, show_window=not args.no_window,
+                                       inference_width=args.inference_width, publish_bus=args.publish_bus,
+                                       change_threshold=args.change_threshold,
+                                       max_skipped_frames=args.max_skipped_frames,
+                                       backend=args.backend, model_path=args.model_path,
+                                       max_cadence=args.max_cadence,
+                                       inference_deadline_ms=args.inference_deadline_ms,
+                                       offload=args.offload, operator_hand=args.operator_hand,
+                                       head_pose=args.head_pose, channel_deadline_ms=args.channel_deadline_ms,
+                                       landmark_cache_mb=args.landmark_cache_mb)
         controller.run()
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -0,0 +1,288 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import socket
+import threading
+import time
+
+from core.landmarks import BACKEND_SOLUTIONS, BACKENDS
+from core.offload import DEFAULT_PORT, MESSAGE_FRAME, MESSAGE_RESULT, pack_result, recv_message, send_message
+
+# How often the server prints the per-client table (seconds)
+STATS_INTERVAL = 1.0
+
+# Size of the frame the clients classify commands for (the GestureController layout)
+COMMAND_FRAME_SIZE = (1280, 720)
+
+# Backends that answer every frame; asynchronous ones cannot serve requests one by one
+SYNCHRONOUS_BACKENDS = [name for name, backend in BACKENDS.items() if not backend.asynchronous]
+
+def _inference_worker(params, conn):
+    """Worker process: one landmark backend and operator lock per client, so each keeps its own hand tracking."""
+    import cv2
+    import numpy as np
+    from core.arbitration import HandArbiter
+    from core.landmarks import create_landmark_backend
+    from gesture_control_simple import hand_command
+
+    # Each worker runs one inference at a time; keep OpenCV from starting its own thread pool
+    cv2.setNumThreads(1)
+    backends = {}
+    arbiters = {}
+    try:
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            client_id, sequence, jpeg = request
+            if jpeg is None:
+                # The client disconnected
+                arbiters.pop(client_id, None)
+                backend = backends.pop(client_id, None)
+                if backend is not None:
+                    backend.close()
+                continue
+
+            start = time.monotonic()
+            if client_id not in backends:
+                backends[client_id] = create_landmark_backend(**params)
+                arbiters[client_id] = HandArbiter()
+            # The client encoded its RGB frame as-is, so this decodes back to RGB
+            frame = cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR)
+            result = backends[client_id].process(frame)
+
+            command = "STOP"
+            operator = arbiters[client_id].select(result)
+            if operator is not None:
+                command, _ = hand_command(result.multi_hand_landmarks[operator].landmark, *COMMAND_FRAME_SIZE)
+            conn.send((client_id, sequence, pack_result(result), command, (time.monotonic() - start) * 1000.0))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        for backend in backends.values():
+            backend.close()
+
+class _Client:
+    def __init__(self, client_id, sock, address, worker):
+        self.id = client_id
+        self.sock = sock
+        self.address = address
+        self.worker = worker
+        self.lock = threading.Lock()
+        self.send_lock = threading.Lock()
+        self.pending = None
+        self.in_flight = None
+
+        self.frames_received = 0
+        self.frames_answered = 0
+        self.frames_dropped = 0
+        self.latency_ms = 0.0
+        self.inference_ms = 0.0
+        self.last_answered = 0
+
+    def record(self, latency_ms, inference_ms):
+        gain = 1.0 / 16 if self.frames_answered else 1.0
+        self.latency_ms += (latency_ms - self.latency_ms) * gain
+        self.inference_ms += (inference_ms - self.inference_ms) * gain
+        self.frames_answered += 1
+
+class _Worker:
+    def __init__(self, context, index, params):
+        self.index = index
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_inference_worker, args=(params, child_conn),
+                                       name=f"inference-worker-{index}", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.lock = threading.Lock()
+        self.clients = 0
+
+    def send(self, request):
+        with self.lock:
+            self.conn.send(request)
+
+class InferenceServer:
+    """
+    Run hand inference for thin capture clients over TCP.
+
+    Clients (``GestureController`` with ``--offload``) stream JPEG frames;
+    the server decodes them, runs the landmark model in a pool of worker
+    processes and answers each frame with its landmarks, the classified
+    command and its own processing time. Each client is pinned to the worker
+    with the fewest clients and gets its own model instance there, so
+    MediaPipe's frame-to-frame tracking never mixes streams.
+
+    Every client has at most one frame in the pool. Frames that arrive while
+    it is busy replace each other in a single pending slot, so under
+    backpressure stale frames are dropped per client instead of queueing.
+    Per-client frame rate, drops, latency (frame received to reply sent) and
+    inference time are printed every ``STATS_INTERVAL`` seconds.
+    """
+
+    def __init__(self, host='127.0.0.1', port=DEFAULT_PORT, workers=2, backend=BACKEND_SOLUTIONS,
+                 min_detection_confidence=0.7, min_tracking_confidence=0.7):
+        params = {'backend': backend, 'min_detection_confidence': min_detection_confidence,
+                  'min_tracking_confidence': min_tracking_confidence}
+        # Spawned (not forked) workers so each gets a clean MediaPipe/OpenCV state
+        context = multiprocessing.get_context('spawn')
+        self.workers = [_Worker(context, index, params) for index in range(workers)]
+        self.clients = {}
+        self.clients_lock = threading.Lock()
+        self.running = False
+        self._client_ids = itertools.count(1)
+
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((host, port))
+        self.address = self.listener.getsockname()
+
+    def start(self):
+        """Accept clients and collect worker results on background threads."""
+        self.running = True
+        self.listener.listen()
+        for worker in self.workers:
+            threading.Thread(target=self._result_loop, args=(worker,), daemon=True).start()
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+        print(f"Inference server listening on {self.address[0]}:{self.address[1]} "
+              f"with {len(self.workers)} workers")
+
+    def _accept_loop(self):
+        while self.running:
+            try:
+                sock, address = self.listener.accept()
+            except OSError:
+                break
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self.clients_lock:
+                worker = min(self.workers, key=lambda w: w.clients)
+                worker.clients += 1
+                client = _Client(next(self._client_ids), sock, address, worker)
+                self.clients[client.id] = client
+            print(f"Client {client.id} connected from {address[0]}:{address[1]} (worker {worker.index})")
+            threading.Thread(target=self._client_loop, args=(client,), daemon=True).start()
+
+    def _client_loop(self, client):
+        try:
+            while self.running:
+                kind, sequence, timestamp, jpeg = recv_message(client.sock)
+                if kind != MESSAGE_FRAME:
+                    continue
+                frame = (sequence, timestamp, jpeg, time.monotonic())
+                with client.lock:
+                    client.frames_received += 1
+                    if client.in_flight is None:
+                        self._submit(client, frame)
+                    else:
+                        if client.pending is not None:
+                            client.frames_dropped += 1
+                        client.pending = frame
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._disconnect(client)
+
+    def _submit(self, client, frame):
+        """Send a client's frame to its worker (called with ``client.lock`` held)."""
+        client.in_flight = frame
+        client.worker.send((client.id, frame[0], frame[2]))
+
+    def _result_loop(self, worker):
+        try:
+            while True:
+                client_id, sequence, packed, command, inference_ms = worker.conn.recv()
+                with self.clients_lock:
+                    client = self.clients.get(client_id)
+                if client is None:
+                    continue
+                with client.lock:
+                    frame, client.in_flight = client.in_flight, None
+                    if client.pending is not None:
+                        pending, client.pending = client.pending, None
+                        self._submit(client, pending)
+                if frame is None or frame[0] != sequence:
+                    continue
+                latency_ms = (time.monotonic() - frame[3]) * 1000.0
+                client.record(latency_ms, inference_ms)
+                reply = dict(packed, command=command, server_ms=latency_ms)
+                try:
+                    with client.send_lock:
+                        send_message(client.sock, MESSAGE_RESULT, sequence, frame[1], json.dumps(reply).encode())
+                except OSError:
+                    pass
+        except (EOFError, OSError):
+            if self.running:
+                print(f"Inference worker {worker.index} exited (code {worker.process.exitcode})")
+
+    def _disconnect(self, client):
+        with self.clients_lock:
+            if self.clients.pop(client.id, None) is None:
+                return
+            client.worker.clients -= 1
+        client.sock.close()
+        try:
+            client.worker.send((client.id, None, None))
+        except OSError:
+            pass
+        print(f"Client {client.id} disconnected after {client.frames_answered} frames "
+              f"({client.frames_dropped} stale frames dropped)")
+
+    def print_stats(self, interval):
+        with self.clients_lock:
+            clients = list(self.clients.values())
+        if not clients:
+            return
+        print(f"{'client':<24} {'worker':>6} {'FPS':>6} {'dropped':>8} {'latency':>9} {'inference':>10}")
+        for client in clients:
+            answered = client.frames_answered
+            fps = (answered - client.last_answered) / interval
+            client.last_answered = answered
+            print(f"{client.id:>3} {client.address[0]}:{client.address[1]:<10} {client.worker.index:>6} "
+                  f"{fps:6.1f} {client.frames_dropped:8d} {client.latency_ms:7.1f}ms {client.inference_ms:8.1f}ms")
+
+    def run(self):
+        """Serve until Ctrl+C, printing per-client statistics."""
+        self.start()
+        try:
+            while self.running:
+                time.sleep(STATS_INTERVAL)
+                self.print_stats(STATS_INTERVAL)
+        except KeyboardInterrupt:
+            print("\nInterrupted by user")
+        finally:
+            self.stop()
+
+    def stop(self):
+        self.running = False
+        self.listener.close()
+        with self.clients_lock:
+            clients = list(self.clients.values())
+        for client in clients:
+            client.sock.close()
+        for worker in self.workers:
+            try:
+                worker.send(None)
+            except OSError:
+                pass
+            worker.process.join(timeout=2.0)
+            if worker.process.is_alive():
+                worker.process.kill()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Shared hand inference server for thin capture clients")
+    parser.add_argument('--host', default='127.0.0.1', help="Address to listen on")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="TCP port to listen on")
+    parser.add_argument('--workers', type=int, default=max(1, multiprocessing.cpu_count() - 1),
+                        help="Inference worker processes")
+    parser.add_argument('--backend', choices=SYNCHRONOUS_BACKENDS, default=BACKEND_SOLUTIONS,
+                        help="Landmark backend run by the workers")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    server = InferenceServer(args.host, args.port, args.workers, args.backend)
+    server.run()
+    print("Inference server stopped")
+
+if __name__ == "__main__":
+    main()
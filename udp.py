@@ -1,7 +1,12 @@
+import os
+import sys
 import cv2
 import mediapipe as mp
 import socket
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+from core.features import extract_features, finger_command
+
 # WiFi Configuration
 ESP32_IP = "192.168.137.154"  # Replace with the actual IP address of your ESP32
 ESP32_PORT = 4210  # Port for UDP communication
@@ -14,30 +19,9 @@ mp_hands = mp.solutions.hands
 mp_drawing = mp.solutions.drawing_utils
 hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
 
-def recognize_gesture(landmarks):
-    wrist = landmarks[0]
-    index_tip = landmarks[8]
-    middle_tip = landmarks[12]
-    ring_tip = landmarks[16]
-    pinky_tip = landmarks[20]
-    thumb_tip = landmarks[4]
-
-    # Calculate distance between index and thumb
-    distance = ((landmarks[8].x - landmarks[4].x) ** 2 + (landmarks[8].y - landmarks[4].y) ** 2) ** 0.5
-
-    if distance < 0.1:
-        return "BACKWARD"
-
-    if index_tip.y < middle_tip.y and index_tip.y < ring_tip.y and index_tip.y < pinky_tip.y:
-        if index_tip.x < wrist.x:
-            return "RIGHT"
-        else:
-            return "LEFT"
-
-    if all(finger.y < wrist.y for finger in [index_tip, middle_tip, ring_tip, pinky_tip]):
-        return "FORWARD"
-
-    return "STOP"
+def recognize_gesture(features, hand):
+    # Pinch is BACKWARD, pointing is LEFT/RIGHT, all fingers above the wrist is FORWARD
+    return finger_command(features, hand)
 
 def send_command_to_esp32(command):
     try:
@@ -60,10 +44,11 @@ while cap.isOpened():
     result = hands.process(rgb_frame)
 
     if result.multi_hand_landmarks:
-        for hand_landmarks in result.multi_hand_landmarks:
+        # All hands' landmarks are converted and their features computed in one pass
+        features = extract_features(result.multi_hand_landmarks)
+        for index, hand_landmarks in enumerate(result.multi_hand_landmarks):
             mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
-            landmarks = hand_landmarks.landmark
-            command = recognize_gesture(landmarks)
+            command = recognize_gesture(features, index)
 
             cv2.putText(frame, f"Command: {command}", (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
 
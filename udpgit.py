@@ -10,10 +10,16 @@ Instagram
 https://www.instagram.com/shub_bhatt/
 """
 
+import os
+import sys
 import cv2
 import keyboard  # Library for detecting keyboard events
 import socket
 
+# Make the shared modules in src/ importable
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+from core.mjpeg import MJPEGStreamReader
+
 # Create a UDP socket
 
 
@@ -27,6 +33,8 @@ sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 # sock.bind((udp_host, udp_port))  # Try to bind to the ESP's IP address and port
 # URL for the video stream from the camera (replace with your camera's URL)
 url = 'http://192.168.1.27:8080/video'
+# Decode the stream at 1/1, 1/2, 1/4 or 1/8 scale (smaller is cheaper to decode)
+decode_scale = 1
 
 def on_speed_change(val):
     """Callback function for trackbar change."""
@@ -46,7 +54,9 @@ cv2.createTrackbar('Speed', 'Robot Control', robot_speed, 255, on_speed_change)
 def show_live_camera_feed():
     """Function to display live camera feed and control the robot."""
     global robot_speed  # Declare robot_speed as a global variable
-    cap = cv2.VideoCapture(url)  # Open the camera (use 0 for webcam)
+    # Read the MJPEG stream on a background thread that keeps only the newest
+    # frame, so latency does not build up when this loop falls behind
+    cap = MJPEGStreamReader(url, scale=decode_scale).start()
 
     # Check if the camera is opened successfully
     if not cap.isOpened():
@@ -57,7 +67,7 @@ def show_live_camera_feed():
     robot_command = "s,0"  # Default command: stop the robot
 
     while True:
-        ret, frame = cap.read()  # Read a frame from the camera
+        ret, frame = cap.read(timeout=5.0)  # Read the newest frame from the camera
 
         if not ret:
             print("Error: Failed to capture frame.")